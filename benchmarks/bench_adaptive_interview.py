@@ -0,0 +1,119 @@
+"""Benchmark the rule-based and adaptive interview flows on simulated candidates.
+
+Each candidate has an overall ability and per-skill abilities scattered around
+it. Answers are scored from the item response curve the estimator assumes plus
+evaluator noise, and the real ``decide_next_step`` drives the interview. The
+pass or fail verdict is compared with the candidate's true overall ability.
+
+LLM calls count one topic selection per topic and a question plus an
+evaluation per answer, as in the standard graph mode.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_adaptive_interview
+"""
+
+import random
+
+import numpy as np
+
+from src.llm_interviewer.config.settings import settings
+from src.llm_interviewer.models.interview_state import apply_update
+from src.llm_interviewer.models.pydantic_models import Question, ResponseEvaluation
+from src.llm_interviewer.utils.skill_estimator import (
+    PASS_ABILITY,
+    SKILL_SPREAD,
+    expected_score,
+)
+from src.llm_interviewer.workflows import nodes
+
+CANDIDATES = 2_000
+MAX_TOPICS = 4
+SCORE_NOISE = 0.2
+MODES = [("rules", None), ("adaptive", 0.85), ("adaptive", 0.9), ("adaptive", 0.95)]
+
+
+def _evaluation(score: float) -> ResponseEvaluation:
+    # Roughly how the evaluator LLM marks answers of a given quality
+    return ResponseEvaluation(
+        quality_score=score,
+        demonstrates_knowledge=score > 0.5,
+        areas_of_strength=[],
+        areas_for_improvement=[],
+        should_continue_topic=0.3 <= score <= 0.7,
+        reasoning="",
+    )
+
+
+def _interview(rng: random.Random, ability: float):
+    state = {
+        "taxonomy": {},
+        "messages": [],
+        "topics_covered": [],
+        "questions_asked_current_topic": 0,
+        "total_questions_asked": 0,
+        "topics_completed": 0,
+        "current_evaluation": {},
+        "overall_performance": [],
+        "context_summary": {},
+        "skill_estimates": {},
+        "current_question_difficulty": "",
+    }
+    question = Question(question="Q", topic_focus="", difficulty_level="Intermediate")
+    topics = 0
+    step = "next_topic"
+    while step != "end_interview":
+        if step == "next_topic":
+            topics += 1
+            skill_ability = rng.gauss(ability, SKILL_SPREAD)
+            state.update(
+                current_domain="Domain",
+                current_subdomain="Subdomain",
+                current_skill=f"Skill {topics}",
+            )
+        state = apply_update(state, nodes._apply_question(state, question))
+        score = float(expected_score(skill_ability, 0.0)) + rng.gauss(0, SCORE_NOISE)
+        evaluation = _evaluation(min(max(score, 0.0), 1.0))
+        state = apply_update(state, nodes._apply_evaluation(state, evaluation, "", ""))
+        step = nodes.decide_next_step(state)
+        if step == "next_topic":
+            state = apply_update(state, nodes.move_to_next_topic(state))
+    return state, topics
+
+
+def _verdict(state) -> bool:
+    if settings.next_step_mode == "adaptive":
+        estimate = nodes._overall_estimate(state["skill_estimates"])
+        return estimate["pass_probability"] > 0.5
+    scores = [record["quality_score"] for record in state["overall_performance"]]
+    return sum(scores) / len(scores) >= 0.5
+
+
+def _run(mode: str, target):
+    settings.next_step_mode = mode
+    if target is not None:
+        settings.adaptive_confidence = target
+    rng = random.Random(0)
+    questions, calls, correct = [], [], 0
+    for _ in range(CANDIDATES):
+        ability = rng.gauss(0, 1)
+        state, topics = _interview(rng, ability)
+        questions.append(state["total_questions_asked"])
+        calls.append(topics + 2 * state["total_questions_asked"])
+        correct += _verdict(state) == (ability > PASS_ABILITY)
+    return np.mean(questions), np.mean(calls), correct / CANDIDATES
+
+
+def main():
+    settings.max_topics = MAX_TOPICS
+    settings.adaptive_score_noise = SCORE_NOISE
+    print(f"{CANDIDATES} simulated candidates, up to {MAX_TOPICS + 1} topics")
+    print(f"{'mode':>16} {'questions':>10} {'LLM calls':>10} {'accuracy':>9}")
+    for mode, target in MODES:
+        questions, calls, accuracy = _run(mode, target)
+        label = mode if target is None else f"{mode} {target:.0%}"
+        print(f"{label:>16} {questions:>10.2f} {calls:>10.2f} {accuracy:>9.1%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""Drive many concurrent interviews on a single event loop.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_async_concurrency
+"""
+
+import asyncio
+import os
+import time
+
+# The fake LLMs replace the real clients, which still need a key to be built
+os.environ.setdefault("OPENAI_API_KEY", "benchmark-key-not-used")
+
+from src.llm_interviewer.config.taxonomy import get_default_taxonomy  # noqa: E402
+from src.llm_interviewer.workflows.interview_workflow import (  # noqa: E402
+    InterviewWorkflow,
+)
+
+from .fake_llm import install_fake_llms  # noqa: E402
+
+LATENCY = 0.05  # Seconds per simulated LLM round trip
+CONCURRENCY = [1, 10, 50, 200]
+
+
+async def run_interview(workflow: InterviewWorkflow, thread_id: str) -> int:
+    state, config = await workflow.astart_interview(thread_id)
+    turns = 0
+    while not state.get("interview_complete"):
+        state = await workflow.acontinue_interview("A reasonable answer.", config)
+        turns += 1
+    return turns
+
+
+async def main():
+    install_fake_llms(get_default_taxonomy(), latency=LATENCY)
+    workflow = InterviewWorkflow()
+
+    print(f"Simulated LLM latency: {LATENCY * 1000:.0f} ms per call")
+    print(f"{'interviews':>10} {'wall s':>8} {'turns':>6} {'turns/s':>8}")
+    for concurrency in CONCURRENCY:
+        start = time.perf_counter()
+        turns = await asyncio.gather(
+            *[
+                run_interview(workflow, f"bench-{concurrency}-{i}")
+                for i in range(concurrency)
+            ]
+        )
+        elapsed = time.perf_counter() - start
+        print(
+            f"{concurrency:>10} {elapsed:>8.2f} {sum(turns):>6} "
+            f"{sum(turns) / elapsed:>8.1f}"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
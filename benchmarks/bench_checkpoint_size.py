@@ -0,0 +1,110 @@
+"""Compare checkpoint bytes per turn with the taxonomy inline or by reference.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_checkpoint_size
+"""
+
+import os
+import sqlite3
+import tempfile
+import time
+
+# The fake LLMs replace the real clients, which still need a key to be built
+os.environ.setdefault("OPENAI_API_KEY", "benchmark-key-not-used")
+
+from langchain_core.messages import HumanMessage  # noqa: E402
+
+from src.llm_interviewer.config.settings import settings  # noqa: E402
+from src.llm_interviewer.utils.taxonomy_registry import (  # noqa: E402
+    DEFAULT_TAXONOMY_ID,
+    taxonomy_registry,
+)
+from src.llm_interviewer.workflows.interview_workflow import (  # noqa: E402
+    InterviewWorkflow,
+)
+
+from .fake_llm import install_fake_llms  # noqa: E402
+from .taxonomy_fixtures import make_taxonomy  # noqa: E402
+
+SIZES = [40, 1000, 5000]
+INTERVIEWS = 3
+
+
+class InlineTaxonomyWorkflow(InterviewWorkflow):
+    """Copy the taxonomy into the state, as before it was stored by reference"""
+
+    def __init__(self, taxonomy):
+        self.taxonomy = taxonomy
+        super().__init__()
+
+    def _initial_state(self, taxonomy_id: str = DEFAULT_TAXONOMY_ID):
+        state = super()._initial_state(taxonomy_id)
+        del state["taxonomy_id"], state["taxonomy_version"]
+        return {**state, "taxonomy": self.taxonomy}
+
+    def _answer_update(self, values, user_response):
+        return {"messages": values["messages"] + [HumanMessage(content=user_response)]}
+
+
+class ReferencedTaxonomyWorkflow(InterviewWorkflow):
+    """Refer to the taxonomy through the registry"""
+
+    def __init__(self, taxonomy):
+        self.taxonomy_id = f"bench-{id(taxonomy)}"
+        self.version = taxonomy_registry.register(taxonomy, self.taxonomy_id)
+        super().__init__()
+
+    def _initial_state(self, taxonomy_id: str = DEFAULT_TAXONOMY_ID):
+        state = super()._initial_state(taxonomy_id)
+        return {
+            **state,
+            "taxonomy_id": self.taxonomy_id,
+            "taxonomy_version": self.version,
+        }
+
+
+def run(workflow_cls, taxonomy, directory: str):
+    settings.checkpoint_db_path = os.path.join(
+        directory, f"{workflow_cls.__name__}-{id(taxonomy)}.sqlite"
+    )
+    workflow = workflow_cls(taxonomy)
+
+    turns = 0
+    elapsed = 0.0
+    for i in range(INTERVIEWS):
+        state, config = workflow.start_interview(f"bench-{i}")
+        while not state.get("interview_complete"):
+            start = time.perf_counter()
+            state = workflow.continue_interview("A reasonable answer.", config)
+            elapsed += time.perf_counter() - start
+            turns += 1
+    workflow.app.checkpointer.close()
+
+    with sqlite3.connect(settings.checkpoint_db_path) as conn:
+        (stored,) = conn.execute(
+            "SELECT SUM(LENGTH(checkpoint)) FROM checkpoints"
+        ).fetchone()
+    return stored / turns, elapsed * 1000 / turns
+
+
+def main():
+    settings.checkpointer_backend = "sqlite"
+    print(
+        f"{'skills':>7} {'inline B/turn':>14} {'ref B/turn':>11} {'reduction':>10} "
+        f"{'inline ms/turn':>15} {'ref ms/turn':>12}"
+    )
+    with tempfile.TemporaryDirectory() as directory:
+        for size in SIZES:
+            taxonomy = make_taxonomy(size)
+            install_fake_llms(taxonomy)
+            inline_bytes, inline_ms = run(InlineTaxonomyWorkflow, taxonomy, directory)
+            ref_bytes, ref_ms = run(ReferencedTaxonomyWorkflow, taxonomy, directory)
+            print(
+                f"{size:>7} {inline_bytes:>14.0f} {ref_bytes:>11.0f} "
+                f"{inline_bytes / ref_bytes:>9.1f}x {inline_ms:>15.2f} {ref_ms:>12.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""Measure SQLite checkpoint writes and cold-resume latency.
+
+Interviews are run to their first question against a fresh database, then a new
+workflow (as after a restart) loads each thread's latest checkpoint.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_checkpointer
+"""
+
+import os
+import statistics
+import tempfile
+import time
+
+# The fake LLMs replace the real clients, which still need a key to be built
+os.environ.setdefault("OPENAI_API_KEY", "benchmark-key-not-used")
+
+from src.llm_interviewer.config.settings import settings  # noqa: E402
+from src.llm_interviewer.config.taxonomy import get_default_taxonomy  # noqa: E402
+from src.llm_interviewer.workflows.interview_workflow import (  # noqa: E402
+    InterviewWorkflow,
+)
+
+from .fake_llm import install_fake_llms  # noqa: E402
+
+INTERVIEWS = 200
+
+
+def main():
+    install_fake_llms(get_default_taxonomy())
+    with tempfile.TemporaryDirectory() as directory:
+        settings.checkpointer_backend = "sqlite"
+        settings.checkpoint_db_path = os.path.join(directory, "checkpoints.sqlite")
+
+        workflow = InterviewWorkflow()
+        start = time.perf_counter()
+        configs = [workflow.start_interview(f"bench-{i}")[1] for i in range(INTERVIEWS)]
+        started = time.perf_counter() - start
+        workflow.app.checkpointer.close()
+
+        restarted = InterviewWorkflow()
+        resume_ms = []
+        for config in configs:
+            start = time.perf_counter()
+            restarted.app.get_state(config)
+            resume_ms.append((time.perf_counter() - start) * 1000)
+
+        answer_ms = []
+        for config in configs[:20]:
+            start = time.perf_counter()
+            restarted.continue_interview("A reasonable answer.", config)
+            answer_ms.append((time.perf_counter() - start) * 1000)
+
+        size_kb = os.path.getsize(settings.checkpoint_db_path) / 1024
+        restarted.app.checkpointer.close()
+
+    print(f"Started {INTERVIEWS} interviews in {started:.2f}s")
+    print(f"Database size: {size_kb:.0f} KB")
+    print(
+        f"Cold resume (load state): p50 {statistics.median(resume_ms):.2f} ms, "
+        f"max {max(resume_ms):.2f} ms"
+    )
+    print(
+        f"First answered turn after restart: p50 {statistics.median(answer_ms):.2f} ms"
+    )
+
+
+if __name__ == "__main__":
+    main()
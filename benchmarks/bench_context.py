@@ -0,0 +1,89 @@
+"""Show that prompt context stays bounded as interviews get longer.
+
+The question prompt carries a rolling summary of older answers plus the last
+few verbatim, cut to ``question_context_token_budget``. For comparison, the
+previous context quoted the last six messages whatever their length. Answers
+are long, as from a senior candidate, to show where the old context grew.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_context
+"""
+
+import time
+
+from langchain_core.messages import AIMessage, HumanMessage
+
+from src.llm_interviewer.config.settings import settings
+from src.llm_interviewer.utils.conversation_context import summarize
+from src.llm_interviewer.utils.tokens import estimate_messages_tokens, estimate_tokens
+from src.llm_interviewer.workflows import nodes
+
+TURNS = [5, 50, 500]
+ANSWER_WORDS = [50, 400]
+REPEATS = 100
+
+
+def _state(turns: int, answer_words: int):
+    answer = "The trade-off depends on latency and cost. " * (answer_words // 8)
+    state = {
+        "messages": [],
+        "current_domain": "Domain",
+        "current_subdomain": "Subdomain",
+        "current_skill": "Skill",
+        "questions_asked_current_topic": 1,
+        "overall_performance": [],
+        "context_summary": {},
+    }
+    for i in range(turns):
+        question = f"Question {i}: how would you evaluate this design?"
+        record = {
+            "question": question,
+            "response": answer,
+            "quality_score": 0.6,
+            "areas_of_strength": ["Clear structure"],
+            "areas_for_improvement": ["More depth"],
+            "topic": f"Domain - Subdomain - Skill {i // 3}",
+        }
+        state["messages"] += [AIMessage(content=question), HumanMessage(content=answer)]
+        state["context_summary"] = summarize(
+            state["context_summary"],
+            state["overall_performance"] + [record],
+            settings.context_recent_turns,
+        )
+        state["overall_performance"].append(record)
+    return state
+
+
+def _previous_context_tokens(state) -> int:
+    return sum(
+        estimate_tokens(f"{msg.__class__.__name__}: {msg.content}")
+        for msg in state["messages"][-6:]
+    )
+
+
+def main():
+    print(f"Question context budget: {settings.question_context_token_budget} tokens")
+    print(
+        f"{'turns':>6} {'words':>6} {'previous ctx':>13} {'new ctx':>8} "
+        f"{'prompt tok':>11} {'build us':>9}"
+    )
+    for answer_words in ANSWER_WORDS:
+        for turns in TURNS:
+            state = _state(turns, answer_words)
+            start = time.perf_counter()
+            for _ in range(REPEATS):
+                messages = nodes._build_question_messages(state)
+            build_us = (time.perf_counter() - start) * 1e6 / REPEATS
+            context = nodes._conversation_context(
+                state, settings.question_context_token_budget
+            )
+            print(
+                f"{turns:>6} {answer_words:>6} {_previous_context_tokens(state):>13} "
+                f"{estimate_tokens(context):>8} "
+                f"{estimate_messages_tokens(messages):>11} {build_us:>9.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
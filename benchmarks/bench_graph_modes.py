@@ -0,0 +1,70 @@
+"""Compare turn latency and token usage of the standard and fused graph modes.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_graph_modes
+"""
+
+import os
+import statistics
+import time
+
+# The fake LLMs replace the real clients, which still need a key to be built
+os.environ.setdefault("OPENAI_API_KEY", "benchmark-key-not-used")
+
+from src.llm_interviewer.config.taxonomy import get_default_taxonomy  # noqa: E402
+from src.llm_interviewer.workflows.interview_workflow import (  # noqa: E402
+    InterviewWorkflow,
+)
+
+from .fake_llm import install_fake_llms  # noqa: E402
+
+LATENCY = 0.05  # Seconds per simulated LLM round trip
+INTERVIEWS = 3
+
+
+def run_mode(graph_mode: str):
+    recorder = install_fake_llms(get_default_taxonomy(), latency=LATENCY)
+    workflow = InterviewWorkflow(graph_mode=graph_mode)
+
+    turn_latencies = []
+    turns = 0
+    for i in range(INTERVIEWS):
+        state, config = workflow.start_interview(f"{graph_mode}-{i}")
+        recorder.reset()
+        while not state.get("interview_complete"):
+            start = time.perf_counter()
+            state = workflow.continue_interview("A reasonable answer.", config)
+            turn_latencies.append(time.perf_counter() - start)
+            turns += 1
+
+    # Token and call counts cover the last interview's answered turns
+    totals = recorder.totals()
+    last_turns = turns // INTERVIEWS
+    return {
+        "p50_ms": statistics.median(turn_latencies) * 1000,
+        "mean_ms": statistics.mean(turn_latencies) * 1000,
+        "calls_per_turn": totals["calls"] / last_turns,
+        "prompt_tokens_per_turn": totals["prompt_tokens"] / last_turns,
+        "completion_tokens_per_turn": totals["completion_tokens"] / last_turns,
+    }
+
+
+def main():
+    print(f"Simulated LLM latency: {LATENCY * 1000:.0f} ms per call")
+    print(
+        f"{'mode':>9} {'p50 ms':>8} {'mean ms':>8} {'calls/turn':>11} "
+        f"{'prompt tok/turn':>16} {'completion tok/turn':>20}"
+    )
+    for mode in ("standard", "fused"):
+        result = run_mode(mode)
+        print(
+            f"{mode:>9} {result['p50_ms']:>8.1f} {result['mean_ms']:>8.1f} "
+            f"{result['calls_per_turn']:>11.2f} "
+            f"{result['prompt_tokens_per_turn']:>16.0f} "
+            f"{result['completion_tokens_per_turn']:>20.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""Measure the memory each additional concurrent interview session costs.
+
+Compares a workflow per session, as the Streamlit app used to build, with the
+process-wide ``InterviewWorkflow.shared()``. Each session starts an interview
+and holds it at its first question, like a visitor reading the question.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_sessions
+"""
+
+import gc
+import os
+import time
+import tracemalloc
+
+# The fake LLMs replace the real clients, which still need a key to be built
+os.environ.setdefault("OPENAI_API_KEY", "benchmark-key-not-used")
+
+from src.llm_interviewer.config.taxonomy import get_default_taxonomy  # noqa: E402
+from src.llm_interviewer.workflows.interview_workflow import (  # noqa: E402
+    InterviewWorkflow,
+)
+
+from .fake_llm import install_fake_llms  # noqa: E402
+
+SESSIONS = [1, 10, 50]
+
+
+def run(mode: str, sessions: int):
+    """Start interviews in separate sessions, returning KB and ms per session"""
+    gc.collect()
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    start = time.perf_counter()
+
+    held = []
+    for i in range(sessions):
+        if mode == "per-session":
+            workflow = InterviewWorkflow()
+        else:
+            workflow = InterviewWorkflow.shared()
+        held.append((workflow, workflow.start_interview(f"{mode}-{sessions}-{i}")))
+
+    elapsed = time.perf_counter() - start
+    gc.collect()
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return (after - before) / 1024 / sessions, elapsed * 1000 / sessions
+
+
+def main():
+    install_fake_llms(get_default_taxonomy())
+    # Warm up imports, caches and the shared graph before measuring
+    InterviewWorkflow().start_interview("warm-up")
+    InterviewWorkflow.shared().start_interview("warm-up")
+
+    print(f"{'mode':>12} {'sessions':>8} {'KB/session':>11} {'ms/session':>11}")
+    for mode in ["per-session", "shared"]:
+        for sessions in SESSIONS:
+            kb, ms = run(mode, sessions)
+            print(f"{mode:>12} {sessions:>8} {kb:>11.1f} {ms:>11.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+"""Show that per-step cost stays flat as the conversation grows.
+
+Nodes return only the keys they change and the graph appends list fields with
+reducers, so a node's own work no longer copies the message history. The first
+table times the state-update work of each node on histories of growing length,
+the second the turn latency of one long interview.
+
+The checkpointer saves each list field in full whenever it changes, so the state
+only keeps the latest ``state_message_window`` messages. What growth remains
+comes from ``overall_performance`` and ``topics_covered``, which gain an entry
+per answer and per topic and are saved in full each turn. Over 180 turns the
+p50 per turn rises by roughly half, against about 5x with the whole message
+history.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_state_updates
+"""
+
+import os
+import statistics
+import time
+
+# The fake LLMs replace the real clients, which still need a key to be built
+os.environ.setdefault("OPENAI_API_KEY", "benchmark-key-not-used")
+
+from langchain_core.messages import AIMessage, HumanMessage  # noqa: E402
+
+from src.llm_interviewer.config.settings import settings  # noqa: E402
+from src.llm_interviewer.config.taxonomy import get_default_taxonomy  # noqa: E402
+from src.llm_interviewer.models.pydantic_models import (  # noqa: E402
+    Question,
+    ResponseEvaluation,
+)
+from src.llm_interviewer.workflows import nodes  # noqa: E402
+from src.llm_interviewer.workflows.interview_workflow import (  # noqa: E402
+    InterviewWorkflow,
+)
+
+from .fake_llm import install_fake_llms  # noqa: E402
+
+HISTORY_LENGTHS = [10, 100, 1000, 10000]
+REPEATS = 200
+LONG_INTERVIEW_TOPICS = 60
+TURN_BUCKET = 20
+
+
+def _state(history: int):
+    messages = []
+    for i in range(history // 2):
+        messages += [AIMessage(content=f"Question {i}?"), HumanMessage(content="A")]
+    return {
+        "messages": messages,
+        "current_domain": "Domain",
+        "current_subdomain": "Subdomain",
+        "current_skill": "Skill",
+        "topics_covered": [{"domain": "D", "subdomain": "S", "skill": "K"}] * history,
+        "questions_asked_current_topic": 1,
+        "total_questions_asked": history // 2,
+        "topics_completed": 0,
+        "overall_performance": [],
+    }
+
+
+def _time_us(func) -> float:
+    start = time.perf_counter()
+    for _ in range(REPEATS):
+        func()
+    return (time.perf_counter() - start) * 1e6 / REPEATS
+
+
+def node_updates():
+    question = Question(
+        question="Why?", topic_focus="Skill", difficulty_level="Intermediate"
+    )
+    evaluation = ResponseEvaluation(
+        quality_score=0.5,
+        demonstrates_knowledge=True,
+        areas_of_strength=[],
+        areas_for_improvement=[],
+        should_continue_topic=True,
+        reasoning="",
+    )
+
+    print(
+        f"{'history':>8} {'question us':>12} {'evaluation us':>14} "
+        f"{'next topic us':>14}"
+    )
+    for history in HISTORY_LENGTHS:
+        state = _state(history)
+        question_us = _time_us(lambda: nodes._apply_question(state, question))
+        evaluation_us = _time_us(
+            lambda: nodes._apply_evaluation(
+                state, evaluation, nodes._latest_question(state), "A"
+            )
+        )
+        next_topic_us = _time_us(lambda: nodes.move_to_next_topic(state))
+        print(
+            f"{history:>8} {question_us:>12.2f} {evaluation_us:>14.2f} "
+            f"{next_topic_us:>14.2f}"
+        )
+
+
+def long_interview():
+    settings.max_topics = LONG_INTERVIEW_TOPICS
+    install_fake_llms(get_default_taxonomy())
+    workflow = InterviewWorkflow()
+
+    state, config = workflow.start_interview("long-interview")
+    latencies, sizes = [], []
+    while not state.get("interview_complete"):
+        start = time.perf_counter()
+        state = workflow.continue_interview("A reasonable answer.", config)
+        latencies.append((time.perf_counter() - start) * 1000)
+        sizes.append((len(state["messages"]), len(state["overall_performance"])))
+
+    print(f"\n{'turns':>9} {'messages':>9} {'answers':>8} {'p50 ms/turn':>12}")
+    for first in range(0, len(latencies), TURN_BUCKET):
+        bucket = latencies[first : first + TURN_BUCKET]
+        last = first + len(bucket)
+        messages, answers = sizes[last - 1]
+        print(
+            f"{first + 1:>4}-{last:<4} {messages:>9} {answers:>8} "
+            f"{statistics.median(bucket):>12.2f}"
+        )
+    print(
+        f"Messages are capped at {settings.state_message_window}; the answers "
+        "and topics covered still grow by one entry each"
+    )
+
+
+def main():
+    node_updates()
+    long_interview()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,248 @@
+"""Measure framework overhead of full interviews and compare with a baseline.
+
+Interviews run against the fake chat model with no latency, so every
+millisecond measured is spent in the graph, the nodes, LangChain and the
+checkpointer. Each case sets the interview length (topics) and taxonomy size
+(skills) and reports:
+
+- turn latency: p50 and p95 of ``continue_interview``, one graph step
+- node time: mean ms per call of each node, fake model calls included
+- checkpoint size: mean and final serialized bytes of the thread's checkpoint
+- peak memory: tracemalloc peak over one interview, in a separate run
+
+Results are compared with ``benchmarks/baseline.json``; the run exits with
+status 1 if a metric regresses beyond its tolerance. Timings vary between
+machines, so record a baseline on the machine that runs the comparison.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_suite                  # compare with baseline
+    python -m benchmarks.bench_suite --save-baseline  # record a new baseline
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+from collections import defaultdict
+from typing import Any, Dict, List
+
+# The fake LLMs replace the real clients, which still need a key to be built
+os.environ.setdefault("OPENAI_API_KEY", "benchmark-key-not-used")
+
+from langchain_core.callbacks import BaseCallbackHandler  # noqa: E402
+
+from src.llm_interviewer.config.settings import settings  # noqa: E402
+from src.llm_interviewer.utils.taxonomy_registry import (  # noqa: E402
+    DEFAULT_TAXONOMY_ID,
+    taxonomy_registry,
+)
+from src.llm_interviewer.workflows.interview_workflow import (  # noqa: E402
+    InterviewWorkflow,
+)
+
+from .fake_llm import install_fake_llms  # noqa: E402
+from .taxonomy_fixtures import make_taxonomy  # noqa: E402
+
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), "baseline.json")
+TOPICS = [2, 8, 32]
+SKILLS = [40, 1000, 5000]
+TIMED_INTERVIEWS = 3
+ANSWER = "A reasonable answer that covers the main idea and one trade-off."
+
+# Allowed relative increase before a metric counts as a regression. Timings
+# are noisy; sizes and counts are deterministic
+TOLERANCES = {
+    "turn_p50_ms": 0.5,
+    "turn_p95_ms": 0.75,
+    "checkpoint_mean_bytes": 0.05,
+    "checkpoint_final_bytes": 0.05,
+    "peak_memory_kb": 0.25,
+    "llm_calls": 0.0,
+}
+NODE_TOLERANCE = 1.0
+
+
+class NodeTimer(BaseCallbackHandler):
+    """Time each graph node from the run callbacks LangGraph emits"""
+
+    run_inline = True
+
+    def __init__(self):
+        self.started: Dict[Any, Any] = {}
+        self.nodes = set()
+        self.durations: Dict[str, List[float]] = defaultdict(list)
+
+    def on_chain_start(
+        self, serialized, inputs, *, run_id, parent_run_id=None, metadata=None, **kwargs
+    ):
+        node = (metadata or {}).get("langgraph_node")
+        # Nested runs inherit the node's metadata; time only the outermost
+        if node and not node.startswith("__"):
+            if parent_run_id not in self.nodes:
+                self.started[run_id] = (node, time.perf_counter())
+            self.nodes.add(run_id)
+
+    def on_chain_end(self, outputs, *, run_id, **kwargs):
+        self.nodes.discard(run_id)
+        if run_id in self.started:
+            node, start = self.started.pop(run_id)
+            self.durations[node].append((time.perf_counter() - start) * 1000)
+
+    def on_chain_error(self, error, *, run_id, **kwargs):
+        self.nodes.discard(run_id)
+        self.started.pop(run_id, None)
+
+
+class SuiteWorkflow(InterviewWorkflow):
+    """Interview over a benchmark taxonomy registered by reference"""
+
+    def __init__(self, taxonomy_id: str, version: str):
+        self.taxonomy_id = taxonomy_id
+        self.version = version
+        super().__init__()
+
+    def _initial_state(self, taxonomy_id: str = DEFAULT_TAXONOMY_ID):
+        return {
+            **super()._initial_state(taxonomy_id),
+            "taxonomy_id": self.taxonomy_id,
+            "taxonomy_version": self.version,
+        }
+
+
+def _checkpoint_bytes(workflow: InterviewWorkflow, config) -> int:
+    checkpointer = workflow.app.checkpointer
+    checkpoint = checkpointer.get_tuple(config).checkpoint
+    return len(checkpointer.serde.dumps_typed(checkpoint)[1])
+
+
+def _interview(workflow: InterviewWorkflow, thread_id: str, timer=None):
+    """Run one interview, returning turn latencies and checkpoint sizes"""
+    state, config = workflow.start_interview(thread_id)
+    if timer is not None:
+        config = {**config, "callbacks": [timer]}
+
+    latencies, sizes = [], []
+    while not state.get("interview_complete"):
+        start = time.perf_counter()
+        state = workflow.continue_interview(ANSWER, config)
+        latencies.append((time.perf_counter() - start) * 1000)
+        sizes.append(_checkpoint_bytes(workflow, config))
+    return latencies, sizes
+
+
+def run_case(topics: int, skills: int) -> Dict[str, Any]:
+    settings.max_topics = topics
+    taxonomy = make_taxonomy(skills)
+    taxonomy_id = f"suite-{skills}"
+    version = taxonomy_registry.register(taxonomy, taxonomy_id)
+    recorder = install_fake_llms(taxonomy)
+    workflow = SuiteWorkflow(taxonomy_id, version)
+
+    # Warm up imports, caches and the graph before measuring
+    _interview(workflow, "warm-up")
+    recorder.reset()
+
+    timer = NodeTimer()
+    latencies = []
+    for i in range(TIMED_INTERVIEWS):
+        interview_latencies, sizes = _interview(workflow, f"timed-{i}", timer)
+        latencies += interview_latencies
+    llm_calls = recorder.totals()["calls"] // TIMED_INTERVIEWS
+
+    tracemalloc.start()
+    _interview(workflow, "memory")
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    quantiles = statistics.quantiles(latencies, n=20)
+    return {
+        "turns": len(sizes),
+        "turn_p50_ms": round(statistics.median(latencies), 3),
+        "turn_p95_ms": round(quantiles[-1], 3),
+        "node_ms": {
+            node: round(statistics.mean(durations), 3)
+            for node, durations in sorted(timer.durations.items())
+        },
+        "checkpoint_mean_bytes": round(statistics.mean(sizes)),
+        "checkpoint_final_bytes": sizes[-1],
+        "peak_memory_kb": round(peak / 1024),
+        "llm_calls": llm_calls,
+    }
+
+
+def _regressions(name: str, result, baseline) -> List[str]:
+    found = []
+    checks = [(metric, result[metric], baseline.get(metric)) for metric in TOLERANCES]
+    checks += [
+        (f"node_ms.{node}", value, baseline.get("node_ms", {}).get(node))
+        for node, value in result["node_ms"].items()
+    ]
+    for metric, value, previous in checks:
+        if previous is None:
+            continue
+        tolerance = TOLERANCES.get(metric, NODE_TOLERANCE)
+        if value > previous * (1 + tolerance):
+            found.append(f"{name} {metric}: {previous} -> {value}")
+    return found
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    args = parser.parse_args(argv)
+
+    baseline = {}
+    if not args.save_baseline and os.path.exists(args.baseline):
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+
+    print(
+        f"{'topics':>6} {'skills':>6} {'turns':>5} {'p50 ms':>7} {'p95 ms':>7} "
+        f"{'ckpt B':>8} {'final B':>8} {'peak KB':>8} {'vs baseline':>12}"
+    )
+    results, regressions = {}, []
+    for topics in TOPICS:
+        for skills in SKILLS:
+            name = f"topics={topics},skills={skills}"
+            result = results[name] = run_case(topics, skills)
+            previous = baseline.get(name)
+            if previous:
+                regressions += _regressions(name, result, previous)
+                change = f"{result['turn_p50_ms'] / previous['turn_p50_ms']:.2f}x"
+            else:
+                change = "-"
+            print(
+                f"{topics:>6} {skills:>6} {result['turns']:>5} "
+                f"{result['turn_p50_ms']:>7.2f} {result['turn_p95_ms']:>7.2f} "
+                f"{result['checkpoint_mean_bytes']:>8} "
+                f"{result['checkpoint_final_bytes']:>8} "
+                f"{result['peak_memory_kb']:>8} {change:>12}"
+            )
+
+    print("\nMean ms per node call:")
+    for name, result in results.items():
+        nodes = ", ".join(f"{node} {ms:.2f}" for node, ms in result["node_ms"].items())
+        print(f"  {name}: {nodes}")
+
+    if args.save_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+            f.write("\n")
+        print(f"\nSaved baseline to {args.baseline}")
+    elif not baseline:
+        print("\nNo baseline found; run with --save-baseline to record one")
+    elif regressions:
+        print("\nRegressions against the baseline:")
+        print("\n".join(f"  {regression}" for regression in regressions))
+        sys.exit(1)
+    else:
+        print("\nNo regressions against the baseline")
+
+
+if __name__ == "__main__":
+    main()
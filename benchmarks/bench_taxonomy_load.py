@@ -0,0 +1,71 @@
+"""Benchmark taxonomy load time from JSON against the compiled snapshot.
+
+``json`` is a full parse plus validation, as every load did before snapshots.
+``snapshot`` is the usual path while the file is unchanged: a stat and a read
+of the snapshot. ``touched`` is a file with a new mtime but the same content,
+which hashes the source before trusting the snapshot.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_taxonomy_load
+"""
+
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+
+from src.llm_interviewer.config.taxonomy import load_taxonomy
+from src.llm_interviewer.config.taxonomy_snapshot import snapshot_path
+
+from .taxonomy_fixtures import make_taxonomy
+
+SKILL_COUNTS = [100, 1_000, 10_000, 50_000]
+REPEATS = 5
+
+
+def _best_ms(load) -> float:
+    best = float("inf")
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        load()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def _touch(path: Path):
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+
+
+def main():
+    print(
+        f"{'skills':>7} {'JSON MB':>8} {'snap MB':>8} {'json ms':>8} "
+        f"{'snapshot ms':>12} {'touched ms':>11}"
+    )
+    with tempfile.TemporaryDirectory() as tmp:
+        for num_skills in SKILL_COUNTS:
+            path = Path(tmp) / f"taxonomy_{num_skills}.json"
+            path.write_text(json.dumps(make_taxonomy(num_skills), indent=2))
+
+            json_ms = _best_ms(
+                lambda: load_taxonomy(path, validate=True, use_snapshot=False)
+            )
+            load_taxonomy(path)
+            snapshot_ms = _best_ms(lambda: load_taxonomy(path))
+
+            def load_touched():
+                _touch(path)
+                load_taxonomy(path)
+
+            touched_ms = _best_ms(load_touched)
+            print(
+                f"{num_skills:>7} {path.stat().st_size / 1e6:>8.2f} "
+                f"{snapshot_path(path).stat().st_size / 1e6:>8.2f} {json_ms:>8.2f} "
+                f"{snapshot_ms:>12.2f} {touched_ms:>11.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
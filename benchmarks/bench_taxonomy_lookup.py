@@ -0,0 +1,91 @@
+"""Benchmark compiled taxonomy lookups and memory against the nested dicts.
+
+Each taxonomy is loaded from JSON, as from disk. Memory is what stays allocated
+once the loaded dicts are dropped, and for the compiled form includes the
+strings it keeps. Lookups resolve topics as an LLM might return them: exact
+paths, and near misses differing in case. The linear scan is how a topic was
+found before, by walking every domain, subdomain and skill.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_taxonomy_lookup
+"""
+
+import gc
+import json
+import random
+import time
+import tracemalloc
+
+from src.llm_interviewer.utils.compiled_taxonomy import CompiledTaxonomy, normalize_name
+
+from .taxonomy_fixtures import make_taxonomy
+
+SKILL_COUNTS = [1_000, 10_000, 50_000]
+LOOKUPS = 2_000
+
+
+def _retained_kb(build, payload: str):
+    """KB still allocated by what ``build`` returns, after the JSON is dropped"""
+    gc.collect()
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    result = build(json.loads(payload))
+    gc.collect()
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, (after - before) / 1024
+
+
+def _linear_find(taxonomy, domain: str, subdomain: str, skill: str):
+    keys = normalize_name(domain), normalize_name(subdomain), normalize_name(skill)
+    for domain_data in taxonomy["domains"]:
+        for subdomain_data in domain_data.get("subdomains", []):
+            for skill_data in subdomain_data.get("core_skills", []):
+                path = domain_data["name"], subdomain_data["name"], skill_data["name"]
+                if tuple(normalize_name(name) for name in path) == keys:
+                    return skill_data
+    return None
+
+
+def _per_lookup_us(find, paths) -> float:
+    start = time.perf_counter()
+    for path in paths:
+        assert find(*path) is not None
+    return (time.perf_counter() - start) * 1e6 / len(paths)
+
+
+def main():
+    rng = random.Random(0)
+    print(
+        f"{'skills':>7} {'dict KB':>9} {'compiled KB':>12} {'compile ms':>11} "
+        f"{'exact us':>9} {'snap us':>8} {'linear us':>10}"
+    )
+    for num_skills in SKILL_COUNTS:
+        payload = json.dumps(make_taxonomy(num_skills))
+        taxonomy, dict_kb = _retained_kb(lambda data: data, payload)
+
+        start = time.perf_counter()
+        CompiledTaxonomy(taxonomy)
+        compile_ms = (time.perf_counter() - start) * 1000
+        compiled, compiled_kb = _retained_kb(CompiledTaxonomy, payload)
+
+        paths = [skill.path for skill in compiled.iter_skills()]
+        exact = rng.sample(paths, min(LOOKUPS, len(paths)))
+        near_misses = [tuple(name.lower() for name in path) for path in exact]
+        # The linear scan is slow enough that a sample of the lookups is plenty
+        linear_sample = near_misses[: LOOKUPS // 20]
+
+        exact_us = _per_lookup_us(compiled.skill, exact)
+        snap_us = _per_lookup_us(compiled.snap, near_misses)
+        linear_us = _per_lookup_us(
+            lambda *path: _linear_find(taxonomy, *path), linear_sample
+        )
+        print(
+            f"{len(compiled):>7} {dict_kb:>9.0f} {compiled_kb:>12.0f} "
+            f"{compile_ms:>11.1f} {exact_us:>9.2f} {snap_us:>8.2f} {linear_us:>10.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""Benchmark taxonomy prompt size and render latency against taxonomy size.
+
+Every render uses the configured token budget. Cold timings clear the render
+cache first; the half-covered render is timed cold because each new set of
+covered topics misses the cache in a real interview.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_taxonomy_prompt
+"""
+
+import json
+import time
+
+from src.llm_interviewer.config.settings import settings
+from src.llm_interviewer.utils.taxonomy_prompt import (
+    clear_taxonomy_prompt_cache,
+    render_taxonomy_for_prompt,
+    taxonomy_version,
+)
+from src.llm_interviewer.utils.tokens import estimate_tokens
+
+from .taxonomy_fixtures import make_taxonomy
+
+SIZES = [40, 200, 1000, 5000]
+REPEATS = 50
+
+
+def _time_ms(func, repeats: int = REPEATS) -> float:
+    start = time.perf_counter()
+    for _ in range(repeats):
+        func()
+    return (time.perf_counter() - start) * 1000 / repeats
+
+
+def main():
+    budget = settings.taxonomy_prompt_token_budget
+    print(f"Token budget: {budget}")
+    print(
+        f"{'skills':>7} {'json tok':>9} {'json ms':>8} {'compact tok':>12} "
+        f"{'cold ms':>8} {'warm ms':>8} {'half covered tok':>17} {'half cold ms':>13}"
+    )
+
+    for size in SIZES:
+        taxonomy = make_taxonomy(size)
+        skills = [
+            {"domain": d["name"], "subdomain": s["name"], "skill": k["name"]}
+            for d in taxonomy["domains"]
+            for s in d["subdomains"]
+            for k in s["core_skills"]
+        ]
+        half_covered = skills[: len(skills) // 2]
+
+        json_str = json.dumps(taxonomy, indent=2)
+        json_ms = _time_ms(lambda: json.dumps(taxonomy, indent=2))
+
+        def cold():
+            clear_taxonomy_prompt_cache()
+            return render_taxonomy_for_prompt(taxonomy, token_budget=budget)
+
+        cold_ms = _time_ms(cold, repeats=5)
+        version = taxonomy_version(taxonomy)
+        compact = render_taxonomy_for_prompt(
+            taxonomy, token_budget=budget, version=version
+        )
+        warm_ms = _time_ms(
+            lambda: render_taxonomy_for_prompt(
+                taxonomy, token_budget=budget, version=version
+            )
+        )
+
+        def half_cold():
+            clear_taxonomy_prompt_cache()
+            return render_taxonomy_for_prompt(
+                taxonomy, half_covered, token_budget=budget, version=version
+            )
+
+        half_cold_ms = _time_ms(half_cold, repeats=5)
+        pruned = half_cold()
+
+        print(
+            f"{len(skills):>7} {estimate_tokens(json_str):>9} {json_ms:>8.2f} "
+            f"{estimate_tokens(compact):>12} {cold_ms:>8.2f} {warm_ms:>8.3f} "
+            f"{estimate_tokens(pruned):>17} {half_cold_ms:>13.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
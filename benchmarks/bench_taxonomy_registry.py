@@ -0,0 +1,92 @@
+"""Benchmark serving many role taxonomies from one worker under a memory cap.
+
+Interviews pick a role with Zipf-like popularity, as a few roles get most of
+the traffic, and each interview start resolves and compiles the role's
+taxonomy. Compares preloading every role with lazy loading under caps that
+hold a shrinking share of the roles.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_taxonomy_registry
+"""
+
+import json
+import random
+import tempfile
+import time
+from pathlib import Path
+
+from src.llm_interviewer.utils.taxonomy_registry import TaxonomyRegistry
+
+from .taxonomy_fixtures import make_taxonomy
+
+ROLES = 60
+SKILLS_PER_ROLE = 1_000
+INTERVIEWS = 3_000
+CAP_SHARES = [None, 0.5, 0.2, 0.05]
+
+
+def _write_roles(directory: Path):
+    for role in range(ROLES):
+        taxonomy = make_taxonomy(SKILLS_PER_ROLE)
+        taxonomy["domains"][0]["name"] = f"Role {role} domain"
+        (directory / f"role_{role}.json").write_text(json.dumps(taxonomy))
+
+
+def _interviews():
+    rng = random.Random(0)
+    weights = [1 / (rank + 1) for rank in range(ROLES)]
+    return rng.choices([f"role_{role}" for role in range(ROLES)], weights, k=INTERVIEWS)
+
+
+def _run(directory: Path, max_bytes, preload: bool):
+    registry = TaxonomyRegistry(max_bytes=max_bytes)
+    registry.add_source_dir(directory)
+    start = time.perf_counter()
+    if preload:
+        for role in range(ROLES):
+            registry.compiled(f"role_{role}")
+    preload_s = time.perf_counter() - start
+
+    latencies = []
+    for role in _interviews():
+        start = time.perf_counter()
+        registry.compiled(role, registry.latest_version(role))
+        latencies.append(time.perf_counter() - start)
+    latencies.sort()
+    return registry.stats(), preload_s, latencies
+
+
+def main():
+    with tempfile.TemporaryDirectory() as tmp:
+        directory = Path(tmp)
+        _write_roles(directory)
+        # Warm the snapshots, as a deployed worker would find them
+        _run(directory, None, preload=True)
+        full_stats, _, _ = _run(directory, None, preload=True)
+        full_bytes = full_stats["bytes"]
+
+        print(f"{ROLES} roles of {SKILLS_PER_ROLE} skills, {INTERVIEWS} interviews")
+        print(
+            f"{'mode':>12} {'cap MB':>7} {'MB':>6} {'startup s':>10} "
+            f"{'hit rate':>9} {'loads':>6} {'load ms':>8} {'p50 us':>7} "
+            f"{'p99 ms':>7}"
+        )
+        for share in CAP_SHARES:
+            max_bytes = None if share is None else int(full_bytes * share)
+            stats, preload_s, latencies = _run(
+                directory, max_bytes, preload=share is None
+            )
+            mode = "preload" if share is None else f"lazy {share:.0%}"
+            cap = "-" if max_bytes is None else f"{max_bytes / 1e6:.1f}"
+            load_ms = stats["load_seconds"] * 1000 / max(stats["loads"], 1)
+            print(
+                f"{mode:>12} {cap:>7} {stats['bytes'] / 1e6:>6.1f} {preload_s:>10.2f} "
+                f"{stats['hit_rate']:>9.2%} {stats['loads']:>6} {load_ms:>8.1f} "
+                f"{latencies[len(latencies) // 2] * 1e6:>7.1f} "
+                f"{latencies[int(len(latencies) * 0.99)] * 1000:>7.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,211 @@
+"""Deterministic stand-ins for the interview LLMs.
+
+The fake chat model answers from the prompt alone, so a whole interview can be
+driven without network access. Each call sleeps for a configurable latency to
+mimic a provider round trip, and token usage is estimated from the prompt and
+output.
+"""
+
+import asyncio
+import json
+import re
+import time
+from collections import defaultdict
+from typing import Any, Dict, List, Optional, Tuple
+
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import AIMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+from langchain_core.utils.function_calling import convert_to_openai_tool
+from pydantic import ConfigDict
+
+from src.llm_interviewer.config.settings import settings
+from src.llm_interviewer.models.pydantic_models import (
+    Question,
+    ResponseEvaluation,
+    TopicSelection,
+    TurnPlan,
+)
+from src.llm_interviewer.utils.tokens import estimate_messages_tokens, estimate_tokens
+
+
+class CallRecorder:
+    """Count calls and estimated tokens per structured output schema"""
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.calls: Dict[str, int] = defaultdict(int)
+        self.prompt_tokens: Dict[str, int] = defaultdict(int)
+        self.completion_tokens: Dict[str, int] = defaultdict(int)
+
+    def record(self, schema: str, messages: List[Any], output: Any):
+        self.calls[schema] += 1
+        self.prompt_tokens[schema] += estimate_messages_tokens(messages)
+        self.completion_tokens[schema] += estimate_tokens(output.model_dump_json())
+
+    def totals(self) -> Dict[str, int]:
+        return {
+            "calls": sum(self.calls.values()),
+            "prompt_tokens": sum(self.prompt_tokens.values()),
+            "completion_tokens": sum(self.completion_tokens.values()),
+        }
+
+
+def _skills(taxonomy: Dict[str, Any]) -> List[Tuple[str, str, str]]:
+    return [
+        (domain["name"], subdomain["name"], skill["name"])
+        for domain in taxonomy["domains"]
+        for subdomain in domain.get("subdomains", [])
+        for skill in subdomain.get("core_skills", [])
+    ]
+
+
+def _field(prompt: str, label: str) -> Optional[str]:
+    match = re.search(rf"- {label}: (.*)", prompt)
+    return match.group(1).strip() if match else None
+
+
+class FakeResponder:
+    """Produce deterministic structured outputs from interview prompts"""
+
+    def __init__(self, taxonomy: Dict[str, Any], quality_score: float = 0.5):
+        self.skills = _skills(taxonomy)
+        self.quality_score = quality_score
+
+    def _nth_skill(self, n: int) -> Tuple[str, str, str]:
+        return self.skills[n % len(self.skills)]
+
+    def topic_selection(self, prompt: str) -> TopicSelection:
+        match = re.search(r"Topics Completed: (\d+)", prompt)
+        domain, subdomain, skill = self._nth_skill(int(match.group(1)) if match else 0)
+        return TopicSelection(
+            selected_topic=domain,
+            selected_subdomain=subdomain,
+            selected_skill=skill,
+            reasoning="Next uncovered skill in taxonomy order",
+        )
+
+    def question(self, prompt: str) -> Question:
+        skill = _field(prompt, "Skill") or "the topic"
+        asked = re.search(r"Questions asked on this topic: (\d+)", prompt)
+        number = int(asked.group(1)) + 1 if asked else 1
+        return Question(
+            question=f"Question {number}: explain a key idea behind {skill}.",
+            topic_focus=skill,
+            difficulty_level="Intermediate",
+        )
+
+    def evaluation(self, prompt: str) -> ResponseEvaluation:
+        return ResponseEvaluation(
+            quality_score=self.quality_score,
+            demonstrates_knowledge=self.quality_score > 0.5,
+            areas_of_strength=["Clear structure"],
+            areas_for_improvement=["More depth"],
+            should_continue_topic=True,
+            reasoning="Deterministic fake evaluation",
+        )
+
+    def turn_plan(self, prompt: str) -> TurnPlan:
+        evaluation = self.evaluation(prompt)
+        asked = re.search(r"; (\d+) asked on the current topic so far", prompt)
+        covered = re.search(r"Topics Already Covered:\s*(\[.*\])", prompt)
+        completed = len(json.loads(covered.group(1))) if covered else 0
+
+        if asked and int(asked.group(1)) < settings.max_questions_per_topic:
+            topic = (_field(prompt, "Domain"), _field(prompt, "Subdomain"))
+            topic += (_field(prompt, "Skill"),)
+        else:
+            topic = self._nth_skill(completed + 1)
+
+        selection = TopicSelection(
+            selected_topic=topic[0],
+            selected_subdomain=topic[1],
+            selected_skill=topic[2],
+            reasoning="Planned with the evaluation",
+        )
+        question = self.question(f"- Skill: {topic[2]}")
+        return TurnPlan(
+            evaluation=evaluation, next_topic=selection, next_question=question
+        )
+
+
+class FakeChatModel(BaseChatModel):
+    """Chat model answering interview prompts with tool calls, as providers do.
+
+    ``with_structured_output`` works as on the real clients: it binds the schema
+    as a tool and parses the tool call, so the LangChain overhead of the nodes'
+    LLM calls is measured too.
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    responder: FakeResponder
+    recorder: CallRecorder
+    latency: float = 0.0
+
+    @property
+    def _llm_type(self) -> str:
+        return "fake-interview"
+
+    def bind_tools(self, tools, *, tool_choice=None, **kwargs):
+        return self.bind(tools=[convert_to_openai_tool(t) for t in tools], **kwargs)
+
+    def _respond(self, messages, tools) -> ChatResult:
+        schema = tools[0]["function"]["name"]
+        answer = {
+            "TopicSelection": self.responder.topic_selection,
+            "Question": self.responder.question,
+            "ResponseEvaluation": self.responder.evaluation,
+            "TurnPlan": self.responder.turn_plan,
+        }[schema]
+        output = answer("\n".join(str(msg.content) for msg in messages))
+        self.recorder.record(schema, messages, output)
+
+        tool_call = {"name": schema, "args": output.model_dump(), "id": "call_0"}
+        prompt_tokens = estimate_messages_tokens(messages)
+        completion_tokens = estimate_tokens(output.model_dump_json())
+        message = AIMessage(
+            content="",
+            tool_calls=[tool_call],
+            usage_metadata={
+                "input_tokens": prompt_tokens,
+                "output_tokens": completion_tokens,
+                "total_tokens": prompt_tokens + completion_tokens,
+            },
+        )
+        # Provider clients always report llm_output; cached results have none
+        return ChatResult(
+            generations=[ChatGeneration(message=message)],
+            llm_output={"model_name": self._llm_type},
+        )
+
+    def _generate(self, messages, stop=None, run_manager=None, tools=(), **kwargs):
+        time.sleep(self.latency)
+        return self._respond(messages, tools)
+
+    async def _agenerate(
+        self, messages, stop=None, run_manager=None, tools=(), **kwargs
+    ):
+        await asyncio.sleep(self.latency)
+        return self._respond(messages, tools)
+
+
+def install_fake_llms(
+    taxonomy: Dict[str, Any], latency: float = 0.0, quality_score: float = 0.5
+) -> CallRecorder:
+    """Replace the LLMs used by the interview nodes with fakes"""
+    from src.llm_interviewer.workflows import nodes
+
+    recorder = CallRecorder()
+    model = FakeChatModel(
+        responder=FakeResponder(taxonomy, quality_score),
+        recorder=recorder,
+        latency=latency,
+        # Measure every call, whatever LLM cache the settings enable
+        cache=False,
+    )
+    for task, (_, _, schema) in nodes.LLM_SPECS.items():
+        nodes.set_llm(task, model.with_structured_output(schema))
+    return recorder
@@ -0,0 +1,38 @@
+"""Synthetic taxonomies for benchmarks."""
+
+from typing import Any, Dict
+
+
+def make_taxonomy(
+    num_skills: int, domains: int = 8, subdomains_per_domain: int = 5
+) -> Dict[str, Any]:
+    """Build a taxonomy with roughly ``num_skills`` skills spread evenly"""
+    buckets = domains * subdomains_per_domain
+    skills_per_subdomain = max(1, num_skills // buckets)
+
+    return {
+        "domains": [
+            {
+                "name": f"Domain {d}",
+                "subdomains": [
+                    {
+                        "name": f"Subdomain {d}.{s}",
+                        "core_skills": [
+                            {
+                                "name": f"Skill {d}.{s}.{k}",
+                                "knowledge_areas": [
+                                    f"Knowledge area {d}.{s}.{k}.{i}" for i in range(3)
+                                ],
+                                "practical_applications": [
+                                    f"Application {d}.{s}.{k}.{i}" for i in range(2)
+                                ],
+                            }
+                            for k in range(skills_per_subdomain)
+                        ],
+                    }
+                    for s in range(subdomains_per_domain)
+                ],
+            }
+            for d in range(domains)
+        ]
+    }
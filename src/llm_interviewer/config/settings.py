@@ -1,5 +1,5 @@
 import os
-from typing import Optional
+from typing import Dict, Optional, Tuple
 
 from pydantic_settings import BaseSettings
 
@@ -18,6 +18,31 @@ class Settings(BaseSettings):
     # Interview settings
     max_topics: int = 2
     max_questions_per_topic: int = 3
+    topic_selection_mode: str = "llm"  # One of: llm, local
+    # Local scheduler priorities: uncovered skills, rarely covered domains, and
+    # skills with borderline scores; see utils/topic_scheduler.py
+    scheduler_uncovered_weight: float = 1.0
+    scheduler_domain_balance_weight: float = 0.5
+    scheduler_borderline_weight: float = 0.4
+    graph_mode: str = "standard"  # One of: standard, fused
+    question_source: str = "live"  # One of: live, bank
+    question_bank_path: str = "data/question_bank.sqlite"  # Used by the bank source
+    next_step_mode: str = "rules"  # One of: rules, adaptive
+    adaptive_confidence: float = (
+        0.95  # Verdict confidence that ends a topic or interview
+    )
+    adaptive_min_topics: int = 2  # Topics covered before an adaptive interview can end
+    adaptive_score_noise: float = 0.2  # Spread of quality scores around the expected
+
+    # Per-interview budget; a cap left at None is not enforced
+    interview_max_tokens: Optional[int] = None
+    interview_max_cost: Optional[float] = None  # USD, priced by budget_model_prices
+    interview_max_seconds: Optional[float] = None  # Wall time from the start
+    # Cheaper models and the share of budget left when each takes over,
+    # e.g. {"gpt-4o-mini": 0.5, "gpt-4.1-nano": 0.2}
+    budget_model_tiers: Dict[str, float] = {}
+    # USD per million prompt and completion tokens, on top of the built-in prices
+    budget_model_prices: Dict[str, Tuple[float, float]] = {}
 
     # LangSmith Configuration
     langchain_tracing_v2: bool = False
@@ -28,8 +53,46 @@ class Settings(BaseSettings):
     # LLM Performance Settings
     llm_timeout: int = 30
     llm_max_retries: int = 3
+    llm_max_connections: int = 20  # Per provider, shared by all tasks and sessions
+    llm_max_keepalive_connections: int = 10
+    llm_keepalive_expiry: float = 30.0  # Seconds an idle connection stays open
+    llm_http2: bool = True  # Used when the h2 package is installed
+    llm_warmup_connections: int = 2  # Opened by InterviewWorkflow.warm_up()
     enable_llm_caching: bool = True
+    llm_cache_backend: str = "sqlite"  # One of: memory, sqlite
+    llm_cache_path: str = "data/llm_cache.sqlite"
+    llm_cache_max_bytes: int = 100 * 1024 * 1024
+    llm_cache_ttl_seconds: Optional[int] = 7 * 24 * 3600  # None keeps entries
     enable_prompt_optimization: bool = True
+    taxonomy_prompt_token_budget: int = 1500  # Max tokens for the taxonomy prompt
+    context_recent_turns: int = 3  # Answers quoted verbatim; older ones summarized
+    state_message_window: int = 20  # Latest messages checkpointed; 0 keeps all
+    question_context_token_budget: int = 600  # Max conversation tokens per prompt
+    turn_plan_context_token_budget: int = 400
+    enable_question_speculation: bool = False  # Pre-generate while candidate types
+    speculation_max_workers: int = 4
+    speculation_ttl_seconds: Optional[float] = 3600.0  # Abandoned threads dropped
+    enable_evaluation_cache: bool = False  # Reuse evaluations of similar answers
+    evaluation_cache_threshold: float = 0.9  # Min MinHash similarity for a hit
+    evaluation_cache_max_entries: int = 5000
+    evaluation_cache_audit_rate: float = 0.05  # Share of hits re-evaluated fresh
+
+    # Persistence
+    checkpointer_backend: str = "memory"  # One of: memory, sqlite
+    checkpoint_db_path: str = "data/checkpoints.sqlite"  # Used by the sqlite backend
+
+    # Taxonomies
+    taxonomy_dir: str = "data/taxonomies"  # Per-role taxonomies, <taxonomy_id>.json
+    taxonomy_cache_max_bytes: Optional[int] = 256 * 1024 * 1024  # None: no cap
+    # Every version interviews were pinned to, so they resume after the file changes
+    taxonomy_version_dir: Optional[str] = "data/taxonomy_versions"
+    enable_taxonomy_reload: bool = False  # Watch the taxonomy file for changes
+    taxonomy_reload_interval: float = 5.0  # Seconds between checks of the file
+
+    # Metrics
+    enable_metrics: bool = False  # Per-node latency, token and cache-hit metrics
+    metrics_port: Optional[int] = None  # Serve Prometheus /metrics on this port
+    metrics_file: Optional[str] = None  # Rewrite this file after each graph run
 
     # Environment
     environment: str = "development"  # development, production
@@ -1,27 +1,54 @@
 import json
-import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict
 
+from .taxonomy_snapshot import read_snapshot, source_digest, write_snapshot
 
-def load_taxonomy(taxonomy_path: str | None = None) -> Dict[str, Any]:
-    """Load taxonomy from JSON file"""
+DEFAULT_TAXONOMY_PATH = (
+    Path(__file__).parent.parent.parent.parent / "data" / "interview_taxonomy.json"
+)
 
-    if taxonomy_path is None:
-        # Default to the taxonomy file in the same directory
-        current_dir = Path(
-            __file__
-        ).parent.parent.parent.parent  # Go up to workspace root
-        taxonomy_path = current_dir / "data" / "interview_taxonomy.json"
+
+def load_taxonomy(
+    taxonomy_path: str | Path | None = None,
+    validate: bool = False,
+    use_snapshot: bool = True,
+) -> Dict[str, Any]:
+    """Load taxonomy from JSON file.
+
+    While the file is unchanged it is read from its compiled snapshot instead,
+    which skips parsing and validation. After a full parse, a valid taxonomy
+    gets a fresh snapshot. With ``validate``, an invalid taxonomy raises.
+    """
+
+    taxonomy_path = Path(taxonomy_path or DEFAULT_TAXONOMY_PATH)
+
+    if use_snapshot:
+        taxonomy = read_snapshot(taxonomy_path)
+        if taxonomy is not None:
+            return taxonomy
 
     try:
-        with open(taxonomy_path, "r", encoding="utf-8") as f:
-            return json.load(f)
+        stat = taxonomy_path.stat()
+        data = taxonomy_path.read_bytes()
+        taxonomy = json.loads(data)
     except FileNotFoundError:
         raise FileNotFoundError(f"Taxonomy file not found at {taxonomy_path}")
-    except json.JSONDecodeError as e:
+    except (json.JSONDecodeError, UnicodeDecodeError) as e:
         raise ValueError(f"Invalid JSON in taxonomy file: {e}")
 
+    try:
+        validate_taxonomy(taxonomy)
+    except ValueError:
+        if validate:
+            raise
+        return taxonomy
+
+    if use_snapshot:
+        write_snapshot(taxonomy_path, taxonomy, source_digest(data), stat)
+    return taxonomy
+
 
 def validate_taxonomy(taxonomy: Dict[str, Any]) -> bool:
     """Validate taxonomy structure"""
@@ -77,11 +104,7 @@ def get_taxonomy_summary(taxonomy: Dict[str, Any]) -> Dict[str, Any]:
     return summary
 
 
-# Load the default taxonomy
-try:
-    INTERVIEW_DOMAINS = load_taxonomy()
-    validate_taxonomy(INTERVIEW_DOMAINS)
-except Exception as e:
-    print(f"Warning: Could not load taxonomy: {e}")
-    # Fallback to empty structure
-    INTERVIEW_DOMAINS = {"domains": []}
+@lru_cache(maxsize=None)
+def get_default_taxonomy() -> Dict[str, Any]:
+    """Load and validate the bundled taxonomy on first use, once per process"""
+    return load_taxonomy(validate=True)
@@ -0,0 +1,126 @@
+"""Compile taxonomy JSON files into binary snapshots that load without parsing.
+
+A snapshot sits next to its source, e.g. ``interview_taxonomy.snapshot``, and
+records the source's mtime, size and SHA-256. ``load_taxonomy`` uses it while
+the source is unchanged, and rewrites it after a full parse when it is stale.
+Snapshots are only written for taxonomies that pass validation.
+
+Run from the repository root to compile ahead of time, e.g. in an image build:
+
+    python -m src.llm_interviewer.config.taxonomy_snapshot data/interview_taxonomy.json
+"""
+
+import argparse
+import hashlib
+import logging
+import marshal
+import os
+import struct
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"LLMTAX\x01\n"
+# Length of the marshalled header that follows the magic bytes
+HEADER_LENGTH = struct.Struct("<I")
+# marshal's format can change between Python versions, so snapshots are per version
+FORMAT = (marshal.version, sys.version_info[:2])
+
+
+def snapshot_path(source: Path) -> Path:
+    return source.with_suffix(".snapshot")
+
+
+def source_digest(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def read_snapshot(source: Path) -> Optional[Dict[str, Any]]:
+    """Load the snapshot of ``source`` if it matches the source, else None.
+
+    A matching mtime and size is trusted as is. Otherwise the source is hashed,
+    so a file that was only touched or checked out again still uses its
+    snapshot, which is then rewritten with the new mtime.
+    """
+    try:
+        stat = source.stat()
+        with open(snapshot_path(source), "rb") as f:
+            data = f.read()
+        if not data.startswith(MAGIC):
+            return None
+        start = len(MAGIC) + HEADER_LENGTH.size
+        (length,) = HEADER_LENGTH.unpack_from(data, len(MAGIC))
+        header = marshal.loads(data[start : start + length])
+        if header["format"] != FORMAT or header["size"] != stat.st_size:
+            return None
+        if header["mtime_ns"] == stat.st_mtime_ns:
+            return marshal.loads(data[start + length :])
+        if header["sha256"] != source_digest(source.read_bytes()):
+            return None
+        taxonomy = marshal.loads(data[start + length :])
+    except FileNotFoundError:
+        return None
+    except (OSError, EOFError, ValueError, TypeError, KeyError, struct.error) as e:
+        logger.warning(f"Ignoring unreadable taxonomy snapshot for {source}: {e}")
+        return None
+
+    write_snapshot(source, taxonomy, header["sha256"], stat)
+    return taxonomy
+
+
+def write_snapshot(
+    source: Path, taxonomy: Dict[str, Any], sha256: str, stat: os.stat_result
+) -> bool:
+    """Atomically write the snapshot of a validated taxonomy.
+
+    ``stat`` must be taken before the source was read, so that a change made
+    while reading leaves the snapshot stale rather than wrongly current.
+    Returns False if the directory is not writable.
+    """
+    header = marshal.dumps(
+        {
+            "format": FORMAT,
+            "mtime_ns": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "sha256": sha256,
+        }
+    )
+    target = snapshot_path(source)
+    try:
+        fd, tmp_path = tempfile.mkstemp(dir=target.parent, prefix=f".{target.name}.")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(MAGIC + HEADER_LENGTH.pack(len(header)) + header)
+                marshal.dump(taxonomy, f)
+            os.replace(tmp_path, target)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except (OSError, ValueError) as e:
+        logger.debug(f"Could not write taxonomy snapshot {target}: {e}")
+        return False
+    return True
+
+
+def main(argv=None):
+    from .taxonomy import DEFAULT_TAXONOMY_PATH, load_taxonomy
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "sources", nargs="*", type=Path, default=[DEFAULT_TAXONOMY_PATH]
+    )
+    args = parser.parse_args(argv)
+
+    for source in args.sources:
+        snapshot_path(source).unlink(missing_ok=True)
+        load_taxonomy(source, validate=True)
+        if not snapshot_path(source).exists():
+            sys.exit(f"Could not write a snapshot for {source}")
+        print(f"Wrote {snapshot_path(source)}")
+
+
+if __name__ == "__main__":
+    main()
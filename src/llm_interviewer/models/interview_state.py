@@ -1,18 +1,40 @@
+import operator
 from typing import Annotated, Any, Dict, List, TypedDict
 
 from langchain_core.messages import BaseMessage
 
+from ..config.settings import settings
+
+
+def add_recent_messages(
+    current: List[BaseMessage], update: List[BaseMessage]
+) -> List[BaseMessage]:
+    """Append messages, keeping only the latest ``settings.state_message_window``.
+
+    The checkpointer saves the whole list each turn, so a full history would make
+    every turn slower than the last. Every question and answer is still kept in
+    ``overall_performance``.
+    """
+    messages = current + update
+    window = settings.state_message_window
+    if window and len(messages) > window:
+        messages = messages[-window:]
+    return messages
+
 
 class InterviewState(TypedDict):
-    # Core interview data
+    # Core interview data. The taxonomy is resolved from the registry by ID and
+    # version; ``taxonomy`` only holds the inline copy of legacy states
+    taxonomy_id: str
+    taxonomy_version: str
     taxonomy: Dict[str, Any]
-    messages: Annotated[List[BaseMessage], "Chat history"]
+    messages: Annotated[List[BaseMessage], add_recent_messages]  # Recent chat
 
     # Topic tracking
     current_domain: str
     current_subdomain: str
     current_skill: str
-    topics_covered: List[Dict[str, str]]
+    topics_covered: Annotated[List[Dict[str, str]], operator.add]
 
     # Progress tracking
     questions_asked_current_topic: int
@@ -21,8 +43,36 @@ class InterviewState(TypedDict):
 
     # Evaluation data
     current_evaluation: Dict[str, Any]
-    overall_performance: List[Dict[str, Any]]
+    overall_performance: Annotated[List[Dict[str, Any]], operator.add]
+    planned_turn: Dict[str, Any]  # Next topic and question from the fused mode
+    # Rolling per-topic summary of the answers older than the verbatim window
+    context_summary: Dict[str, Any]
+    # Per-topic ability estimates, and the difficulty of the question being answered
+    skill_estimates: Dict[str, Dict[str, Any]]
+    current_question_difficulty: str
+    # LLM calls, tokens, cost and start time, checked against the interview budget
+    budget_usage: Dict[str, Any]
 
     # Flow control
     should_continue_interview: bool
     interview_complete: bool
+
+
+# Fields whose node updates are appended rather than replacing the current value
+APPEND_FIELDS = {
+    "messages": add_recent_messages,
+    "topics_covered": operator.add,
+    "overall_performance": operator.add,
+}
+
+
+def apply_update(state: Dict[str, Any], update: Dict[str, Any]) -> Dict[str, Any]:
+    """Apply a node update to a state the way the graph reducers do.
+
+    Also combines two consecutive updates into one when ``state`` is an update.
+    """
+    merged = {**state, **update}
+    for key, reducer in APPEND_FIELDS.items():
+        if key in update:
+            merged[key] = reducer(state.get(key, []), update[key])
+    return merged
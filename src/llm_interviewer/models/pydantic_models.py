@@ -20,6 +20,12 @@ class Question(BaseModel):
     difficulty_level: str = Field(description="Beginner, Intermediate, or Advanced")
 
 
+class QuestionPool(BaseModel):
+    questions: List[Question] = Field(
+        description="Distinct interview questions for the same topic and difficulty"
+    )
+
+
 class ResponseEvaluation(BaseModel):
     quality_score: float = Field(
         description="Score between 0-1 representing response quality"
@@ -33,3 +39,13 @@ class ResponseEvaluation(BaseModel):
         description="Whether to ask another question on this topic"
     )
     reasoning: str = Field(description="Detailed reasoning for the evaluation")
+
+
+class TurnPlan(BaseModel):
+    evaluation: ResponseEvaluation = Field(
+        description="Evaluation of the candidate's latest response"
+    )
+    next_topic: TopicSelection = Field(
+        description="Topic for the next question; the current topic if staying on it"
+    )
+    next_question: Question = Field(description="The next interview question to ask")
@@ -0,0 +1,213 @@
+import re
+import sys
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from ..config.taxonomy import validate_taxonomy
+
+SkillPath = Tuple[str, str, str]
+
+_PUNCTUATION = re.compile(r"[^\w\s]")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_name(name: str) -> str:
+    """Fold case, punctuation and spacing, so near-miss names still match"""
+    return _WHITESPACE.sub(" ", _PUNCTUATION.sub(" ", name.casefold())).strip()
+
+
+def _intern_all(values: List[Any]) -> Tuple[str, ...]:
+    return tuple(sys.intern(str(value)) for value in values)
+
+
+class SkillNode:
+    __slots__ = (
+        "domain",
+        "subdomain",
+        "name",
+        "knowledge_areas",
+        "practical_applications",
+        "index",
+    )
+
+    def __init__(
+        self,
+        domain: str,
+        subdomain: str,
+        name: str,
+        knowledge_areas: Tuple[str, ...],
+        practical_applications: Tuple[str, ...],
+        index: int = 0,
+    ):
+        self.domain = domain
+        self.subdomain = subdomain
+        self.name = name
+        self.knowledge_areas = knowledge_areas
+        self.practical_applications = practical_applications
+        # Position in taxonomy order
+        self.index = index
+
+    @property
+    def path(self) -> SkillPath:
+        return self.domain, self.subdomain, self.name
+
+    def __repr__(self) -> str:
+        return f"SkillNode({self.domain!r}, {self.subdomain!r}, {self.name!r})"
+
+
+class SubdomainNode:
+    __slots__ = ("domain", "name", "skills")
+
+    def __init__(self, domain: str, name: str):
+        self.domain = domain
+        self.name = name
+        self.skills: List[SkillNode] = []
+
+
+class DomainNode:
+    __slots__ = ("name", "subdomains")
+
+    def __init__(self, name: str):
+        self.name = name
+        self.subdomains: List[SubdomainNode] = []
+
+
+class CompiledTaxonomy:
+    """Read-only taxonomy with hash indexes over domain, subdomain and skill paths.
+
+    Names are interned and nodes use ``__slots__``, so a large taxonomy takes a
+    fraction of the memory of its nested dicts. Exact lookups are one dict
+    probe. Lookups of LLM-selected topics go through normalized names, so
+    differences in case, punctuation or spacing still resolve to a real node.
+    Repeated domain or subdomain names are merged, and a repeated skill keeps
+    its first entry.
+    """
+
+    __slots__ = (
+        "domains",
+        "_domains",
+        "_subdomains",
+        "_skills",
+        "_domains_by_name",
+        "_subdomains_by_name",
+        "_skills_by_name",
+    )
+
+    def __init__(self, taxonomy: Dict[str, Any]):
+        validate_taxonomy(taxonomy)
+        self.domains: List[DomainNode] = []
+        self._domains: Dict[str, DomainNode] = {}
+        self._subdomains: Dict[Tuple[str, str], SubdomainNode] = {}
+        self._skills: Dict[SkillPath, SkillNode] = {}
+        # Normalized name to the nodes of that name, for snapping near misses
+        self._domains_by_name: Dict[str, List[DomainNode]] = {}
+        self._subdomains_by_name: Dict[str, List[SubdomainNode]] = {}
+        self._skills_by_name: Dict[str, List[SkillNode]] = {}
+
+        for domain_data in taxonomy["domains"]:
+            domain = self._domains.get(domain_data["name"])
+            if domain is None:
+                domain = DomainNode(sys.intern(domain_data["name"]))
+                self.domains.append(domain)
+                self._domains[domain.name] = domain
+                self._index(self._domains_by_name, domain.name, domain)
+            for subdomain_data in domain_data.get("subdomains", []):
+                self._add_subdomain(domain, subdomain_data)
+
+    def _index(self, index: Dict[str, list], name: str, node: Any):
+        index.setdefault(normalize_name(name), []).append(node)
+
+    def _add_subdomain(self, domain: DomainNode, data: Dict[str, Any]):
+        key = (domain.name, data["name"])
+        subdomain = self._subdomains.get(key)
+        if subdomain is None:
+            subdomain = SubdomainNode(domain.name, sys.intern(data["name"]))
+            domain.subdomains.append(subdomain)
+            self._subdomains[key] = subdomain
+            self._index(self._subdomains_by_name, subdomain.name, subdomain)
+
+        for skill_data in data.get("core_skills", []):
+            if not isinstance(skill_data, dict) or "name" not in skill_data:
+                raise ValueError("Each skill must have a 'name' field")
+            path = (domain.name, subdomain.name, skill_data["name"])
+            if path in self._skills:
+                continue
+            skill = SkillNode(
+                domain.name,
+                subdomain.name,
+                sys.intern(skill_data["name"]),
+                _intern_all(skill_data.get("knowledge_areas", [])),
+                _intern_all(skill_data.get("practical_applications", [])),
+                len(self._skills),
+            )
+            subdomain.skills.append(skill)
+            self._skills[path] = skill
+            self._index(self._skills_by_name, skill.name, skill)
+
+    def __len__(self) -> int:
+        return len(self._skills)
+
+    def __contains__(self, path: SkillPath) -> bool:
+        return path in self._skills
+
+    def domain(self, name: str) -> Optional[DomainNode]:
+        return self._domains.get(name)
+
+    def subdomain(self, domain: str, name: str) -> Optional[SubdomainNode]:
+        return self._subdomains.get((domain, name))
+
+    def skill(self, domain: str, subdomain: str, name: str) -> Optional[SkillNode]:
+        return self._skills.get((domain, subdomain, name))
+
+    def iter_skills(self) -> Iterator[SkillNode]:
+        """Skills in taxonomy order"""
+        return iter(self._skills.values())
+
+    def snap(self, domain: str, subdomain: str, skill: str) -> Optional[SkillNode]:
+        """Resolve a possibly inexact topic to a real skill.
+
+        Tries, in order: the exact path; the skill's normalized name, preferring
+        the candidate under the named subdomain or domain; the first skill of the
+        named subdomain; the first skill of the named domain. Returns None when
+        no name matches.
+        """
+        node = self._skills.get((domain, subdomain, skill))
+        if node is not None:
+            return node
+
+        domain_key, subdomain_key = normalize_name(domain), normalize_name(subdomain)
+        candidates = self._skills_by_name.get(normalize_name(skill), [])
+        if candidates:
+            for candidate in candidates:
+                if normalize_name(candidate.subdomain) == subdomain_key:
+                    return candidate
+            for candidate in candidates:
+                if normalize_name(candidate.domain) == domain_key:
+                    return candidate
+            return candidates[0]
+
+        for subdomain_node in self._subdomains_by_name.get(subdomain_key, []):
+            if subdomain_node.skills:
+                return subdomain_node.skills[0]
+
+        for domain_node in self._domains_by_name.get(domain_key, []):
+            for subdomain_node in domain_node.subdomains:
+                if subdomain_node.skills:
+                    return subdomain_node.skills[0]
+        return None
+
+    def summary(self) -> Dict[str, Any]:
+        """Same structure as ``get_taxonomy_summary``, from the compiled nodes"""
+        return {
+            "total_domains": len(self.domains),
+            "domains": [
+                {
+                    "name": domain.name,
+                    "subdomains_count": len(domain.subdomains),
+                    "subdomains": [
+                        {"name": subdomain.name, "skills_count": len(subdomain.skills)}
+                        for subdomain in domain.subdomains
+                    ],
+                }
+                for domain in self.domains
+            ],
+        }
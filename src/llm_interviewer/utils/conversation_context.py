@@ -0,0 +1,111 @@
+from typing import Any, Dict, List, Sequence
+
+from .tokens import CHARS_PER_TOKEN, estimate_tokens
+
+# Strengths and gaps kept per topic in the rolling summary
+MAX_POINTS = 3
+# Reserved for headings, separators and the omitted topics line when rendering
+HEADER_TOKENS = 32
+
+
+def _add_points(points: List[str], new: Sequence[str]) -> List[str]:
+    """Keep the most recent distinct points, newest last"""
+    kept = [point for point in points if point not in new]
+    return (kept + list(new))[-MAX_POINTS:]
+
+
+def fold_turns(
+    summary: Dict[str, Any], records: Sequence[Dict[str, Any]]
+) -> Dict[str, Any]:
+    """Fold evaluation records into a rolling per-topic summary.
+
+    Each topic keeps its answer count, score total and latest strengths and gaps,
+    so the summary grows with the number of topics, not of turns. Returns a new
+    summary; the given one is not modified.
+    """
+    if not records:
+        return summary
+
+    topics = dict(summary.get("topics", {}))
+    for record in records:
+        topic = topics.get(record["topic"], {})
+        topics[record["topic"]] = {
+            "answered": topic.get("answered", 0) + 1,
+            "score_total": topic.get("score_total", 0.0) + record["quality_score"],
+            "strengths": _add_points(
+                topic.get("strengths", []), record["areas_of_strength"]
+            ),
+            "gaps": _add_points(topic.get("gaps", []), record["areas_for_improvement"]),
+        }
+    return {"turns": summary.get("turns", 0) + len(records), "topics": topics}
+
+
+def summarize(
+    summary: Dict[str, Any],
+    performance: Sequence[Dict[str, Any]],
+    recent_turns: int,
+) -> Dict[str, Any]:
+    """Bring the summary up to every turn except the last ``recent_turns``"""
+    end = max(len(performance) - recent_turns, 0)
+    return fold_turns(summary, performance[summary.get("turns", 0) : end])
+
+
+def _truncate(text: str, token_budget: int) -> str:
+    max_chars = token_budget * CHARS_PER_TOKEN
+    return text if len(text) <= max_chars else text[: max_chars - 3] + "..."
+
+
+def _topic_line(topic: str, entry: Dict[str, Any]) -> str:
+    line = (
+        f"- {topic}: {entry['answered']} answered, "
+        f"mean score {entry['score_total'] / entry['answered']:.2f}"
+    )
+    if entry["strengths"]:
+        line += f"; strengths: {', '.join(entry['strengths'])}"
+    if entry["gaps"]:
+        line += f"; gaps: {', '.join(entry['gaps'])}"
+    return line
+
+
+def render_context(
+    summary: Dict[str, Any],
+    recent: Sequence[Dict[str, Any]],
+    token_budget: int,
+) -> str:
+    """Render the summary and recent turns for a prompt within a token budget.
+
+    Recent turns come first in priority, newest first, and the last one that
+    does not fit is cut short. Summary lines fill what is left, latest topics
+    first, and a final line counts the topics left out.
+    """
+    remaining = token_budget - HEADER_TOKENS
+    turns = []
+    for record in reversed(recent):
+        if remaining <= 0:
+            break
+        text = f"Interviewer: {record['question']}\nCandidate: {record['response']}"
+        text = _truncate(text, remaining)
+        turns.append(text)
+        remaining -= estimate_tokens(text)
+
+    topics = list(summary.get("topics", {}).items())
+    lines = []
+    for topic, entry in reversed(topics):
+        line = _topic_line(topic, entry)
+        if estimate_tokens(line) > remaining:
+            break
+        lines.append(line)
+        remaining -= estimate_tokens(line)
+
+    sections = []
+    if topics:
+        omitted = len(topics) - len(lines)
+        if omitted:
+            lines.append(f"- ({omitted} earlier topics omitted)")
+        sections.append(
+            f"Summary of {summary['turns']} earlier answers:\n"
+            + "\n".join(reversed(lines))
+        )
+    if turns:
+        sections.append("Most recent answers:\n" + "\n\n".join(reversed(turns)))
+    return "\n\n".join(sections) or "No answers yet."
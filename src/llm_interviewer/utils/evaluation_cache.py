@@ -0,0 +1,264 @@
+import hashlib
+import random
+import re
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+import numpy as np
+
+from ..models.pydantic_models import ResponseEvaluation
+
+NUM_PERMUTATIONS = 64
+SHINGLE_WORDS = 3
+MERSENNE_PRIME = np.uint64((1 << 61) - 1)
+MAX_HASH = np.uint64((1 << 32) - 1)
+
+# Fixed seed, so signatures are comparable across processes and restarts
+_permutations = np.random.RandomState(1).randint(
+    1, (1 << 61) - 1, size=(2, NUM_PERMUTATIONS), dtype=np.uint64
+)
+_WORD = re.compile(r"[a-z0-9]+")
+
+
+def _normalize(text: str) -> str:
+    return " ".join(_WORD.findall(text.lower()))
+
+
+def minhash_signature(text: str) -> np.ndarray:
+    """MinHash signature of the word shingles of a text"""
+    words = _normalize(text).split()
+    shingles = {
+        " ".join(words[i : i + SHINGLE_WORDS])
+        for i in range(max(1, len(words) - SHINGLE_WORDS + 1))
+    }
+    hashes = np.array(
+        [
+            int.from_bytes(hashlib.blake2b(s.encode(), digest_size=4).digest(), "big")
+            for s in shingles
+        ],
+        dtype=np.uint64,
+    )
+    a, b = _permutations
+    # Multiplication wraps at 64 bits, as in standard MinHash implementations
+    permuted = np.bitwise_and((np.outer(hashes, a) + b) % MERSENNE_PRIME, MAX_HASH)
+    return permuted.min(axis=0)
+
+
+# Rows a bucket's signature array starts with; it doubles as it fills
+INITIAL_ROWS = 8
+
+
+@dataclass
+class _Bucket:
+    """Signatures and evaluations of the responses to one question, oldest first.
+
+    Rows before ``start`` were evicted. They are dropped when the array is full,
+    which then doubles the room for the rows still in use, so appends are
+    amortized O(1) instead of copying every row each time.
+    """
+
+    signatures: np.ndarray = field(
+        default_factory=lambda: np.empty(
+            (INITIAL_ROWS, NUM_PERMUTATIONS), dtype=np.uint64
+        )
+    )
+    evaluations: List[Optional[ResponseEvaluation]] = field(default_factory=list)
+    start: int = 0
+
+    def __len__(self) -> int:
+        return len(self.evaluations) - self.start
+
+    def rows(self) -> np.ndarray:
+        return self.signatures[self.start : len(self.evaluations)]
+
+    def evaluation(self, row: int) -> ResponseEvaluation:
+        return self.evaluations[self.start + row]
+
+    def append(self, signature: np.ndarray, evaluation: ResponseEvaluation):
+        end = len(self.evaluations)
+        if end == len(self.signatures):
+            live = end - self.start
+            signatures = np.empty(
+                (max(2 * live, INITIAL_ROWS), NUM_PERMUTATIONS), dtype=np.uint64
+            )
+            signatures[:live] = self.signatures[self.start : end]
+            self.signatures = signatures
+            del self.evaluations[: self.start]
+            self.start = 0
+            end = live
+        self.signatures[end] = signature
+        self.evaluations.append(evaluation)
+
+    def evict_oldest(self, count: int) -> int:
+        """Drop up to ``count`` of the oldest rows, returning how many were"""
+        count = min(count, len(self))
+        for row in range(self.start, self.start + count):
+            self.evaluations[row] = None
+        self.start += count
+        return count
+
+
+class EvaluationCache:
+    """Reuse evaluations of near-identical responses to the same question.
+
+    Responses are compared by the estimated Jaccard similarity of their MinHash
+    signatures, computed locally. A lookup at or above ``threshold`` reuses the
+    stored evaluation. The index holds at most ``max_entries`` responses. Over
+    that, the oldest responses of the least recently used question are evicted
+    first, never the response just added. A share of hits set by
+    ``audit_rate`` is evaluated fresh anyway, to report how far reused
+    evaluations drift from fresh ones.
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.9,
+        max_entries: int = 5000,
+        audit_rate: float = 0.05,
+        seed: Optional[int] = None,
+    ):
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.audit_rate = audit_rate
+        self._buckets: "OrderedDict[str, _Bucket]" = OrderedDict()
+        self._entries = 0
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self.reset_stats()
+
+    def reset_stats(self):
+        self.hits = 0
+        self.misses = 0
+        # Running totals, so long-lived processes do not keep every audit
+        self.audits = 0
+        self.total_score_drift = 0.0
+        self.max_score_drift = 0.0
+        self.decision_matches = 0
+
+    def _key(self, topic: str, question: str) -> str:
+        return f"{topic}\0{_normalize(question)}"
+
+    def lookup(
+        self, topic: str, question: str, response: str
+    ) -> Optional[ResponseEvaluation]:
+        """Get the stored evaluation of the most similar response, if close enough"""
+        signature = minhash_signature(response)
+        with self._lock:
+            bucket = self._buckets.get(self._key(topic, question))
+            if bucket is None or not len(bucket):
+                return None
+            self._buckets.move_to_end(self._key(topic, question))
+            similarity = (bucket.rows() == signature).mean(axis=1)
+            best = int(similarity.argmax())
+            if similarity[best] < self.threshold:
+                return None
+            return bucket.evaluation(best)
+
+    def add(
+        self,
+        topic: str,
+        question: str,
+        response: str,
+        evaluation: ResponseEvaluation,
+    ):
+        signature = minhash_signature(response)
+        key = self._key(topic, question)
+        with self._lock:
+            bucket = self._buckets.setdefault(key, _Bucket())
+            self._buckets.move_to_end(key)
+            bucket.append(signature, evaluation)
+            self._entries += 1
+
+            while self._entries > max(self.max_entries, 1):
+                oldest_key, oldest = next(iter(self._buckets.items()))
+                excess = self._entries - self.max_entries
+                if oldest is bucket:
+                    # Only this question is left; keep the response just added
+                    excess = min(excess, len(bucket) - 1)
+                self._entries -= oldest.evict_oldest(excess)
+                if not len(oldest):
+                    del self._buckets[oldest_key]
+
+    def _should_audit(self) -> bool:
+        return self._random.random() < self.audit_rate
+
+    def _record(self, cached: Optional[ResponseEvaluation]):
+        with self._lock:
+            if cached is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+
+    def _record_audit(self, cached: ResponseEvaluation, fresh: ResponseEvaluation):
+        with self._lock:
+            drift = abs(cached.quality_score - fresh.quality_score)
+            self.audits += 1
+            self.total_score_drift += drift
+            self.max_score_drift = max(self.max_score_drift, drift)
+            self.decision_matches += int(
+                cached.should_continue_topic == fresh.should_continue_topic
+                and cached.demonstrates_knowledge == fresh.demonstrates_knowledge
+            )
+
+    def evaluate(
+        self,
+        topic: str,
+        question: str,
+        response: str,
+        evaluate: Callable[[], ResponseEvaluation],
+    ) -> ResponseEvaluation:
+        """Return a cached evaluation, or run ``evaluate`` and store its result"""
+        cached = self.lookup(topic, question, response)
+        self._record(cached)
+        if cached is not None and not self._should_audit():
+            return cached
+
+        fresh = evaluate()
+        if cached is None:
+            self.add(topic, question, response, fresh)
+        else:
+            self._record_audit(cached, fresh)
+        return fresh
+
+    async def aevaluate(
+        self,
+        topic: str,
+        question: str,
+        response: str,
+        evaluate: Callable[[], Awaitable[ResponseEvaluation]],
+    ) -> ResponseEvaluation:
+        """Async version of evaluate"""
+        cached = self.lookup(topic, question, response)
+        self._record(cached)
+        if cached is not None and not self._should_audit():
+            return cached
+
+        fresh = await evaluate()
+        if cached is None:
+            self.add(topic, question, response, fresh)
+        else:
+            self._record_audit(cached, fresh)
+        return fresh
+
+    def report(self) -> Dict[str, Any]:
+        """Get the hit rate and the drift of reused evaluations from fresh ones"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            audits = self.audits
+            return {
+                "lookups": lookups,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "entries": self._entries,
+                "audits": audits,
+                "mean_score_drift": (
+                    self.total_score_drift / audits if audits else None
+                ),
+                "max_score_drift": self.max_score_drift if audits else None,
+                "decision_agreement": (
+                    self.decision_matches / audits if audits else None
+                ),
+            }
@@ -0,0 +1,250 @@
+import asyncio
+import importlib.util
+import logging
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+# API roots, used to warm up connections when no base URL is configured
+DEFAULT_BASE_URLS = {
+    "openai": "https://api.openai.com/v1",
+    "anthropic": "https://api.anthropic.com",
+}
+
+
+def http2_available() -> bool:
+    """HTTP/2 needs the optional h2 package"""
+    return importlib.util.find_spec("h2") is not None
+
+
+def _pool_stats(transports: List[Any]) -> Dict[str, int]:
+    stats = {
+        "active_connections": 0,
+        "idle_connections": 0,
+        "active_requests": 0,
+        "queued_requests": 0,
+    }
+    # httpx exposes no pool counters; read them from the httpcore pools
+    for transport in transports:
+        pool = getattr(transport, "_pool", None)
+        if pool is None:
+            continue
+        for connection in pool.connections:
+            state = "idle" if connection.is_idle() else "active"
+            stats[f"{state}_connections"] += 1
+        for request in list(pool._requests):
+            state = "queued" if request.is_queued() else "active"
+            stats[f"{state}_requests"] += 1
+    return stats
+
+
+class _LoopTransport(httpx.AsyncBaseTransport):
+    """Send each request through a connection pool of the running event loop.
+
+    Connections belong to the loop that opened them, and reusing one on another
+    loop fails with "Event loop is closed". A pool per loop lets one
+    ``AsyncClient`` serve every loop, e.g. one per worker thread or
+    ``asyncio.run`` call. A loop's pool is dropped with the loop.
+    """
+
+    def __init__(self, **options: Any):
+        self._options = options
+        # Keyed by event loop
+        self._transports: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+
+    def _transport(self) -> httpx.AsyncHTTPTransport:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            transport = self._transports.get(loop)
+            if transport is None:
+                transport = httpx.AsyncHTTPTransport(**self._options)
+                self._transports[loop] = transport
+            return transport
+
+    def transports(self) -> List[httpx.AsyncHTTPTransport]:
+        """Pools of the loops that are still open"""
+        with self._lock:
+            return [
+                transport
+                for loop, transport in self._transports.items()
+                if not loop.is_closed()
+            ]
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        return await self._transport().handle_async_request(request)
+
+    async def aclose(self):
+        """Close the running loop's pool"""
+        with self._lock:
+            transport = self._transports.pop(asyncio.get_running_loop(), None)
+        if transport is not None:
+            await transport.aclose()
+
+
+class HttpPool:
+    """Keep-alive HTTP connections shared by every LLM client of one provider.
+
+    The sync and async httpx clients are created on first use. Each holds up to
+    ``max_connections`` connections, of which ``max_keepalive_connections`` stay
+    open for ``keepalive_expiry`` seconds after a request, so later calls skip
+    the TCP and TLS handshakes. HTTP/2 is used when requested and available.
+    The async client keeps those connections per event loop, with the limits
+    applying to each loop.
+    """
+
+    def __init__(
+        self,
+        provider: str,
+        base_url: Optional[str] = None,
+        max_connections: int = 20,
+        max_keepalive_connections: int = 10,
+        keepalive_expiry: float = 30.0,
+        http2: bool = True,
+        timeout: float = 30.0,
+    ):
+        self.provider = provider
+        self.base_url = base_url or DEFAULT_BASE_URLS.get(provider)
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self.http2 = http2 and http2_available()
+        self.timeout = timeout
+        self._client: Optional[httpx.Client] = None
+        self._async_client: Optional[httpx.AsyncClient] = None
+        self._async_transport: Optional[_LoopTransport] = None
+        self._lock = threading.Lock()
+
+    def _options(self) -> Dict[str, Any]:
+        return {
+            "limits": self.limits,
+            "http2": self.http2,
+            "timeout": self.timeout,
+            "follow_redirects": True,
+        }
+
+    @property
+    def client(self) -> httpx.Client:
+        with self._lock:
+            if self._client is None:
+                self._client = httpx.Client(**self._options())
+            return self._client
+
+    @property
+    def async_client(self) -> httpx.AsyncClient:
+        with self._lock:
+            if self._async_client is None:
+                options = self._options()
+                self._async_transport = _LoopTransport(
+                    limits=options.pop("limits"), http2=options.pop("http2")
+                )
+                self._async_client = httpx.AsyncClient(
+                    transport=self._async_transport, **options
+                )
+            return self._async_client
+
+    def warm_up(
+        self, connections: int = 2, loop: Optional[asyncio.AbstractEventLoop] = None
+    ) -> int:
+        """Open connections to the provider ahead of the first LLM call.
+
+        Sends concurrent ``HEAD`` requests to the API root, so each leaves an
+        idle keep-alive connection in the sync pool, and in ``loop``'s async
+        pool when a loop is given. Call it from another thread than ``loop``'s.
+        Any response counts, since only the connection matters. Returns the
+        number of connections opened.
+        """
+        if not self.base_url or connections <= 0:
+            return 0
+        client = self.client
+
+        def head(_) -> bool:
+            try:
+                client.head(self.base_url)
+                return True
+            except httpx.HTTPError as e:
+                logger.warning(f"Could not warm up {self.provider} connection: {e}")
+                return False
+
+        with ThreadPoolExecutor(max_workers=connections) as executor:
+            opened = sum(executor.map(head, range(connections)))
+        if loop is not None:
+            future = asyncio.run_coroutine_threadsafe(self.awarm_up(connections), loop)
+            opened += future.result()
+        return opened
+
+    async def awarm_up(self, connections: int = 2) -> int:
+        """Open connections in the running event loop's async pool"""
+        if not self.base_url or connections <= 0:
+            return 0
+        client = self.async_client
+
+        async def head() -> bool:
+            try:
+                await client.head(self.base_url)
+                return True
+            except httpx.HTTPError as e:
+                logger.warning(f"Could not warm up {self.provider} connection: {e}")
+                return False
+
+        return sum(await asyncio.gather(*(head() for _ in range(connections))))
+
+    def stats(self) -> Dict[str, Any]:
+        """Get the pool limits and the connections and requests of each client"""
+        return {
+            "provider": self.provider,
+            "http2": self.http2,
+            "max_connections": self.limits.max_connections,
+            "max_keepalive_connections": self.limits.max_keepalive_connections,
+            "sync": _pool_stats([self._client._transport] if self._client else []),
+            "async": _pool_stats(
+                self._async_transport.transports() if self._async_transport else []
+            ),
+        }
+
+    def close(self):
+        with self._lock:
+            if self._client is not None:
+                self._client.close()
+                self._client = None
+            # Async connections are left to the event loops that opened them
+            self._async_client = None
+            self._async_transport = None
+
+
+_pools: Dict[str, HttpPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_http_pool(provider: str, **options: Any) -> HttpPool:
+    """Get the process-wide pool of a provider, created with ``options`` once"""
+    with _pools_lock:
+        if provider not in _pools:
+            _pools[provider] = HttpPool(provider, **options)
+        return _pools[provider]
+
+
+def http_pool_stats() -> Dict[str, Dict[str, Any]]:
+    """Get the stats of every pool created so far, keyed by provider"""
+    with _pools_lock:
+        pools = list(_pools.values())
+    return {pool.provider: pool.stats() for pool in pools}
+
+
+def http_pool_gauges() -> Iterator[Tuple[str, Dict[str, str], float]]:
+    """Pool utilization as metric gauges, for MetricsRegistry collectors"""
+    for provider, stats in http_pool_stats().items():
+        limit = stats["max_connections"]
+        yield "interview_http_pool_max_connections", {"provider": provider}, limit
+        for client in ("sync", "async"):
+            for name, value in stats[client].items():
+                state, kind = name.split("_")
+                labels = {"provider": provider, "client": client, "state": state}
+                yield f"interview_http_pool_{kind}", labels, value
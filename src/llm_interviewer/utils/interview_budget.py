@@ -0,0 +1,208 @@
+import logging
+import time
+from typing import Any, Dict, Optional, Set, Tuple
+from uuid import UUID
+
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.outputs import LLMResult
+from langchain_core.runnables import RunnableConfig
+from langchain_core.runnables.config import ensure_config, merge_configs
+
+from .metrics import token_usage
+
+logger = logging.getLogger(__name__)
+
+# USD per million prompt and completion tokens
+MODEL_PRICES: Dict[str, Tuple[float, float]] = {
+    "gpt-4o": (2.5, 10.0),
+    "gpt-4o-mini": (0.15, 0.6),
+    "gpt-4.1": (2.0, 8.0),
+    "gpt-4.1-mini": (0.4, 1.6),
+    "gpt-4.1-nano": (0.1, 0.4),
+    "claude-3-5-sonnet-latest": (3.0, 15.0),
+    "claude-3-5-haiku-latest": (0.8, 4.0),
+}
+
+
+class UsageRecorder(BaseCallbackHandler):
+    """Collect the token usage and LLM wait time of calls made with ``config()``.
+
+    Calls answered by the LLM cache take time but no tokens, as they cost
+    nothing.
+    """
+
+    run_inline = True
+
+    def __init__(self, model_name: str):
+        self.model_name = model_name
+        self.calls = 0
+        self.prompt_tokens = 0
+        self.completion_tokens = 0
+        self.seconds = 0.0
+        self._starts: Dict[UUID, float] = {}
+
+    def config(self) -> RunnableConfig:
+        """The current run's config with this recorder added to its callbacks"""
+        return merge_configs(ensure_config(), {"callbacks": [self]})
+
+    def on_chat_model_start(
+        self, serialized: Any, messages: Any, *, run_id: UUID, **kwargs: Any
+    ):
+        self._starts[run_id] = time.perf_counter()
+
+    on_llm_start = on_chat_model_start
+
+    def _finish(self, run_id: UUID):
+        start = self._starts.pop(run_id, None)
+        if start is not None:
+            self.calls += 1
+            self.seconds += time.perf_counter() - start
+
+    def on_llm_end(self, response: LLMResult, *, run_id: UUID, **kwargs: Any):
+        self._finish(run_id)
+        if response.llm_output is not None:
+            prompt_tokens, completion_tokens = token_usage(response)
+            self.prompt_tokens += prompt_tokens
+            self.completion_tokens += completion_tokens
+
+    def on_llm_error(self, error: BaseException, *, run_id: UUID, **kwargs: Any):
+        self._finish(run_id)
+
+
+class InterviewBudget:
+    """Token, cost and wall-time caps for each interview.
+
+    Usage is a plain dict kept in the interview state, so it is checkpointed
+    with the interview. Each cap left at None is not enforced. ``model_tiers``
+    maps cheaper models to the share of the budget left when they take over;
+    the model with the lowest threshold still at or above the remaining share
+    is used. A cost cap needs a price for every model it may use, so a missing
+    one raises ValueError rather than counting that model's calls as free.
+    """
+
+    def __init__(
+        self,
+        model_name: str,
+        max_tokens: Optional[int] = None,
+        max_cost: Optional[float] = None,
+        max_seconds: Optional[float] = None,
+        model_tiers: Optional[Dict[str, float]] = None,
+        prices: Optional[Dict[str, Tuple[float, float]]] = None,
+    ):
+        self.model_name = model_name
+        self.max_tokens = max_tokens
+        self.max_cost = max_cost
+        self.max_seconds = max_seconds
+        self.model_tiers = model_tiers or {}
+        self.prices = {**MODEL_PRICES, **(prices or {})}
+        unpriced = sorted({model_name, *self.model_tiers} - set(self.prices))
+        if max_cost is not None and unpriced:
+            raise ValueError(
+                f"No price for {', '.join(unpriced)} to enforce the cost cap; "
+                "add it to budget_model_prices"
+            )
+        self._unpriced_warned: Set[str] = set()
+
+    def start(self) -> Dict[str, Any]:
+        """Usage of an interview that has not made any LLM calls yet"""
+        return {
+            "started_at": time.time(),
+            "llm_calls": 0,
+            "prompt_tokens": 0,
+            "completion_tokens": 0,
+            "cost": 0.0,
+            "llm_seconds": 0.0,
+            "calls_by_model": {},
+        }
+
+    def charge(self, usage: Dict[str, Any], recorder: UsageRecorder) -> Dict[str, Any]:
+        """Add a recorder's calls to the usage, returning the new usage"""
+        usage = {**self.start(), **usage}
+        price = self.prices.get(recorder.model_name)
+        if price is None:
+            price = (0, 0)
+            if recorder.model_name not in self._unpriced_warned:
+                self._unpriced_warned.add(recorder.model_name)
+                logger.warning(
+                    f"No price for {recorder.model_name}; its calls are not "
+                    "counted in the interview cost"
+                )
+        prompt_price, completion_price = price
+        calls_by_model = dict(usage["calls_by_model"])
+        calls_by_model[recorder.model_name] = (
+            calls_by_model.get(recorder.model_name, 0) + recorder.calls
+        )
+        return {
+            **usage,
+            "llm_calls": usage["llm_calls"] + recorder.calls,
+            "prompt_tokens": usage["prompt_tokens"] + recorder.prompt_tokens,
+            "completion_tokens": usage["completion_tokens"]
+            + recorder.completion_tokens,
+            "cost": usage["cost"]
+            + (
+                recorder.prompt_tokens * prompt_price
+                + recorder.completion_tokens * completion_price
+            )
+            / 1e6,
+            "llm_seconds": usage["llm_seconds"] + recorder.seconds,
+            "calls_by_model": calls_by_model,
+        }
+
+    def _spent(self, usage: Dict[str, Any]) -> Dict[str, Tuple[float, float]]:
+        """Amount spent and cap of each enforced budget"""
+        spent = {}
+        if self.max_tokens is not None:
+            tokens = usage.get("prompt_tokens", 0) + usage.get("completion_tokens", 0)
+            spent["tokens"] = (tokens, self.max_tokens)
+        if self.max_cost is not None:
+            spent["cost"] = (usage.get("cost", 0.0), self.max_cost)
+        if self.max_seconds is not None:
+            started_at = usage.get("started_at")
+            seconds = time.time() - started_at if started_at else 0.0
+            spent["seconds"] = (seconds, self.max_seconds)
+        return spent
+
+    def remaining_share(self, usage: Dict[str, Any]) -> float:
+        """Share of the tightest budget that is left, 1.0 without caps"""
+        return min(
+            [1.0]
+            + [
+                max(1.0 - amount / cap, 0.0) if cap > 0 else 0.0
+                for amount, cap in self._spent(usage).values()
+            ]
+        )
+
+    def can_afford_question(self, usage: Dict[str, Any], questions_asked: int) -> bool:
+        """Whether each budget has room for another question of the average cost"""
+        for amount, cap in self._spent(usage).values():
+            average = amount / questions_asked if questions_asked else 0.0
+            if cap - amount < average or amount >= cap:
+                return False
+        return True
+
+    def model_for(self, usage: Dict[str, Any]) -> str:
+        """Model to use for the next LLM call, cheaper as the budget runs low"""
+        share = self.remaining_share(usage)
+        tiers = [
+            (threshold, model)
+            for model, threshold in self.model_tiers.items()
+            if share <= threshold
+        ]
+        return min(tiers)[1] if tiers else self.model_name
+
+    def recorder(self, usage: Dict[str, Any]) -> UsageRecorder:
+        """Recorder for the LLM calls of one node, on the model the budget allows"""
+        return UsageRecorder(self.model_for(usage))
+
+    def summary(self, usage: Dict[str, Any]) -> Dict[str, Any]:
+        """Usage with the amount left of each enforced budget"""
+        usage = {**self.start(), **usage}
+        return {
+            **usage,
+            "tokens": usage["prompt_tokens"] + usage["completion_tokens"],
+            "remaining": {
+                name: max(cap - amount, 0)
+                for name, (amount, cap) in self._spent(usage).items()
+            },
+            "remaining_share": self.remaining_share(usage),
+        }
@@ -0,0 +1,209 @@
+import hashlib
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from langchain_core.caches import RETURN_VAL_TYPE, BaseCache, InMemoryCache
+from langchain_core.load import dumps, loads
+
+from .sqlite import Transaction, connect
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS llm_cache (
+    key TEXT PRIMARY KEY,
+    value BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    created_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS llm_cache_accessed_at ON llm_cache (accessed_at);
+CREATE INDEX IF NOT EXISTS llm_cache_created_at ON llm_cache (created_at);
+CREATE TABLE IF NOT EXISTS llm_cache_size (total INTEGER NOT NULL);
+INSERT INTO llm_cache_size SELECT 0 WHERE NOT EXISTS (SELECT 1 FROM llm_cache_size);
+CREATE TRIGGER IF NOT EXISTS llm_cache_added AFTER INSERT ON llm_cache
+BEGIN
+    UPDATE llm_cache_size SET total = total + NEW.size;
+END;
+CREATE TRIGGER IF NOT EXISTS llm_cache_removed AFTER DELETE ON llm_cache
+BEGIN
+    UPDATE llm_cache_size SET total = total - OLD.size;
+END;
+"""
+
+# Hits whose access times are held in memory before they are written in one go
+ACCESS_BATCH_SIZE = 64
+
+
+def cache_key(prompt: str, llm_string: str) -> str:
+    """Hash a prompt and model parameters, ignoring whitespace differences"""
+    normalized = " ".join(prompt.split())
+    return hashlib.sha256(f"{normalized}\0{llm_string}".encode("utf-8")).hexdigest()
+
+
+class SqliteLLMCache(BaseCache):
+    """LLM response cache on a local SQLite file, shared by worker processes.
+
+    Entries are keyed by the normalized prompt and the model parameters. Entries
+    older than ``ttl_seconds`` are treated as misses and removed, on lookup or by
+    a sweep that runs with writes at most every ``expiry_interval`` seconds. When
+    the cache grows past ``max_bytes`` the least recently used entries are
+    evicted.
+
+    Hits are plain reads. Their access times are kept in memory and written with
+    the next update, or once ``ACCESS_BATCH_SIZE`` have built up, so recency is
+    only as fresh as the last write.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_bytes: int = 100 * 1024 * 1024,
+        ttl_seconds: Optional[float] = None,
+        expiry_interval: float = 60.0,
+    ):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self.expiry_interval = expiry_interval
+        self._next_expiry = 0.0
+        self._accessed: Dict[str, float] = {}
+        self._lock = threading.Lock()
+        self.conn = connect(path, SCHEMA)
+        self.reset_stats()
+
+    def _transaction(self) -> Transaction:
+        return Transaction(self.conn, self._lock)
+
+    def reset_stats(self):
+        self.hits = 0
+        self.misses = 0
+        self.expired = 0
+        self.evictions = 0
+        self.bytes_read = 0
+        self.bytes_written = 0
+
+    def lookup(self, prompt: str, llm_string: str) -> Optional[RETURN_VAL_TYPE]:
+        key = cache_key(prompt, llm_string)
+        now = time.time()
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT value, created_at FROM llm_cache WHERE key = ?", (key,)
+            ).fetchone()
+            expired = row is not None and self._is_expired(row[1], now)
+            if row is None or expired:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self.bytes_read += len(row[0])
+                self._accessed[key] = now
+            flush = len(self._accessed) >= ACCESS_BATCH_SIZE
+
+        if expired or flush:
+            with self._transaction() as cur:
+                if expired:
+                    # Unless another process has stored a fresh response since
+                    cur.execute(
+                        "DELETE FROM llm_cache WHERE key = ? AND created_at = ?",
+                        (key, row[1]),
+                    )
+                    self.expired += cur.rowcount
+                self._write_accessed(cur)
+        if row is None or expired:
+            return None
+        return loads(row[0].decode("utf-8"))
+
+    def update(self, prompt: str, llm_string: str, return_val: RETURN_VAL_TYPE):
+        value = dumps(list(return_val)).encode("utf-8")
+        if len(value) > self.max_bytes:
+            return
+
+        now = time.time()
+        key = cache_key(prompt, llm_string)
+        with self._transaction() as cur:
+            # Delete then insert, so the triggers keep the size total right
+            cur.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+            cur.execute(
+                "INSERT INTO llm_cache VALUES (?, ?, ?, ?, ?)",
+                (key, value, len(value), now, now),
+            )
+            self.bytes_written += len(value)
+            self._accessed.pop(key, None)
+            self._write_accessed(cur)
+            self._evict(cur, now)
+
+    def _is_expired(self, created_at: float, now: float) -> bool:
+        return self.ttl_seconds is not None and now - created_at > self.ttl_seconds
+
+    def _write_accessed(self, cur):
+        """Write the access times of hits since the last write; call with the lock"""
+        if self._accessed:
+            cur.executemany(
+                "UPDATE llm_cache SET accessed_at = ? WHERE key = ?",
+                [(accessed_at, key) for key, accessed_at in self._accessed.items()],
+            )
+            self._accessed.clear()
+
+    def _evict(self, cur, now: float):
+        """Drop expired entries, then the least recently used ones over max_bytes"""
+        if self.ttl_seconds is not None and now >= self._next_expiry:
+            self._next_expiry = now + self.expiry_interval
+            cur.execute(
+                "DELETE FROM llm_cache WHERE created_at < ?", (now - self.ttl_seconds,)
+            )
+            self.expired += cur.rowcount
+
+        (total,) = cur.execute("SELECT total FROM llm_cache_size").fetchone()
+        excess = total - self.max_bytes
+        if excess <= 0:
+            return
+
+        victims: List[Tuple[str]] = []
+        for key, size in cur.connection.execute(
+            "SELECT key, size FROM llm_cache ORDER BY accessed_at"
+        ):
+            victims.append((key,))
+            excess -= size
+            if excess <= 0:
+                break
+        cur.executemany("DELETE FROM llm_cache WHERE key = ?", victims)
+        self.evictions += len(victims)
+
+    def clear(self, **kwargs: Any) -> None:
+        with self._transaction() as cur:
+            cur.execute("DELETE FROM llm_cache")
+            self._accessed.clear()
+
+    def close(self):
+        with self._transaction() as cur:
+            self._write_accessed(cur)
+        with self._lock:
+            self.conn.close()
+
+    def stats(self) -> Dict[str, Any]:
+        """Get hit and byte counters for this process, and the cache's size"""
+        with self._lock:
+            (entries,) = self.conn.execute("SELECT COUNT(*) FROM llm_cache").fetchone()
+            (size,) = self.conn.execute("SELECT total FROM llm_cache_size").fetchone()
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "expired": self.expired,
+            "evictions": self.evictions,
+            "bytes_read": self.bytes_read,
+            "bytes_written": self.bytes_written,
+            "entries": entries,
+            "size_bytes": size,
+        }
+
+
+def create_llm_cache(
+    backend: str, path: str, max_bytes: int, ttl_seconds: Optional[float]
+) -> BaseCache:
+    """Build the LLM cache selected in settings"""
+    if backend == "memory":
+        return InMemoryCache()
+    if backend == "sqlite":
+        return SqliteLLMCache(path, max_bytes=max_bytes, ttl_seconds=ttl_seconds)
+    raise ValueError(f"Unknown LLM cache backend: {backend}")
@@ -0,0 +1,342 @@
+import bisect
+import os
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+from uuid import UUID
+
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.outputs import LLMResult
+
+# Seconds; LLM calls dominate the upper range, node overhead the lower one
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+
+METRICS = {
+    "interview_turn_duration_seconds": (
+        "histogram",
+        "Wall time of one graph run, from the candidate's answer to the next pause",
+    ),
+    "interview_node_duration_seconds": ("histogram", "Wall time of a graph node"),
+    "interview_node_errors_total": ("counter", "Graph node runs that raised"),
+    "interview_llm_duration_seconds": ("histogram", "Wall time of an LLM call"),
+    "interview_llm_calls_total": ("counter", "LLM calls, cache hits included"),
+    "interview_llm_cache_hits_total": ("counter", "LLM calls served from the cache"),
+    "interview_llm_prompt_tokens_total": ("counter", "Prompt tokens sent to LLMs"),
+    "interview_llm_completion_tokens_total": (
+        "counter",
+        "Completion tokens returned by LLMs",
+    ),
+    "interview_llm_errors_total": ("counter", "LLM calls that raised"),
+    "interview_llm_retries_total": ("counter", "Retries of failed runnable calls"),
+    "interview_checkpoint_duration_seconds": (
+        "histogram",
+        "Wall time of a checkpointer operation",
+    ),
+    "interview_http_pool_max_connections": (
+        "gauge",
+        "Connection limit of a provider's HTTP pool",
+    ),
+    "interview_http_pool_connections": (
+        "gauge",
+        "Open connections of a provider's HTTP pool, by state",
+    ),
+    "interview_http_pool_requests": (
+        "gauge",
+        "In-flight requests of a provider's HTTP pool, by state",
+    ),
+    "interview_taxonomy_cache_bytes": (
+        "gauge",
+        "Approximate memory of cached taxonomies and their compiled forms",
+    ),
+    "interview_taxonomy_cache_entries": ("gauge", "Taxonomy versions in memory"),
+    "interview_taxonomy_cache_lookups_total": (
+        "counter",
+        "Taxonomy lookups, by whether the taxonomy was in memory",
+    ),
+    "interview_taxonomy_loads_total": ("counter", "Taxonomies loaded from file"),
+    "interview_taxonomy_load_seconds_total": (
+        "counter",
+        "Time spent loading taxonomies from file",
+    ),
+    "interview_taxonomy_evictions_total": (
+        "counter",
+        "Taxonomy versions evicted to stay under the memory cap",
+    ),
+}
+
+Labels = Tuple[Tuple[str, str], ...]
+# Called on render, yielding (name, labels, value) of current gauge readings
+Collector = Callable[[], Iterable[Tuple[str, Dict[str, str], float]]]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(labels: Labels, extra: str = "") -> str:
+    parts = [f'{key}="{_escape(value)}"' for key, value in labels]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+class MetricsRegistry:
+    """Counters, gauges and histograms rendered in the Prometheus text format"""
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self._lock = threading.Lock()
+        self._collectors: List[Collector] = []
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self._counters: Dict[Tuple[str, Labels], float] = {}
+            # Per bucket counts, then the sum and count of observations
+            self._histograms: Dict[Tuple[str, Labels], List[float]] = {}
+
+    def inc(self, name: str, value: float = 1, **labels: str):
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def observe(self, name: str, value: float, **labels: str):
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = [0] * (len(self.buckets) + 3)
+            histogram[bisect.bisect_left(self.buckets, value)] += 1
+            histogram[-2] += value
+            histogram[-1] += 1
+
+    def add_collector(self, collector: Collector):
+        """Read gauges from ``collector`` each time the metrics are rendered"""
+        with self._lock:
+            if collector not in self._collectors:
+                self._collectors.append(collector)
+
+    @contextmanager
+    def timer(self, name: str, **labels: str):
+        """Observe the wall time of a block in seconds"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start, **labels)
+
+    def render(self) -> str:
+        """Render every metric in the Prometheus text exposition format"""
+        with self._lock:
+            counters = sorted(self._counters.items())
+            histograms = sorted(self._histograms.items())
+            collectors = list(self._collectors)
+        gauges = sorted(
+            (name, tuple(sorted(labels.items())), value)
+            for collector in collectors
+            for name, labels, value in collector()
+        )
+
+        lines = []
+        described = set()
+
+        def describe(name: str):
+            if name not in described:
+                kind, description = METRICS.get(name, ("untyped", name))
+                lines.append(f"# HELP {name} {description}")
+                lines.append(f"# TYPE {name} {kind}")
+                described.add(name)
+
+        for (name, labels), value in counters:
+            describe(name)
+            lines.append(f"{name}{_format_labels(labels)} {value:g}")
+
+        for name, labels, value in gauges:
+            describe(name)
+            lines.append(f"{name}{_format_labels(labels)} {value:g}")
+
+        for (name, labels), histogram in histograms:
+            describe(name)
+            cumulative = 0
+            bounds = [f"{bound:g}" for bound in self.buckets] + ["+Inf"]
+            for bound, count in zip(bounds, histogram):
+                cumulative += count
+                le = _format_labels(labels, f'le="{bound}"')
+                lines.append(f"{name}_bucket{le} {cumulative:g}")
+            lines.append(f"{name}_sum{_format_labels(labels)} {histogram[-2]:g}")
+            lines.append(f"{name}_count{_format_labels(labels)} {histogram[-1]:g}")
+
+        return "\n".join(lines) + "\n"
+
+    def write(self, path: str):
+        """Write the metrics to a file atomically, for textfile collectors"""
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with open(f"{path}.tmp", "w", encoding="utf-8") as f:
+            f.write(self.render())
+        os.replace(f"{path}.tmp", path)
+
+
+def token_usage(response: LLMResult) -> Tuple[int, int]:
+    prompt_tokens = completion_tokens = 0
+    for generations in response.generations:
+        for generation in generations:
+            usage = getattr(
+                getattr(generation, "message", None), "usage_metadata", None
+            )
+            if usage:
+                prompt_tokens += usage.get("input_tokens", 0)
+                completion_tokens += usage.get("output_tokens", 0)
+    if not (prompt_tokens or completion_tokens):
+        usage = (response.llm_output or {}).get("token_usage") or {}
+        prompt_tokens = usage.get("prompt_tokens", 0)
+        completion_tokens = usage.get("completion_tokens", 0)
+    return prompt_tokens, completion_tokens
+
+
+class MetricsCallbackHandler(BaseCallbackHandler):
+    """Record graph run, node and LLM call metrics from LangChain callbacks.
+
+    LLM calls are labelled with the graph node that made them. A call is counted
+    as a cache hit when its result has no ``llm_output``: provider clients
+    always report one, while results served from the LLM cache carry none.
+    """
+
+    run_inline = True
+
+    def __init__(self, registry: "MetricsRegistry", metrics_file: Optional[str] = None):
+        self.registry = registry
+        self.metrics_file = metrics_file
+        # Run ID to (kind, node, start time) for the runs being timed
+        self._runs: Dict[UUID, Tuple[str, str, float]] = {}
+        # Run ID to node for every run inside a node, to label retries
+        self._nodes: Dict[UUID, str] = {}
+
+    def on_chain_start(
+        self,
+        serialized: Dict[str, Any],
+        inputs: Any,
+        *,
+        run_id: UUID,
+        parent_run_id: Optional[UUID] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+        **kwargs: Any,
+    ):
+        node = (metadata or {}).get("langgraph_node")
+        if parent_run_id is None:
+            # update_state runs the graph's writers as a separate root run
+            if not kwargs.get("name", "").endswith("UpdateState"):
+                self._runs[run_id] = ("turn", "", time.perf_counter())
+        elif node and not node.startswith("__"):
+            # Nested runs inherit the node's metadata; time only the outermost
+            if parent_run_id not in self._nodes:
+                self._runs[run_id] = ("node", node, time.perf_counter())
+            self._nodes[run_id] = node
+
+    def on_chain_end(self, outputs: Any, *, run_id: UUID, **kwargs: Any):
+        self._nodes.pop(run_id, None)
+        run = self._runs.pop(run_id, None)
+        if run is None:
+            return
+
+        kind, node, start = run
+        elapsed = time.perf_counter() - start
+        if kind == "node":
+            self.registry.observe("interview_node_duration_seconds", elapsed, node=node)
+        else:
+            self.registry.observe("interview_turn_duration_seconds", elapsed)
+            if self.metrics_file:
+                self.registry.write(self.metrics_file)
+
+    def on_chain_error(self, error: BaseException, *, run_id: UUID, **kwargs: Any):
+        self._nodes.pop(run_id, None)
+        run = self._runs.pop(run_id, None)
+        if run is not None and run[0] == "node":
+            self.registry.inc("interview_node_errors_total", node=run[1])
+
+    def on_chat_model_start(
+        self,
+        serialized: Dict[str, Any],
+        messages: Any,
+        *,
+        run_id: UUID,
+        metadata: Optional[Dict[str, Any]] = None,
+        **kwargs: Any,
+    ):
+        node = (metadata or {}).get("langgraph_node", "")
+        self._runs[run_id] = ("llm", node, time.perf_counter())
+
+    on_llm_start = on_chat_model_start
+
+    def on_llm_end(self, response: LLMResult, *, run_id: UUID, **kwargs: Any):
+        run = self._runs.pop(run_id, None)
+        if run is None:
+            return
+
+        _, node, start = run
+        registry = self.registry
+        registry.observe(
+            "interview_llm_duration_seconds", time.perf_counter() - start, node=node
+        )
+        registry.inc("interview_llm_calls_total", node=node)
+        if response.llm_output is None:
+            registry.inc("interview_llm_cache_hits_total", node=node)
+            return
+
+        prompt_tokens, completion_tokens = token_usage(response)
+        registry.inc("interview_llm_prompt_tokens_total", prompt_tokens, node=node)
+        registry.inc(
+            "interview_llm_completion_tokens_total", completion_tokens, node=node
+        )
+
+    def on_llm_error(self, error: BaseException, *, run_id: UUID, **kwargs: Any):
+        run = self._runs.pop(run_id, None)
+        if run is not None:
+            self.registry.inc("interview_llm_errors_total", node=run[1])
+
+    def on_retry(self, retry_state: Any, *, run_id: UUID, **kwargs: Any):
+        node = self._nodes.get(run_id, "")
+        self.registry.inc("interview_llm_retries_total", node=node)
+
+
+class _MetricsRequestHandler(BaseHTTPRequestHandler):
+    registry: "MetricsRegistry"
+
+    def do_GET(self):
+        if self.path.split("?")[0] != "/metrics":
+            self.send_error(404)
+            return
+        body = self.registry.render().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+_servers: Dict[int, ThreadingHTTPServer] = {}
+_servers_lock = threading.Lock()
+
+
+def serve_metrics(
+    registry: "MetricsRegistry", port: int, host: str = "0.0.0.0"
+) -> ThreadingHTTPServer:
+    """Serve ``/metrics`` from a daemon thread, once per port"""
+    with _servers_lock:
+        if port not in _servers:
+            handler = type(
+                "MetricsRequestHandler",
+                (_MetricsRequestHandler,),
+                {"registry": registry},
+            )
+            server = ThreadingHTTPServer((host, port), handler)
+            threading.Thread(target=server.serve_forever, daemon=True).start()
+            _servers[port] = server
+        return _servers[port]
+
+
+metrics = MetricsRegistry()
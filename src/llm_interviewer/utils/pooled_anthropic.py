@@ -0,0 +1,48 @@
+from functools import cached_property
+from typing import Any, Dict
+
+import anthropic
+from langchain_anthropic import ChatAnthropic
+from pydantic import PrivateAttr
+
+from .http_pool import HttpPool
+
+
+class PooledChatAnthropic(ChatAnthropic):
+    """ChatAnthropic whose SDK clients send requests through an ``HttpPool``.
+
+    ChatAnthropic takes no HTTP client, so this overrides the factories of its
+    SDK clients, building them from the model's public fields. The pool is not
+    a field, so it stays out of the serialized model and the LLM cache keys.
+    """
+
+    _http_pool: HttpPool = PrivateAttr()
+
+    def __init__(self, *, http_pool: HttpPool, **kwargs: Any):
+        super().__init__(**kwargs)
+        self._http_pool = http_pool
+
+    def _sdk_params(self) -> Dict[str, Any]:
+        params: Dict[str, Any] = {
+            "api_key": self.anthropic_api_key.get_secret_value(),
+            "base_url": self.anthropic_api_url,
+            "max_retries": self.max_retries,
+            "default_headers": self.default_headers or None,
+        }
+        # A timeout of 0 or less leaves the SDK's default
+        timeout = self.default_request_timeout
+        if timeout is None or timeout > 0:
+            params["timeout"] = timeout
+        return params
+
+    @cached_property
+    def _client(self) -> anthropic.Client:
+        return anthropic.Client(
+            **self._sdk_params(), http_client=self._http_pool.client
+        )
+
+    @cached_property
+    def _async_client(self) -> anthropic.AsyncClient:
+        return anthropic.AsyncClient(
+            **self._sdk_params(), http_client=self._http_pool.async_client
+        )
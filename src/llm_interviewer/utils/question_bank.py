@@ -0,0 +1,228 @@
+import logging
+import os
+import sqlite3
+import threading
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from langchain_core.messages import BaseMessage, HumanMessage, SystemMessage
+
+from ..models.pydantic_models import Question, QuestionPool
+from .sqlite import Transaction, connect
+
+logger = logging.getLogger(__name__)
+
+DIFFICULTIES = ("Beginner", "Intermediate", "Advanced")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS questions (
+    domain TEXT NOT NULL,
+    subdomain TEXT NOT NULL,
+    skill TEXT NOT NULL,
+    knowledge_area TEXT NOT NULL,
+    difficulty TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    question TEXT NOT NULL,
+    topic_focus TEXT NOT NULL,
+    PRIMARY KEY (domain, subdomain, skill, knowledge_area, difficulty, position)
+) WITHOUT ROWID;
+"""
+
+Topic = Tuple[str, str, str]
+# A topic, knowledge area and difficulty the bank holds questions for
+Slot = Tuple[Topic, str, str]
+
+
+def iter_slots(taxonomy: Dict[str, Any]) -> Iterable[Slot]:
+    """List every (skill, knowledge area, difficulty) slot of a taxonomy"""
+    for domain in taxonomy.get("domains", []):
+        for subdomain in domain.get("subdomains", []):
+            for skill in subdomain.get("core_skills", []):
+                topic = (domain["name"], subdomain["name"], skill["name"])
+                for area in skill.get("knowledge_areas") or [skill["name"]]:
+                    for difficulty in DIFFICULTIES:
+                        yield topic, area, difficulty
+
+
+def target_difficulty(scores: Sequence[float]) -> str:
+    """Pick the difficulty of the next question from the candidate's scores"""
+    if not scores:
+        return "Intermediate"
+    mean = sum(scores) / len(scores)
+    if mean >= 0.7:
+        return "Advanced"
+    if mean < 0.4:
+        return "Beginner"
+    return "Intermediate"
+
+
+def build_pool_messages(slot: Slot, count: int) -> List[BaseMessage]:
+    """Build the prompt generating the questions of one bank slot"""
+    (domain, subdomain, skill), area, difficulty = slot
+
+    system_prompt = """You are an expert technical interviewer.
+    Write opening interview questions for a topic, asked before knowing anything
+    about the candidate.
+
+    Each question should:
+    1. Test both theoretical knowledge and practical application
+    2. Match the requested difficulty level
+    3. Allow for meaningful follow-up
+    4. Be clear and unambiguous
+    5. Be distinct from the other questions in the list"""
+
+    return [
+        SystemMessage(content=system_prompt),
+        HumanMessage(
+            content=f"""
+        Topic Focus:
+        - Domain: {domain}
+        - Subdomain: {subdomain}
+        - Skill: {skill}
+        - Knowledge Area: {area}
+
+        Difficulty: {difficulty}
+
+        Generate {count} interview questions."""
+        ),
+    ]
+
+
+class QuestionBank:
+    """Pre-generated opening questions, served from memory.
+
+    The bank is a SQLite file built offline by ``question_bank_builder``. It is
+    read once, on first use, into a dict from topic to questions, so serving is
+    a dict lookup and a short scan. A missing file gives an empty bank.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._index: Optional[Dict[Topic, List[Question]]] = None
+        self._lock = threading.Lock()
+        self.reset_stats()
+
+    def reset_stats(self):
+        self.served = 0
+        self.exhausted = 0
+
+    def _load(self) -> Dict[Topic, List[Question]]:
+        if self._index is not None:
+            return self._index
+
+        with self._lock:
+            if self._index is None:
+                index: Dict[Topic, List[Question]] = {}
+                if os.path.exists(self.path):
+                    conn = sqlite3.connect(f"file:{self.path}?mode=ro", uri=True)
+                    # Interleave knowledge areas, so early picks cover each one
+                    rows = conn.execute(
+                        "SELECT domain, subdomain, skill, difficulty, question, "
+                        "topic_focus FROM questions ORDER BY position, knowledge_area"
+                    )
+                    for domain, subdomain, skill, difficulty, question, focus in rows:
+                        index.setdefault((domain, subdomain, skill), []).append(
+                            Question(
+                                question=question,
+                                topic_focus=focus,
+                                difficulty_level=difficulty,
+                            )
+                        )
+                    conn.close()
+                else:
+                    logger.warning(f"Question bank not found at {self.path}")
+                self._index = index
+        return self._index
+
+    def reload(self):
+        """Read the bank file again on next use"""
+        with self._lock:
+            self._index = None
+
+    def take(
+        self, topic: Topic, asked: Set[str], difficulty: str
+    ) -> Optional[Question]:
+        """Get a question not asked yet, preferring the given difficulty"""
+        fallback = None
+        for question in self._load().get(topic, ()):
+            if question.question in asked:
+                continue
+            if question.difficulty_level == difficulty:
+                fallback = question
+                break
+            fallback = fallback or question
+
+        if fallback is None:
+            self.exhausted += 1
+        else:
+            self.served += 1
+        return fallback
+
+    def stats(self) -> Dict[str, Any]:
+        """Get the number of topics and questions, and of served and missed takes"""
+        index = self._load()
+        return {
+            "topics": len(index),
+            "questions": sum(len(questions) for questions in index.values()),
+            "served": self.served,
+            "exhausted": self.exhausted,
+        }
+
+
+def build_question_bank(
+    taxonomy: Dict[str, Any],
+    path: str,
+    generate: Callable[[List[List[BaseMessage]]], List[QuestionPool]],
+    per_slot: int = 3,
+    batch_size: int = 16,
+) -> int:
+    """Fill the bank at ``path`` with ``per_slot`` questions for every slot.
+
+    ``generate`` maps a batch of prompts to question pools, one per prompt. Slots
+    already holding enough questions are skipped, so an interrupted build resumes
+    where it stopped. Returns the number of questions written.
+    """
+    conn = connect(path, SCHEMA)
+    lock = threading.Lock()
+    existing = {
+        ((domain, subdomain, skill), area, difficulty): count
+        for domain, subdomain, skill, area, difficulty, count in conn.execute(
+            "SELECT domain, subdomain, skill, knowledge_area, difficulty, COUNT(*) "
+            "FROM questions GROUP BY 1, 2, 3, 4, 5"
+        )
+    }
+    pending = [
+        slot for slot in iter_slots(taxonomy) if existing.get(slot, 0) < per_slot
+    ]
+
+    written = 0
+    for first in range(0, len(pending), batch_size):
+        batch = pending[first : first + batch_size]
+        pools = generate([build_pool_messages(slot, per_slot) for slot in batch])
+        with Transaction(conn, lock) as cur:
+            for slot, pool in zip(batch, pools):
+                (domain, subdomain, skill), area, difficulty = slot
+                start = existing.get(slot, 0)
+                rows = [
+                    (
+                        domain,
+                        subdomain,
+                        skill,
+                        area,
+                        difficulty,
+                        position,
+                        question.question,
+                        question.topic_focus,
+                    )
+                    for position, question in enumerate(
+                        pool.questions[: per_slot - start], start=start
+                    )
+                ]
+                cur.executemany(
+                    "INSERT OR REPLACE INTO questions VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    rows,
+                )
+                written += len(rows)
+        logger.info(f"Question bank: {first + len(batch)}/{len(pending)} slots")
+
+    conn.close()
+    return written
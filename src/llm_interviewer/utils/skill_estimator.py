@@ -0,0 +1,102 @@
+from typing import Any, Dict, Iterable, List, Tuple
+
+import numpy as np
+
+# Ability scale, where 0 is the level an Intermediate question is aimed at
+ABILITY_GRID = np.linspace(-4.0, 4.0, 161)
+DIFFICULTIES = {"Beginner": -1.0, "Intermediate": 0.0, "Advanced": 1.0}
+# How sharply the expected score rises with ability around a question's difficulty
+DISCRIMINATION = 1.7
+# Abilities above this pass a skill; expected score 0.5 on an Intermediate question
+PASS_ABILITY = 0.0
+# Spread of a candidate's skills around their overall ability
+SKILL_SPREAD = 0.6
+
+_PRIOR = -0.5 * ABILITY_GRID**2
+# Density of a skill's ability (columns) given the overall ability (rows)
+_SKILL_KERNEL = np.exp(
+    -0.5 * ((ABILITY_GRID[None, :] - ABILITY_GRID[:, None]) / SKILL_SPREAD) ** 2
+)
+_SKILL_KERNEL /= _SKILL_KERNEL.sum(axis=1, keepdims=True)
+
+Response = Tuple[float, float]
+
+
+def difficulty_value(difficulty_level: str) -> float:
+    """Position of a question's difficulty on the ability scale"""
+    return DIFFICULTIES.get(difficulty_level.strip().title(), 0.0)
+
+
+def expected_score(ability: np.ndarray, difficulty: float) -> np.ndarray:
+    return 1.0 / (1.0 + np.exp(-DISCRIMINATION * (ability - difficulty)))
+
+
+def _log_likelihood(responses: Iterable[Response], score_noise: float) -> np.ndarray:
+    """Log likelihood over the grid of quality scores with Gaussian noise"""
+    log_likelihood = np.zeros_like(ABILITY_GRID)
+    for score, difficulty in responses:
+        residual = (score - expected_score(ABILITY_GRID, difficulty)) / score_noise
+        log_likelihood -= 0.5 * residual**2
+    return log_likelihood
+
+
+def _normalize(log_density: np.ndarray) -> np.ndarray:
+    density = np.exp(log_density - log_density.max())
+    return density / density.sum()
+
+
+def _summary(posterior: np.ndarray, responses: List[Response]) -> Dict[str, Any]:
+    mean = float(posterior @ ABILITY_GRID)
+    sd = float(np.sqrt(max(posterior @ (ABILITY_GRID - mean) ** 2, 0.0)))
+    return {
+        "responses": responses,
+        "ability": mean,
+        "sd": sd,
+        "pass_probability": float(posterior[ABILITY_GRID > PASS_ABILITY].sum()),
+    }
+
+
+def update_skill_estimate(
+    estimate: Dict[str, Any], score: float, difficulty: float, score_noise: float
+) -> Dict[str, Any]:
+    """Add an answer to a skill's ability estimate, returning a new estimate.
+
+    The posterior over ability is recomputed on a grid from the skill's
+    answers, so estimates stay small and serializable in interview state.
+    """
+    responses = list(estimate.get("responses", [])) + [
+        [min(max(score, 0.0), 1.0), difficulty]
+    ]
+    posterior = _normalize(_PRIOR + _log_likelihood(responses, score_noise))
+    return _summary(posterior, responses)
+
+
+def overall_estimate(
+    estimates: Iterable[Dict[str, Any]], score_noise: float
+) -> Dict[str, Any]:
+    """Estimate the candidate's overall ability from every skill's answers.
+
+    Each skill's ability is taken to vary around the overall ability by
+    ``SKILL_SPREAD``, so strong answers on one skill say less about the
+    candidate than the same number of answers spread over several skills.
+    """
+    log_posterior = _PRIOR.copy()
+    responses = []
+    for estimate in estimates:
+        skill_likelihood = _normalize(
+            _log_likelihood(estimate["responses"], score_noise)
+        )
+        log_posterior += np.log(_SKILL_KERNEL @ skill_likelihood + 1e-300)
+        responses += estimate["responses"]
+    return _summary(_normalize(log_posterior), responses)
+
+
+def confidence(estimate: Dict[str, Any]) -> float:
+    """Probability that the pass or fail verdict on the estimate is right"""
+    return max(estimate["pass_probability"], 1.0 - estimate["pass_probability"])
+
+
+def target_difficulty_for(estimate: Dict[str, Any]) -> str:
+    """Difficulty closest to the estimated ability, where a question says most"""
+    ability = estimate.get("ability", 0.0)
+    return min(DIFFICULTIES, key=lambda level: abs(DIFFICULTIES[level] - ability))
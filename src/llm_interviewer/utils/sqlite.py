@@ -0,0 +1,51 @@
+import os
+import sqlite3
+import threading
+
+BUSY_TIMEOUT_MS = 5000
+
+
+def connect(path: str, schema: str) -> sqlite3.Connection:
+    """Open a SQLite file in WAL mode, shareable by threads and worker processes.
+
+    WAL lets readers proceed while a writer commits, and ``busy_timeout`` makes
+    processes on the same host wait for the write lock instead of failing.
+    Callers serialize use of the connection across threads with their own lock.
+    """
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+
+    conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+    conn.execute(f"PRAGMA busy_timeout={BUSY_TIMEOUT_MS}")
+    conn.execute("PRAGMA journal_mode=WAL")
+    # Safe under WAL: a power loss can drop the last commits, never corrupt
+    conn.execute("PRAGMA synchronous=NORMAL")
+    # One transaction, so processes starting together create the schema once
+    conn.executescript(f"BEGIN IMMEDIATE;\n{schema}\nCOMMIT;")
+    return conn
+
+
+class Transaction:
+    """Hold the connection lock for one ``BEGIN IMMEDIATE`` transaction"""
+
+    def __init__(self, conn: sqlite3.Connection, lock: threading.Lock):
+        self.conn = conn
+        self.lock = lock
+
+    def __enter__(self) -> sqlite3.Cursor:
+        self.lock.acquire()
+        try:
+            # Take the write lock up front so concurrent writers queue on
+            # busy_timeout instead of failing to upgrade a read lock
+            self.cursor = self.conn.execute("BEGIN IMMEDIATE")
+        except BaseException:
+            # Still locked after busy_timeout: fail this write, not every later one
+            self.lock.release()
+            raise
+        return self.cursor
+
+    def __exit__(self, exc_type, exc, tb):
+        try:
+            self.conn.execute("ROLLBACK" if exc_type else "COMMIT")
+        finally:
+            self.lock.release()
+        return False
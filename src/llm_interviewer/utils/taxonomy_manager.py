@@ -1,9 +1,8 @@
 import json
-import os
-from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 from ..config.taxonomy import get_taxonomy_summary, load_taxonomy, validate_taxonomy
+from .compiled_taxonomy import CompiledTaxonomy, SkillNode
 
 
 class TaxonomyManager:
@@ -12,6 +11,14 @@ class TaxonomyManager:
     def __init__(self, taxonomy_path: str = None):
         self.taxonomy_path = taxonomy_path
         self.taxonomy = load_taxonomy(taxonomy_path)
+        self._compiled: Optional[CompiledTaxonomy] = None
+
+    @property
+    def compiled(self) -> CompiledTaxonomy:
+        """Indexed form of the current taxonomy, rebuilt after each change"""
+        if self._compiled is None:
+            self._compiled = CompiledTaxonomy(self.taxonomy)
+        return self._compiled
 
     def load_from_file(self, file_path: str) -> Dict[str, Any]:
         """Load taxonomy from a specific file"""
@@ -29,6 +36,7 @@ class TaxonomyManager:
         new_domain = {"name": domain_name, "subdomains": subdomains or []}
 
         self.taxonomy["domains"].append(new_domain)
+        self._compiled = None
         return self.taxonomy
 
     def add_subdomain(self, domain_name: str, subdomain_data: Dict):
@@ -38,6 +46,7 @@ class TaxonomyManager:
                 if "subdomains" not in domain:
                     domain["subdomains"] = []
                 domain["subdomains"].append(subdomain_data)
+                self._compiled = None
                 return self.taxonomy
 
         raise ValueError(f"Domain '{domain_name}' not found")
@@ -49,6 +58,7 @@ class TaxonomyManager:
             for domain in self.taxonomy["domains"]
             if domain["name"] != domain_name
         ]
+        self._compiled = None
         return self.taxonomy
 
     def get_summary(self) -> Dict[str, Any]:
@@ -61,11 +71,22 @@ class TaxonomyManager:
 
     def list_subdomains(self, domain_name: str) -> List[str]:
         """Get list of subdomain names for a specific domain"""
-        for domain in self.taxonomy["domains"]:
-            if domain["name"] == domain_name:
-                return [subdomain["name"] for subdomain in domain.get("subdomains", [])]
-
-        raise ValueError(f"Domain '{domain_name}' not found")
+        domain = self.compiled.domain(domain_name)
+        if domain is None:
+            raise ValueError(f"Domain '{domain_name}' not found")
+        return [subdomain.name for subdomain in domain.subdomains]
+
+    def get_skill(
+        self, domain_name: str, subdomain_name: str, skill_name: str
+    ) -> Optional[SkillNode]:
+        """Get a skill by its exact path, or None if it does not exist"""
+        return self.compiled.skill(domain_name, subdomain_name, skill_name)
+
+    def snap_topic(
+        self, domain_name: str, subdomain_name: str, skill_name: str
+    ) -> Optional[SkillNode]:
+        """Resolve a possibly inexact topic to the closest real skill"""
+        return self.compiled.snap(domain_name, subdomain_name, skill_name)
 
     def export_to_dict(self) -> Dict[str, Any]:
         """Export current taxonomy as dictionary"""
@@ -0,0 +1,233 @@
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from itertools import zip_longest
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .tokens import CHARS_PER_TOKEN, estimate_tokens
+
+# Compact form of a taxonomy: (domain, ((subdomain, ((skill, details), ...)), ...))
+CompactSkills = Tuple[Tuple[str, str], ...]
+CompactTaxonomy = Tuple[Tuple[str, Tuple[Tuple[str, CompactSkills], ...]], ...]
+
+_COMPACT_CACHE_SIZE = 32
+_RENDER_CACHE_SIZE = 256
+
+_compact_cache: "OrderedDict[str, CompactTaxonomy]" = OrderedDict()
+_render_cache: "OrderedDict[Tuple[Any, ...], str]" = OrderedDict()
+_cache_lock = threading.Lock()
+
+FORMAT_HINT = (
+    "Format: [Domain] / Subdomain / - Skill: knowledge areas; "
+    "apps: practical applications"
+)
+
+
+def taxonomy_version(taxonomy: Dict[str, Any]) -> str:
+    """Get a stable content hash identifying a taxonomy version"""
+    payload = json.dumps(
+        taxonomy, sort_keys=True, separators=(",", ":"), ensure_ascii=False
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+
+def _skill_details(skill: Dict[str, Any]) -> str:
+    """Render the knowledge areas and applications of a skill on one line"""
+    parts = []
+    if skill.get("knowledge_areas"):
+        parts.append(", ".join(skill["knowledge_areas"]))
+    if skill.get("practical_applications"):
+        parts.append("apps: " + ", ".join(skill["practical_applications"]))
+    return "; ".join(parts)
+
+
+def _compile(taxonomy: Dict[str, Any]) -> CompactTaxonomy:
+    """Flatten a taxonomy dict into the compact tuple form"""
+    return tuple(
+        (
+            domain["name"],
+            tuple(
+                (
+                    subdomain["name"],
+                    tuple(
+                        (skill["name"], _skill_details(skill))
+                        for skill in subdomain.get("core_skills", [])
+                    ),
+                )
+                for subdomain in domain.get("subdomains", [])
+            ),
+        )
+        for domain in taxonomy.get("domains", [])
+    )
+
+
+def _cache_get(cache: OrderedDict, key: Any) -> Any:
+    with _cache_lock:
+        value = cache.get(key)
+        if value is not None:
+            cache.move_to_end(key)
+        return value
+
+
+def _cache_put(cache: OrderedDict, key: Any, value: Any, max_size: int) -> None:
+    with _cache_lock:
+        cache[key] = value
+        cache.move_to_end(key)
+        while len(cache) > max_size:
+            cache.popitem(last=False)
+
+
+def _get_compact(taxonomy: Dict[str, Any], version: str) -> CompactTaxonomy:
+    compact = _cache_get(_compact_cache, version)
+    if compact is None:
+        compact = _compile(taxonomy)
+        _cache_put(_compact_cache, version, compact, _COMPACT_CACHE_SIZE)
+    return compact
+
+
+def _covered_key(topics_covered: Iterable[Dict[str, Any]]) -> frozenset:
+    return frozenset(
+        (topic.get("domain", ""), topic.get("subdomain", ""), topic.get("skill", ""))
+        for topic in topics_covered
+    )
+
+
+def _prune(compact: CompactTaxonomy, covered: frozenset) -> CompactTaxonomy:
+    """Drop covered skills and any subdomains or domains left without skills"""
+    pruned = []
+    for domain, subdomains in compact:
+        kept_subdomains = []
+        for subdomain, skills in subdomains:
+            kept_skills = tuple(
+                skill
+                for skill in skills
+                if (domain, subdomain, skill[0]) not in covered
+            )
+            if kept_skills:
+                kept_subdomains.append((subdomain, kept_skills))
+        if kept_subdomains:
+            pruned.append((domain, tuple(kept_subdomains)))
+    return tuple(pruned)
+
+
+def _render_lines(compact: CompactTaxonomy, with_details: bool) -> List[str]:
+    lines = []
+    for domain, subdomains in compact:
+        lines.append(f"[{domain}]")
+        for subdomain, skills in subdomains:
+            lines.append(f" {subdomain}")
+            for skill, details in skills:
+                if with_details and details:
+                    lines.append(f"  - {skill}: {details}")
+                else:
+                    lines.append(f"  - {skill}")
+    return lines
+
+
+def _fit_to_budget(compact: CompactTaxonomy, token_budget: int) -> str:
+    """Keep as many skills as fit the budget, interleaving domains for balance"""
+    paths = [
+        [
+            (domain_idx, subdomain_idx, skill_idx)
+            for subdomain_idx, (_, skills) in enumerate(subdomains)
+            for skill_idx in range(len(skills))
+        ]
+        for domain_idx, (_, subdomains) in enumerate(compact)
+    ]
+    interleaved = [
+        path for group in zip_longest(*paths) for path in group if path is not None
+    ]
+
+    # Counted in characters of the final text, with the format hint and line
+    # prefixes and newlines, since estimate_tokens rounds the whole text up once.
+    # Room is kept for the omitted line at its longest count.
+    omitted_template = "(+{} more skills omitted to fit the prompt budget)"
+    selected = set()
+    used = len(FORMAT_HINT) + 1 + len(omitted_template.format(len(interleaved)))
+    seen_headers = set()
+    for domain_idx, subdomain_idx, skill_idx in interleaved:
+        domain, subdomains = compact[domain_idx]
+        subdomain, skills = subdomains[subdomain_idx]
+        cost = len(f"  - {skills[skill_idx][0]}\n")
+        if domain_idx not in seen_headers:
+            cost += len(f"[{domain}]\n")
+        if (domain_idx, subdomain_idx) not in seen_headers:
+            cost += len(f" {subdomain}\n")
+        if used + cost > token_budget * CHARS_PER_TOKEN:
+            break
+        used += cost
+        seen_headers.update([domain_idx, (domain_idx, subdomain_idx)])
+        selected.add((domain_idx, subdomain_idx, skill_idx))
+
+    trimmed = []
+    for domain_idx, (domain, subdomains) in enumerate(compact):
+        kept_subdomains = []
+        for subdomain_idx, (subdomain, skills) in enumerate(subdomains):
+            kept_skills = tuple(
+                (skill, "")
+                for skill_idx, (skill, _) in enumerate(skills)
+                if (domain_idx, subdomain_idx, skill_idx) in selected
+            )
+            if kept_skills:
+                kept_subdomains.append((subdomain, kept_skills))
+        if kept_subdomains:
+            trimmed.append((domain, tuple(kept_subdomains)))
+
+    lines = _render_lines(tuple(trimmed), with_details=False)
+    omitted = len(interleaved) - len(selected)
+    if omitted:
+        lines.append(omitted_template.format(omitted))
+    return "\n".join(lines)
+
+
+def render_taxonomy_for_prompt(
+    taxonomy: Dict[str, Any],
+    topics_covered: Iterable[Dict[str, Any]] = (),
+    token_budget: Optional[int] = None,
+    version: Optional[str] = None,
+) -> str:
+    """Render a taxonomy as compact text for topic selection prompts.
+
+    Skills already in ``topics_covered`` are left out, along with subdomains and
+    domains that have nothing left to ask about. When everything has been covered
+    the full taxonomy is rendered so the interview can revisit topics. If the
+    rendering exceeds ``token_budget`` the details are dropped first, then skills
+    are trimmed evenly across domains.
+    """
+    version = version or taxonomy_version(taxonomy)
+    covered = _covered_key(topics_covered)
+    cache_key = (version, covered, token_budget)
+
+    rendered = _cache_get(_render_cache, cache_key)
+    if rendered is not None:
+        return rendered
+
+    compact = _get_compact(taxonomy, version)
+    pruned = _prune(compact, covered) if covered else compact
+    if not pruned:
+        pruned = compact
+
+    rendered = "\n".join([FORMAT_HINT] + _render_lines(pruned, with_details=True))
+    if token_budget is not None and estimate_tokens(rendered) > token_budget:
+        rendered = "\n".join([FORMAT_HINT] + _render_lines(pruned, with_details=False))
+        if estimate_tokens(rendered) > token_budget:
+            rendered = FORMAT_HINT + "\n" + _fit_to_budget(pruned, token_budget)
+
+    _cache_put(_render_cache, cache_key, rendered, _RENDER_CACHE_SIZE)
+    return rendered
+
+
+def clear_taxonomy_prompt_cache() -> None:
+    """Clear all cached taxonomy renderings"""
+    with _cache_lock:
+        _compact_cache.clear()
+        _render_cache.clear()
+
+
+def evict_taxonomy_prompt_cache(version: str) -> None:
+    """Drop the cached renderings of one taxonomy version"""
+    with _cache_lock:
+        _compact_cache.pop(version, None)
+        for key in [key for key in _render_cache if key[0] == version]:
+            del _render_cache[key]
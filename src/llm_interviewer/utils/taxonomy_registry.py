@@ -0,0 +1,400 @@
+import json
+import logging
+import os
+import re
+import sys
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+from ..config.taxonomy import load_taxonomy
+from .compiled_taxonomy import CompiledTaxonomy
+from .taxonomy_prompt import evict_taxonomy_prompt_cache, taxonomy_version
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TAXONOMY_ID = "default"
+
+# IDs looked up as file names in source directories, so no path separators
+_TAXONOMY_ID = re.compile(r"[A-Za-z0-9_-]+")
+
+
+def _deep_size(obj: Any, include_strings: bool = True) -> int:
+    """Approximate bytes held by a taxonomy or its compiled form"""
+    seen = set()
+    stack = [obj]
+    total = 0
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen or (isinstance(obj, str) and not include_strings):
+            continue
+        seen.add(id(obj))
+        total += sys.getsizeof(obj)
+        if isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, (list, tuple)):
+            stack.extend(obj)
+        elif hasattr(obj, "__slots__"):
+            stack.extend(getattr(obj, name, None) for name in obj.__slots__)
+    return total
+
+
+class TaxonomyRegistry:
+    """Process-wide store of taxonomies keyed by ID and content version.
+
+    Interview state only carries ``taxonomy_id`` and ``taxonomy_version``, so the
+    taxonomy itself is not serialized into every checkpoint. Every registered
+    version stays resolvable, which keeps in-flight interviews on the taxonomy
+    they started with.
+
+    IDs with a source file are loaded on first use. Under ``max_bytes`` the
+    least recently used of those are evicted, along with their compiled and
+    prompt-rendered forms, and loaded again when next needed.
+
+    With a version store, every registered version is also written to
+    ``<store>/<taxonomy_id>/<version>.json``. A pinned version that is not in
+    memory, e.g. after a restart with an edited source file, is loaded from there,
+    so stored versions are evicted like sourced ones once no interview uses them
+    recently. Without a store only the version last loaded from a source can be
+    loaded again, and other versions are never evicted.
+    """
+
+    def __init__(self, max_bytes: Optional[int] = None):
+        self.max_bytes = max_bytes
+        # Least recently used first
+        self._taxonomies: "OrderedDict[Tuple[str, str], Dict[str, Any]]" = OrderedDict()
+        self._compiled: Dict[Tuple[str, str], CompiledTaxonomy] = {}
+        self._sizes: Dict[Tuple[str, str], int] = {}
+        self._latest: Dict[str, str] = {}
+        self._sources: Dict[str, Path] = {}
+        self._source_dirs: List[Path] = []
+        # Version each ID's source had when last loaded, the only one it can reload
+        self._source_versions: Dict[str, str] = {}
+        self._version_dir: Optional[Path] = None
+        # Versions known to be in the version store
+        self._stored: Set[Tuple[str, str]] = set()
+        self._load_locks: Dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+        self.reset_stats()
+
+    def reset_stats(self):
+        self.hits = 0
+        self.misses = 0
+        self.loads = 0
+        self.load_seconds = 0.0
+        self.evictions = 0
+
+    def add_source(self, taxonomy_id: str, path: str | Path):
+        """Load ``taxonomy_id`` from a file when it is first used"""
+        self._sources[taxonomy_id] = Path(path)
+
+    def add_source_dir(self, path: str | Path):
+        """Load any other ID from ``<path>/<taxonomy_id>.json`` when first used"""
+        self._source_dirs.append(Path(path))
+
+    def add_version_store(self, path: str | Path):
+        """Keep every registered version in ``path``, to resolve it after restarts"""
+        self._version_dir = Path(path)
+
+    def _version_path(self, taxonomy_id: str, version: str) -> Optional[Path]:
+        if self._version_dir is None or not _TAXONOMY_ID.fullmatch(taxonomy_id):
+            return None
+        if not _TAXONOMY_ID.fullmatch(version):
+            return None
+        return self._version_dir / taxonomy_id / f"{version}.json"
+
+    def _store(self, taxonomy_id: str, version: str, taxonomy: Dict[str, Any]):
+        """Atomically write a version to the store, unless it is already there"""
+        path = self._version_path(taxonomy_id, version)
+        if path is None or (taxonomy_id, version) in self._stored:
+            return
+        try:
+            if not path.exists():
+                path.parent.mkdir(parents=True, exist_ok=True)
+                fd, tmp_path = tempfile.mkstemp(
+                    dir=path.parent, prefix=f".{path.name}."
+                )
+                try:
+                    with os.fdopen(fd, "w", encoding="utf-8") as f:
+                        json.dump(taxonomy, f, ensure_ascii=False)
+                    os.replace(tmp_path, path)
+                except BaseException:
+                    os.unlink(tmp_path)
+                    raise
+        except (OSError, ValueError) as e:
+            logger.warning(f"Could not store taxonomy '{taxonomy_id}' {version}: {e}")
+            return
+        self._stored.add((taxonomy_id, version))
+
+    def _load_version(self, taxonomy_id: str, version: str) -> Optional[Dict[str, Any]]:
+        """Load a version from the store, if it is there; counts as a cache miss"""
+        path = self._version_path(taxonomy_id, version)
+        if path is None:
+            return None
+
+        with self._lock:
+            load_lock = self._load_locks.setdefault(taxonomy_id, threading.Lock())
+        with load_lock:
+            taxonomy = self._taxonomies.get((taxonomy_id, version))
+            if taxonomy is not None:
+                return taxonomy
+            start = time.perf_counter()
+            try:
+                with open(path, encoding="utf-8") as f:
+                    taxonomy = json.load(f)
+            except FileNotFoundError:
+                return None
+            except (OSError, ValueError) as e:
+                logger.warning(f"Could not load stored taxonomy {path}: {e}")
+                return None
+            self.misses += 1
+            # Content addressed, so a file that does not hash to its name is corrupt
+            if taxonomy_version(taxonomy) != version:
+                logger.warning(f"Stored taxonomy {path} does not match its version")
+                return None
+            self._stored.add((taxonomy_id, version))
+            self.register(taxonomy, taxonomy_id, latest=False)
+            self.loads += 1
+            self.load_seconds += time.perf_counter() - start
+            logger.info(
+                f"Loaded taxonomy '{taxonomy_id}' version {version} from {path}"
+            )
+        return taxonomy
+
+    def _source(self, taxonomy_id: str) -> Optional[Path]:
+        source = self._sources.get(taxonomy_id)
+        if source is not None or not _TAXONOMY_ID.fullmatch(taxonomy_id):
+            return source
+        for source_dir in self._source_dirs:
+            path = source_dir / f"{taxonomy_id}.json"
+            if path.is_file():
+                return path
+        return None
+
+    def _load(self, taxonomy_id: str) -> Optional[str]:
+        """Load a taxonomy from its source, if it has one, and return its version.
+
+        It becomes the latest version unless another one was promoted over the
+        source's. Each load counts as a cache miss.
+        """
+        source = self._source(taxonomy_id)
+        if source is None:
+            return None
+
+        with self._lock:
+            load_lock = self._load_locks.setdefault(taxonomy_id, threading.Lock())
+        # Loads of one ID wait for each other, other IDs carry on
+        with load_lock:
+            version = self._source_versions.get(taxonomy_id)
+            if version and (taxonomy_id, version) in self._taxonomies:
+                return version
+            self.misses += 1
+            start = time.perf_counter()
+            taxonomy = load_taxonomy(source, validate=True)
+            latest = self._latest.get(taxonomy_id) in (None, version)
+            version = taxonomy_version(taxonomy)
+            self._source_versions[taxonomy_id] = version
+            self.register(taxonomy, taxonomy_id, latest=latest)
+            self.loads += 1
+            self.load_seconds += time.perf_counter() - start
+            logger.info(f"Loaded taxonomy '{taxonomy_id}' from {source}")
+        return version
+
+    def register(
+        self,
+        taxonomy: Dict[str, Any],
+        taxonomy_id: str = DEFAULT_TAXONOMY_ID,
+        latest: bool = True,
+    ) -> str:
+        """Register a taxonomy version and return it.
+
+        With ``latest=False`` the version only serves interviews pinned to it, and
+        new interviews keep using the current latest version, even if there is
+        none yet.
+        """
+        version = taxonomy_version(taxonomy)
+        key = (taxonomy_id, version)
+        size = _deep_size(taxonomy) if key not in self._taxonomies else 0
+        with self._lock:
+            if key not in self._taxonomies:
+                self._taxonomies[key] = taxonomy
+                self._sizes[key] = size
+            self._taxonomies.move_to_end(key)
+            if latest:
+                self._latest[taxonomy_id] = version
+            evicted = self._evict()
+        self._drop_prompt_caches(evicted)
+        self._store(taxonomy_id, version, taxonomy)
+        return version
+
+    def get(self, taxonomy_id: str, version: Optional[str] = None) -> Dict[str, Any]:
+        """Get a taxonomy by ID, at a given version or the latest one"""
+        version = version or self._latest.get(taxonomy_id)
+        key = (taxonomy_id, version)
+        with self._lock:
+            taxonomy = self._taxonomies.get(key)
+            if taxonomy is not None:
+                self.hits += 1
+                self._taxonomies.move_to_end(key)
+                return taxonomy
+
+        # Not loaded yet, or evicted: load the source's version, or a stored one
+        loaded = self._load(taxonomy_id)
+        if loaded is not None and version in (None, loaded):
+            taxonomy = self._taxonomies.get((taxonomy_id, loaded))
+            if taxonomy is not None:
+                return taxonomy
+        if version is not None:
+            taxonomy = self._load_version(taxonomy_id, version)
+            if taxonomy is not None:
+                return taxonomy
+        raise KeyError(f"Taxonomy '{taxonomy_id}' version {version} is not registered")
+
+    def compiled(
+        self, taxonomy_id: str, version: Optional[str] = None
+    ) -> CompiledTaxonomy:
+        """Get the indexed form of a taxonomy, compiled on first use"""
+        version = version or self.latest_version(taxonomy_id)
+        taxonomy = self.get(taxonomy_id, version)
+        key = (taxonomy_id, version)
+        compiled = self._compiled.get(key)
+        if compiled is None:
+            compiled = CompiledTaxonomy(taxonomy)
+            # Names are shared with the taxonomy, so only the nodes add to its size
+            size = _deep_size(compiled, include_strings=False)
+            with self._lock:
+                if key in self._taxonomies and key not in self._compiled:
+                    self._compiled[key] = compiled
+                    self._sizes[key] = self._sizes.get(key, 0) + size
+                    evicted = self._evict()
+                else:
+                    evicted = []
+            self._drop_prompt_caches(evicted)
+        return compiled
+
+    def _evict(self) -> List[Tuple[str, str]]:
+        """Drop least recently used entries until under the cap; call with the lock"""
+        if self.max_bytes is None:
+            return []
+        evicted = []
+        total = sum(self._sizes.values())
+        # The most recently used entry stays, even if it is over the cap alone
+        candidates = [
+            key
+            for key in list(self._taxonomies)[:-1]
+            if self._source_versions.get(key[0]) == key[1] or key in self._stored
+        ]
+        for key in candidates:
+            if total <= self.max_bytes:
+                break
+            del self._taxonomies[key]
+            self._compiled.pop(key, None)
+            total -= self._sizes.pop(key, 0)
+            self.evictions += 1
+            evicted.append(key)
+        return evicted
+
+    def _drop_prompt_caches(self, evicted: List[Tuple[str, str]]):
+        for taxonomy_id, version in evicted:
+            evict_taxonomy_prompt_cache(version)
+            logger.info(f"Evicted taxonomy '{taxonomy_id}' version {version}")
+
+    def promote(self, taxonomy_id: str, version: str):
+        """Make a registered version the one new interviews start with"""
+        self.get(taxonomy_id, version)
+        with self._lock:
+            self._latest[taxonomy_id] = version
+
+    def has(self, taxonomy_id: str, version: str) -> bool:
+        """Whether a version is in memory; an evicted one may still be loadable"""
+        return (taxonomy_id, version) in self._taxonomies
+
+    def has_latest(self, taxonomy_id: str) -> bool:
+        return taxonomy_id in self._latest
+
+    def latest_version(self, taxonomy_id: str) -> str:
+        """Version new interviews use, loading the taxonomy if it is not known yet"""
+        version = self._latest.get(taxonomy_id) or self._load(taxonomy_id)
+        if version is None:
+            raise KeyError(f"Taxonomy '{taxonomy_id}' is not registered")
+        return version
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._taxonomies),
+                "compiled": len(self._compiled),
+                "bytes": sum(self._sizes.values()),
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "loads": self.loads,
+                "load_seconds": self.load_seconds,
+                "evictions": self.evictions,
+            }
+
+    def clear(self):
+        with self._lock:
+            self._taxonomies.clear()
+            self._compiled.clear()
+            self._sizes.clear()
+            self._latest.clear()
+            self._source_versions.clear()
+
+
+taxonomy_registry = TaxonomyRegistry()
+
+
+def resolve_taxonomy(state: Dict[str, Any]) -> Tuple[Dict[str, Any], Optional[str]]:
+    """Get the taxonomy an interview state refers to, with its version if known"""
+    taxonomy_id = state.get("taxonomy_id")
+    if not taxonomy_id:
+        # States saved before taxonomies were stored by reference carry a copy
+        return state.get("taxonomy") or {"domains": []}, None
+
+    version = state.get("taxonomy_version")
+    if version:
+        # A pinned version that is gone raises, rather than changing the interview's
+        # taxonomy part way through
+        return taxonomy_registry.get(taxonomy_id, version), version
+    version = taxonomy_registry.latest_version(taxonomy_id)
+    return taxonomy_registry.get(taxonomy_id, version), version
+
+
+def taxonomy_registry_metrics() -> Iterator[Tuple[str, Dict[str, str], float]]:
+    """Registry cache readings as metrics, for MetricsRegistry collectors"""
+    stats = taxonomy_registry.stats()
+    yield "interview_taxonomy_cache_bytes", {}, stats["bytes"]
+    yield "interview_taxonomy_cache_entries", {}, stats["entries"]
+    for result in ("hits", "misses"):
+        labels = {"result": result}
+        yield "interview_taxonomy_cache_lookups_total", labels, stats[result]
+    yield "interview_taxonomy_loads_total", {}, stats["loads"]
+    yield "interview_taxonomy_load_seconds_total", {}, stats["load_seconds"]
+    yield "interview_taxonomy_evictions_total", {}, stats["evictions"]
+
+
+def resolve_compiled_taxonomy(state: Dict[str, Any]) -> CompiledTaxonomy:
+    """Get the indexed form of the taxonomy an interview state refers to"""
+    taxonomy, version = resolve_taxonomy(state)
+    if version is None:
+        return CompiledTaxonomy(taxonomy)
+    return taxonomy_registry.compiled(state["taxonomy_id"], version)
+
+
+def migrate_taxonomy_reference(state: Dict[str, Any]) -> Dict[str, Any]:
+    """State update replacing an inline taxonomy copy with a registry reference"""
+    if state.get("taxonomy_id") or not state.get("taxonomy"):
+        return {}
+    version = taxonomy_registry.register(state["taxonomy"], latest=False)
+    return {
+        "taxonomy_id": DEFAULT_TAXONOMY_ID,
+        "taxonomy_version": version,
+        "taxonomy": {},
+    }
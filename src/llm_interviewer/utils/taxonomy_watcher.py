@@ -0,0 +1,97 @@
+import logging
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from ..config.taxonomy import load_taxonomy
+from ..config.taxonomy_snapshot import source_digest
+from .taxonomy_registry import TaxonomyRegistry
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _WatchedFile:
+    path: Path
+    stat_key: Optional[Tuple[int, int]] = None
+    digest: Optional[str] = None
+
+
+class TaxonomyWatcher:
+    """Reload taxonomy files into a registry when they change.
+
+    Each poll is a ``stat`` per file. A changed mtime or size is confirmed by
+    hashing the content, and only a new hash loads the file. The new version is
+    registered and compiled before it becomes the latest, so new interviews
+    switch over in one step while interviews already under way stay pinned to
+    the version they started with. With a version store on the registry, every
+    version is written there when registered, so replaced versions are evicted
+    once no interview uses them and outlive a restart. A file that fails to load
+    or validate is logged and the previous version keeps serving.
+    """
+
+    def __init__(self, registry: TaxonomyRegistry, interval: float = 5.0):
+        self.registry = registry
+        self.interval = interval
+        self.reloads = 0
+        self.errors = 0
+        self._files: Dict[str, _WatchedFile] = {}
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def watch(self, path: str | Path, taxonomy_id: str):
+        """Watch a file, loading it on the next poll"""
+        self._files[taxonomy_id] = _WatchedFile(Path(path))
+
+    def poll(self) -> List[str]:
+        """Check every watched file once, returning the IDs that were reloaded"""
+        reloaded = []
+        for taxonomy_id, watched in list(self._files.items()):
+            try:
+                if self._check(taxonomy_id, watched):
+                    reloaded.append(taxonomy_id)
+            except (OSError, ValueError) as e:
+                self.errors += 1
+                logger.warning(f"Keeping the current '{taxonomy_id}' taxonomy: {e}")
+        return reloaded
+
+    def _check(self, taxonomy_id: str, watched: _WatchedFile) -> bool:
+        stat = watched.path.stat()
+        stat_key = (stat.st_mtime_ns, stat.st_size)
+        if stat_key == watched.stat_key:
+            return False
+
+        digest = source_digest(watched.path.read_bytes())
+        if digest == watched.digest:
+            watched.stat_key = stat_key
+            return False
+
+        taxonomy = load_taxonomy(watched.path, validate=True)
+        version = self.registry.register(taxonomy, taxonomy_id, latest=False)
+        self.registry.compiled(taxonomy_id, version)
+        self.registry.promote(taxonomy_id, version)
+        watched.stat_key, watched.digest = stat_key, digest
+        self.reloads += 1
+        logger.info(f"Loaded taxonomy '{taxonomy_id}' version {version}")
+        return True
+
+    def start(self) -> threading.Thread:
+        """Poll in a background thread until stopped"""
+        if self._thread is None or not self._thread.is_alive():
+            self._stop.clear()
+            self._thread = threading.Thread(
+                target=self._run, name="taxonomy-watcher", daemon=True
+            )
+            self._thread.start()
+        return self._thread
+
+    def _run(self):
+        while not self._stop.is_set():
+            self.poll()
+            self._stop.wait(self.interval)
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
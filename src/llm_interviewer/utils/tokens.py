@@ -0,0 +1,16 @@
+from typing import Iterable
+
+# Rough average for English text with OpenAI/Anthropic tokenizers
+CHARS_PER_TOKEN = 4
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate the number of tokens in a piece of text without a tokenizer"""
+    if not text:
+        return 0
+    return max(1, (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN)
+
+
+def estimate_messages_tokens(messages: Iterable) -> int:
+    """Estimate the number of tokens across a list of chat messages"""
+    return sum(estimate_tokens(str(msg.content)) for msg in messages)
@@ -0,0 +1,135 @@
+from collections import Counter
+from typing import Any, Dict, List, Optional
+
+from ..models.pydantic_models import TopicSelection
+from .compiled_taxonomy import CompiledTaxonomy, DomainNode, SkillNode, SkillPath
+
+# Default relative weights of the scheduling signals. A skill covered once has
+# half the uncovered weight left, so its borderline term beats an uncovered
+# skill of the same domain only when BORDERLINE_WEIGHT * borderline score is
+# above UNCOVERED_WEIGHT / 2. With these defaults that never happens, and a
+# borderline skill is revisited first only over uncovered skills of domains
+# covered more often, or once its domain has no uncovered skills left.
+UNCOVERED_WEIGHT = 1.0
+DOMAIN_BALANCE_WEIGHT = 0.5
+BORDERLINE_WEIGHT = 0.4
+
+# Scores in this band leave the verdict on a skill undecided
+BORDERLINE_LOW = 0.3
+BORDERLINE_HIGH = 0.7
+RECENT_SCORES = 3
+
+
+def topic_key(domain: str, subdomain: str, skill: str) -> str:
+    """Build the topic label used in evaluation records"""
+    return f"{domain} - {subdomain} - {skill}"
+
+
+def _first_unseen(
+    domain: DomainNode, seen: Dict[SkillPath, SkillNode]
+) -> Optional[SkillNode]:
+    for subdomain in domain.subdomains:
+        for skill in subdomain.skills:
+            if skill.path not in seen:
+                return skill
+    return None
+
+
+def _borderline_score(scores: List[float]) -> float:
+    """How undecided recent scores are, from 0 (clear verdict) to 1 (coin flip)"""
+    if not scores:
+        return 0.0
+    mean = sum(scores) / len(scores)
+    if not BORDERLINE_LOW <= mean <= BORDERLINE_HIGH:
+        return 0.0
+    return 1.0 - abs(mean - 0.5) / 0.5
+
+
+def select_next_topic(
+    taxonomy: CompiledTaxonomy,
+    topics_covered: List[Dict[str, Any]],
+    overall_performance: List[Dict[str, Any]],
+    current_domain: str = "",
+    current_subdomain: str = "",
+    current_skill: str = "",
+    uncovered_weight: float = UNCOVERED_WEIGHT,
+    domain_balance_weight: float = DOMAIN_BALANCE_WEIGHT,
+    borderline_weight: float = BORDERLINE_WEIGHT,
+) -> Optional[TopicSelection]:
+    """Deterministically pick the next topic without calling an LLM.
+
+    An in-progress topic is kept. Otherwise every skill is scored by how rarely it
+    has been covered, how rarely its domain has been covered, and how borderline
+    its recent quality scores were. Ties go to the earliest skill in the taxonomy.
+    Returns None for an empty taxonomy.
+
+    Skills that were never covered or scored differ only in their domain, so
+    just the first of them in each domain is scored, next to the skills seen so
+    far. A turn costs time in the number of domains and topics covered, not in
+    the size of the taxonomy.
+    """
+    if current_domain and current_skill:
+        return TopicSelection(
+            selected_topic=current_domain,
+            selected_subdomain=current_subdomain,
+            selected_skill=current_skill,
+            reasoning="Continuing the current topic",
+        )
+
+    skill_coverage = Counter(
+        (topic.get("domain"), topic.get("subdomain"), topic.get("skill"))
+        for topic in topics_covered
+    )
+    domain_coverage = Counter(topic.get("domain") for topic in topics_covered)
+
+    recent_scores: Dict[str, List[float]] = {}
+    for eval_data in overall_performance:
+        recent_scores.setdefault(eval_data.get("topic", ""), []).append(
+            eval_data["quality_score"]
+        )
+
+    seen: Dict[SkillPath, SkillNode] = {}
+    paths = list(skill_coverage) + [
+        tuple(topic.split(" - ")) for topic in recent_scores
+    ]
+    for path in paths:
+        node = taxonomy.skill(*path) if len(path) == 3 else None
+        if node is not None:
+            seen[node.path] = node
+    candidates = list(seen.values())
+    for domain in taxonomy.domains:
+        node = _first_unseen(domain, seen)
+        if node is not None:
+            candidates.append(node)
+
+    best: Optional[SkillNode] = None
+    best_score = 0.0
+    for node in candidates:
+        borderline = _borderline_score(
+            recent_scores.get(topic_key(*node.path), [])[-RECENT_SCORES:]
+        )
+        score = (
+            uncovered_weight / (1 + skill_coverage[node.path])
+            + domain_balance_weight / (1 + domain_coverage[node.domain])
+            + borderline_weight * borderline
+        )
+        if (
+            best is None
+            or score > best_score
+            or (score == best_score and node.index < best.index)
+        ):
+            best, best_score = node, score
+
+    if best is None:
+        return None
+
+    times_covered = skill_coverage[best.path]
+    return TopicSelection(
+        selected_topic=best.domain,
+        selected_subdomain=best.subdomain,
+        selected_skill=best.name,
+        reasoning=(
+            f"Local scheduler: skill covered {times_covered} time(s), domain covered "
+            f"{domain_coverage[best.domain]} time(s), priority {best_score:.2f}"
+        ),
+    )
@@ -0,0 +1,393 @@
+import asyncio
+import random
+import threading
+from collections.abc import AsyncIterator, Iterator, Sequence
+from typing import Any, Dict, List, Optional, Tuple
+
+from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.base import (
+    WRITES_IDX_MAP,
+    BaseCheckpointSaver,
+    ChannelVersions,
+    Checkpoint,
+    CheckpointMetadata,
+    CheckpointTuple,
+    get_checkpoint_id,
+    get_checkpoint_metadata,
+)
+from langgraph.checkpoint.memory import MemorySaver
+from langgraph.checkpoint.serde.types import TASKS, ChannelProtocol
+
+from ..utils.metrics import MetricsRegistry
+from ..utils.sqlite import Transaction, connect
+
+# Primary keys lead with thread_id, so resuming an interview is an index seek
+# for the newest checkpoint of that thread plus one for its pending writes
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS checkpoints (
+    thread_id TEXT NOT NULL,
+    checkpoint_ns TEXT NOT NULL DEFAULT '',
+    checkpoint_id TEXT NOT NULL,
+    parent_checkpoint_id TEXT,
+    type TEXT NOT NULL,
+    checkpoint BLOB NOT NULL,
+    metadata_type TEXT NOT NULL,
+    metadata BLOB NOT NULL,
+    PRIMARY KEY (thread_id, checkpoint_ns, checkpoint_id)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS writes (
+    thread_id TEXT NOT NULL,
+    checkpoint_ns TEXT NOT NULL DEFAULT '',
+    checkpoint_id TEXT NOT NULL,
+    task_id TEXT NOT NULL,
+    idx INTEGER NOT NULL,
+    channel TEXT NOT NULL,
+    type TEXT NOT NULL,
+    value BLOB NOT NULL,
+    task_path TEXT NOT NULL DEFAULT '',
+    PRIMARY KEY (thread_id, checkpoint_ns, checkpoint_id, task_id, idx)
+) WITHOUT ROWID;
+"""
+
+
+def _thread_config(thread_id: str, checkpoint_ns: str, checkpoint_id: str):
+    return {
+        "configurable": {
+            "thread_id": thread_id,
+            "checkpoint_ns": checkpoint_ns,
+            "checkpoint_id": checkpoint_id,
+        }
+    }
+
+
+class SqliteCheckpointSaver(BaseCheckpointSaver[str]):
+    """Durable checkpointer on a local SQLite file in WAL mode.
+
+    Worker processes on the same host can share the file. Each checkpoint is
+    written in one transaction, and the pending writes of a task are inserted
+    together with ``executemany``. The async methods run the same queries in a
+    worker thread.
+    """
+
+    def __init__(self, path: str, serde=None):
+        super().__init__(serde=serde)
+        self.path = path
+        self._lock = threading.Lock()
+        self.conn = connect(path, SCHEMA)
+
+    def _transaction(self) -> Transaction:
+        return Transaction(self.conn, self._lock)
+
+    def close(self):
+        with self._lock:
+            self.conn.close()
+
+    def _query(self, sql: str, params: Tuple = ()) -> List[Tuple]:
+        with self._lock:
+            return self.conn.execute(sql, params).fetchall()
+
+    def _pending_writes(
+        self, thread_id: str, checkpoint_ns: str, checkpoint_id: str
+    ) -> List[Tuple[str, str, Any]]:
+        rows = self._query(
+            "SELECT task_id, channel, type, value FROM writes "
+            "WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id = ? "
+            "ORDER BY task_id, idx",
+            (thread_id, checkpoint_ns, checkpoint_id),
+        )
+        return [
+            (task_id, channel, self.serde.loads_typed((type_, value)))
+            for task_id, channel, type_, value in rows
+        ]
+
+    def _pending_sends(
+        self, thread_id: str, checkpoint_ns: str, parent_checkpoint_id: Optional[str]
+    ) -> List[Any]:
+        if not parent_checkpoint_id:
+            return []
+        rows = self._query(
+            "SELECT type, value FROM writes "
+            "WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id = ? "
+            "AND channel = ? ORDER BY task_path, task_id, idx",
+            (thread_id, checkpoint_ns, parent_checkpoint_id, TASKS),
+        )
+        return [self.serde.loads_typed(row) for row in rows]
+
+    def _to_tuple(self, thread_id: str, checkpoint_ns: str, row: Tuple):
+        checkpoint_id, parent_checkpoint_id, type_, blob, meta_type, meta = row
+        checkpoint: Checkpoint = self.serde.loads_typed((type_, blob))
+        return CheckpointTuple(
+            config=_thread_config(thread_id, checkpoint_ns, checkpoint_id),
+            checkpoint={
+                **checkpoint,
+                "pending_sends": self._pending_sends(
+                    thread_id, checkpoint_ns, parent_checkpoint_id
+                ),
+            },
+            metadata=self.serde.loads_typed((meta_type, meta)),
+            parent_config=(
+                _thread_config(thread_id, checkpoint_ns, parent_checkpoint_id)
+                if parent_checkpoint_id
+                else None
+            ),
+            pending_writes=self._pending_writes(
+                thread_id, checkpoint_ns, checkpoint_id
+            ),
+        )
+
+    def get_tuple(self, config: RunnableConfig) -> Optional[CheckpointTuple]:
+        thread_id = config["configurable"]["thread_id"]
+        checkpoint_ns = config["configurable"].get("checkpoint_ns", "")
+        columns = (
+            "SELECT checkpoint_id, parent_checkpoint_id, type, checkpoint, "
+            "metadata_type, metadata FROM checkpoints "
+            "WHERE thread_id = ? AND checkpoint_ns = ?"
+        )
+        if checkpoint_id := get_checkpoint_id(config):
+            rows = self._query(
+                columns + " AND checkpoint_id = ?",
+                (thread_id, checkpoint_ns, checkpoint_id),
+            )
+        else:
+            rows = self._query(
+                columns + " ORDER BY checkpoint_id DESC LIMIT 1",
+                (thread_id, checkpoint_ns),
+            )
+        if not rows:
+            return None
+        return self._to_tuple(thread_id, checkpoint_ns, rows[0])
+
+    def list(
+        self,
+        config: Optional[RunnableConfig],
+        *,
+        filter: Optional[Dict[str, Any]] = None,
+        before: Optional[RunnableConfig] = None,
+        limit: Optional[int] = None,
+    ) -> Iterator[CheckpointTuple]:
+        clauses, params = [], []
+        if config:
+            clauses.append("thread_id = ?")
+            params.append(config["configurable"]["thread_id"])
+            checkpoint_ns = config["configurable"].get("checkpoint_ns")
+            if checkpoint_ns is not None:
+                clauses.append("checkpoint_ns = ?")
+                params.append(checkpoint_ns)
+            if checkpoint_id := get_checkpoint_id(config):
+                clauses.append("checkpoint_id = ?")
+                params.append(checkpoint_id)
+        if before and (before_id := get_checkpoint_id(before)):
+            clauses.append("checkpoint_id < ?")
+            params.append(before_id)
+
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        rows = self._query(
+            "SELECT thread_id, checkpoint_ns, checkpoint_id, parent_checkpoint_id, "
+            "type, checkpoint, metadata_type, metadata FROM checkpoints"
+            f"{where} ORDER BY checkpoint_id DESC",
+            tuple(params),
+        )
+
+        for thread_id, checkpoint_ns, *row in rows:
+            if limit is not None and limit <= 0:
+                break
+            item = self._to_tuple(thread_id, checkpoint_ns, tuple(row))
+            if filter and not all(
+                item.metadata.get(key) == value for key, value in filter.items()
+            ):
+                continue
+            if limit is not None:
+                limit -= 1
+            yield item
+
+    def put(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        thread_id = config["configurable"]["thread_id"]
+        checkpoint_ns = config["configurable"].get("checkpoint_ns", "")
+        # Sends are rebuilt from the parent's TASKS writes on load
+        checkpoint = {k: v for k, v in checkpoint.items() if k != "pending_sends"}
+        type_, blob = self.serde.dumps_typed(checkpoint)
+        meta_type, meta = self.serde.dumps_typed(
+            get_checkpoint_metadata(config, metadata)
+        )
+        with self._transaction() as cur:
+            cur.execute(
+                "INSERT OR REPLACE INTO checkpoints VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    thread_id,
+                    checkpoint_ns,
+                    checkpoint["id"],
+                    config["configurable"].get("checkpoint_id"),
+                    type_,
+                    blob,
+                    meta_type,
+                    meta,
+                ),
+            )
+        return _thread_config(thread_id, checkpoint_ns, checkpoint["id"])
+
+    def put_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[Tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        thread_id = config["configurable"]["thread_id"]
+        checkpoint_ns = config["configurable"].get("checkpoint_ns", "")
+        checkpoint_id = config["configurable"]["checkpoint_id"]
+        rows = [
+            (
+                thread_id,
+                checkpoint_ns,
+                checkpoint_id,
+                task_id,
+                WRITES_IDX_MAP.get(channel, idx),
+                channel,
+                *self.serde.dumps_typed(value),
+                task_path,
+            )
+            for idx, (channel, value) in enumerate(writes)
+        ]
+        # Special channels (errors, interrupts) have negative indexes and are
+        # replaced, regular writes keep the first value recorded for a task
+        with self._transaction() as cur:
+            cur.executemany(
+                "INSERT OR REPLACE INTO writes VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [row for row in rows if row[4] < 0],
+            )
+            cur.executemany(
+                "INSERT OR IGNORE INTO writes VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [row for row in rows if row[4] >= 0],
+            )
+
+    def delete_thread(self, thread_id: str) -> None:
+        with self._transaction() as cur:
+            cur.execute("DELETE FROM checkpoints WHERE thread_id = ?", (thread_id,))
+            cur.execute("DELETE FROM writes WHERE thread_id = ?", (thread_id,))
+
+    async def aget_tuple(self, config: RunnableConfig) -> Optional[CheckpointTuple]:
+        return await asyncio.to_thread(self.get_tuple, config)
+
+    async def alist(
+        self,
+        config: Optional[RunnableConfig],
+        *,
+        filter: Optional[Dict[str, Any]] = None,
+        before: Optional[RunnableConfig] = None,
+        limit: Optional[int] = None,
+    ) -> AsyncIterator[CheckpointTuple]:
+        items = await asyncio.to_thread(
+            lambda: list(self.list(config, filter=filter, before=before, limit=limit))
+        )
+        for item in items:
+            yield item
+
+    async def aput(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        return await asyncio.to_thread(
+            self.put, config, checkpoint, metadata, new_versions
+        )
+
+    async def aput_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[Tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        await asyncio.to_thread(self.put_writes, config, writes, task_id, task_path)
+
+    async def adelete_thread(self, thread_id: str) -> None:
+        await asyncio.to_thread(self.delete_thread, thread_id)
+
+    def get_next_version(self, current: Optional[str], channel: ChannelProtocol) -> str:
+        if current is None:
+            current_v = 0
+        elif isinstance(current, int):
+            current_v = current
+        else:
+            current_v = int(current.split(".")[0])
+        return f"{current_v + 1:032}.{random.random():016}"
+
+
+class TimedCheckpointSaver(BaseCheckpointSaver):
+    """Record the wall time of another checkpointer's reads and writes"""
+
+    def __init__(self, saver: BaseCheckpointSaver, registry: MetricsRegistry):
+        super().__init__(serde=saver.serde)
+        self.saver = saver
+        self.registry = registry
+
+    def _timer(self, operation: str):
+        return self.registry.timer(
+            "interview_checkpoint_duration_seconds", operation=operation
+        )
+
+    def __getattr__(self, name: str) -> Any:
+        # Backend specific methods, such as close
+        if name == "saver":
+            raise AttributeError(name)
+        return getattr(self.saver, name)
+
+    @property
+    def config_specs(self):
+        return self.saver.config_specs
+
+    def get_tuple(self, config: RunnableConfig) -> Optional[CheckpointTuple]:
+        with self._timer("get"):
+            return self.saver.get_tuple(config)
+
+    def list(self, config: Optional[RunnableConfig], **kwargs) -> Iterator:
+        return self.saver.list(config, **kwargs)
+
+    def put(self, config, checkpoint, metadata, new_versions) -> RunnableConfig:
+        with self._timer("put"):
+            return self.saver.put(config, checkpoint, metadata, new_versions)
+
+    def put_writes(self, config, writes, task_id, task_path: str = "") -> None:
+        with self._timer("put_writes"):
+            self.saver.put_writes(config, writes, task_id, task_path)
+
+    def delete_thread(self, thread_id: str) -> None:
+        self.saver.delete_thread(thread_id)
+
+    async def aget_tuple(self, config: RunnableConfig) -> Optional[CheckpointTuple]:
+        with self._timer("get"):
+            return await self.saver.aget_tuple(config)
+
+    def alist(self, config: Optional[RunnableConfig], **kwargs) -> AsyncIterator:
+        return self.saver.alist(config, **kwargs)
+
+    async def aput(self, config, checkpoint, metadata, new_versions) -> RunnableConfig:
+        with self._timer("put"):
+            return await self.saver.aput(config, checkpoint, metadata, new_versions)
+
+    async def aput_writes(self, config, writes, task_id, task_path: str = "") -> None:
+        with self._timer("put_writes"):
+            await self.saver.aput_writes(config, writes, task_id, task_path)
+
+    async def adelete_thread(self, thread_id: str) -> None:
+        await self.saver.adelete_thread(thread_id)
+
+    def get_next_version(self, current: Optional[str], channel: ChannelProtocol) -> str:
+        return self.saver.get_next_version(current, channel)
+
+
+def create_checkpointer(backend: str, path: str) -> BaseCheckpointSaver:
+    """Build the checkpointer selected in settings"""
+    if backend == "memory":
+        return MemorySaver()
+    if backend == "sqlite":
+        return SqliteCheckpointSaver(path)
+    raise ValueError(f"Unknown checkpointer backend: {backend}")
@@ -1,71 +1,230 @@
-from typing import Any, Dict
+import asyncio
+import threading
+from functools import lru_cache
+from typing import Any, AsyncIterator, Dict, Iterator, Optional, Tuple
 
-from langgraph.checkpoint.memory import MemorySaver
+from langchain_core.globals import get_llm_cache
+from langchain_core.messages import HumanMessage
+from langchain_core.runnables import RunnableLambda
 from langgraph.graph import END, START, StateGraph
 
-from ..config.taxonomy import load_taxonomy, validate_taxonomy
+from ..config.settings import settings
+from ..config.taxonomy import DEFAULT_TAXONOMY_PATH
 from ..models.interview_state import InterviewState
+from ..utils.http_pool import http_pool_gauges, http_pool_stats
+from ..utils.metrics import MetricsCallbackHandler, metrics, serve_metrics
+from ..utils.taxonomy_registry import (
+    DEFAULT_TAXONOMY_ID,
+    migrate_taxonomy_reference,
+    taxonomy_registry,
+    taxonomy_registry_metrics,
+)
+from ..utils.taxonomy_watcher import TaxonomyWatcher
+from .checkpointer import TimedCheckpointSaver, create_checkpointer
 from .nodes import (
+    aanalyze_response,
+    aanalyze_response_and_plan,
+    aanalyze_taxonomy_and_select_topic,
+    aask_planned_question,
+    adecide_next_step,
+    aend_interview,
+    agenerate_question,
+    amove_to_next_topic,
     analyze_response,
+    analyze_response_and_plan,
     analyze_taxonomy_and_select_topic,
+    ask_planned_question,
     decide_next_step,
     end_interview,
+    evaluation_cache,
     generate_question,
+    install_llm_cache,
+    interview_budget,
     move_to_next_topic,
+    question_bank,
+    question_speculator,
+    warm_up_llm_connections,
 )
+from .streaming import InterviewStreamTranslator
+
+STREAM_MODES = ["updates", "messages"]
+
+
+@lru_cache(maxsize=None)
+def configure_taxonomy_registry():
+    """Point the registry at the taxonomy files, once per process.
+
+    The bundled taxonomy is the default ID, and every other ID is a role whose
+    taxonomy is ``<taxonomy_dir>/<taxonomy_id>.json``. The bundled taxonomy is
+    loaded as the latest version here, before any resumed thread can register a
+    legacy copy of it.
+    """
+    taxonomy_registry.max_bytes = settings.taxonomy_cache_max_bytes
+    taxonomy_registry.add_source(DEFAULT_TAXONOMY_ID, DEFAULT_TAXONOMY_PATH)
+    taxonomy_registry.add_source_dir(settings.taxonomy_dir)
+    if settings.taxonomy_version_dir:
+        taxonomy_registry.add_version_store(settings.taxonomy_version_dir)
+    default_taxonomy_version()
+
+
+def default_taxonomy_version() -> str:
+    """Version of the bundled taxonomy that new interviews start with.
+
+    It is loaded from its file if no version is latest yet, and moves on when the
+    watcher reloads it.
+    """
+    return taxonomy_registry.latest_version(DEFAULT_TAXONOMY_ID)
+
 
-INTERVIEW_DOMAINS = load_taxonomy()
-assert validate_taxonomy(INTERVIEW_DOMAINS), "Invalid taxonomy"
+@lru_cache(maxsize=None)
+def start_taxonomy_watcher() -> TaxonomyWatcher:
+    """Start reloading the bundled taxonomy when its file changes, once per process"""
+    watcher = TaxonomyWatcher(taxonomy_registry, settings.taxonomy_reload_interval)
+    watcher.watch(DEFAULT_TAXONOMY_PATH, DEFAULT_TAXONOMY_ID)
+    watcher.start()
+    return watcher
+
+
+def _node(func, afunc) -> RunnableLambda:
+    """Wrap a node so the graph runs it natively under both invoke and ainvoke"""
+    return RunnableLambda(func, afunc=afunc, name=func.__name__)
+
+
+_shared_workflows: Dict[Tuple[type, str], "InterviewWorkflow"] = {}
+_shared_lock = threading.Lock()
 
 
 class InterviewWorkflow:
-    def __init__(self):
+    def __init__(self, graph_mode: Optional[str] = None):
+        self.graph_mode = graph_mode or settings.graph_mode
         self.app = self._create_workflow()
 
+    @classmethod
+    def shared(cls, graph_mode: Optional[str] = None) -> "InterviewWorkflow":
+        """Get the process-wide workflow, compiled on first use.
+
+        Every caller gets the same compiled graph and checkpointer, and interviews
+        are kept apart by their ``thread_id``. Both checkpointer backends can be
+        used by concurrent sessions.
+        """
+        key = (cls, graph_mode or settings.graph_mode)
+        workflow = _shared_workflows.get(key)
+        if workflow is None:
+            with _shared_lock:
+                if key not in _shared_workflows:
+                    _shared_workflows[key] = cls(key[1])
+                workflow = _shared_workflows[key]
+        return workflow
+
     def _create_workflow(self):
         """Create and compile the interview workflow"""
 
         workflow = StateGraph(InterviewState)
 
         # Add nodes
-        workflow.add_node("analyze_and_select", analyze_taxonomy_and_select_topic)
-        workflow.add_node("generate_question", generate_question)
-        workflow.add_node("analyze_response", analyze_response)
-        workflow.add_node("next_topic", move_to_next_topic)
-        workflow.add_node("end_interview", end_interview)
+        workflow.add_node(
+            "analyze_and_select",
+            _node(
+                analyze_taxonomy_and_select_topic, aanalyze_taxonomy_and_select_topic
+            ),
+        )
+        workflow.add_node(
+            "generate_question", _node(generate_question, agenerate_question)
+        )
+        workflow.add_node("next_topic", _node(move_to_next_topic, amove_to_next_topic))
+        workflow.add_node("end_interview", _node(end_interview, aend_interview))
 
         # Define edges
         workflow.add_edge(START, "analyze_and_select")
         workflow.add_edge("analyze_and_select", "generate_question")
         workflow.add_edge("generate_question", "analyze_response")
 
+        if self.graph_mode == "fused":
+            # One LLM call evaluates the response and plans the next question,
+            # then decide_next_step checks the plan before it is asked
+            workflow.add_node(
+                "analyze_response",
+                _node(analyze_response_and_plan, aanalyze_response_and_plan),
+            )
+            workflow.add_node(
+                "ask_planned_question",
+                _node(ask_planned_question, aask_planned_question),
+            )
+            next_question_node = "ask_planned_question"
+            workflow.add_edge("ask_planned_question", "analyze_response")
+        else:
+            workflow.add_node(
+                "analyze_response", _node(analyze_response, aanalyze_response)
+            )
+            next_question_node = "analyze_and_select"
+
         # Conditional edges for decision making
         workflow.add_conditional_edges(
             "analyze_response",
-            decide_next_step,
+            _node(decide_next_step, adecide_next_step),
             {
-                "continue_topic": "analyze_and_select",
+                "continue_topic": next_question_node,
                 "next_topic": "next_topic",
                 "end_interview": "end_interview",
             },
         )
 
-        workflow.add_edge("next_topic", "analyze_and_select")
+        workflow.add_edge("next_topic", next_question_node)
         workflow.add_edge("end_interview", END)
 
-        # Add memory for conversation persistence
-        memory = MemorySaver()
+        # Add memory for conversation persistence. Both backends implement the
+        # sync and async checkpointer interfaces
+        memory = create_checkpointer(
+            settings.checkpointer_backend, settings.checkpoint_db_path
+        )
+
+        if settings.enable_metrics:
+            memory = TimedCheckpointSaver(memory, metrics)
 
         # Compile with interrupt before analyze_response
-        return workflow.compile(
+        app = workflow.compile(
             checkpointer=memory, interrupt_before=["analyze_response"]
         )
 
-    def start_interview(self, thread_id: str = "interview_1"):
-        """Start a new interview session"""
+        # Without metrics no handler is attached, so nothing is recorded
+        if settings.enable_metrics:
+            app = app.with_config(
+                callbacks=[MetricsCallbackHandler(metrics, settings.metrics_file)]
+            )
+            metrics.add_collector(http_pool_gauges)
+            metrics.add_collector(taxonomy_registry_metrics)
+            if settings.metrics_port:
+                serve_metrics(metrics, settings.metrics_port)
+        if settings.enable_taxonomy_reload:
+            start_taxonomy_watcher()
+        configure_taxonomy_registry()
+        return app
+
+    def warm_up(self) -> threading.Thread:
+        """Build the LLM client and open pooled connections in the background.
+
+        Called from a running event loop, that loop's async connections are
+        opened as well.
+        """
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+        thread = threading.Thread(
+            target=warm_up_llm_connections, args=(loop,), daemon=True
+        )
+        thread.start()
+        return thread
 
-        initial_state = {
-            "taxonomy": INTERVIEW_DOMAINS,
+    def _initial_state(self, taxonomy_id: str = DEFAULT_TAXONOMY_ID) -> Dict[str, Any]:
+        if taxonomy_id == DEFAULT_TAXONOMY_ID:
+            version = default_taxonomy_version()
+        else:
+            # Loads the role's taxonomy on its first interview in this process
+            version = taxonomy_registry.latest_version(taxonomy_id)
+        return {
+            "taxonomy_id": taxonomy_id,
+            "taxonomy_version": version,
             "messages": [],
             "current_domain": "",
             "current_subdomain": "",
@@ -76,36 +235,197 @@ class InterviewWorkflow:
             "topics_completed": 0,
             "current_evaluation": {},
             "overall_performance": [],
+            "planned_turn": {},
+            "context_summary": {},
+            "skill_estimates": {},
+            "current_question_difficulty": "",
+            "budget_usage": interview_budget.start(),
             "should_continue_interview": True,
             "interview_complete": False,
         }
 
+    def start_interview(
+        self, thread_id: str = "interview_1", taxonomy_id: str = DEFAULT_TAXONOMY_ID
+    ):
+        """Start a new interview session on the given role's taxonomy"""
+
+        initial_state = self._initial_state(taxonomy_id)
         config = {"configurable": {"thread_id": thread_id}}
 
         # Run until we hit the interrupt (after generating first question)
         result = self.app.invoke(initial_state, config)
+        self._prefetch_next_question(result, config)
 
         return result, config
 
     def continue_interview(self, user_response: str, config: Dict[str, Any]):
         """Continue the interview with a user response"""
 
-        from langchain_core.messages import HumanMessage
-
-        # Get the current state
+        # Add the user response to the conversation
         current_state = self.app.get_state(config)
-
-        # Add user response to the conversation
-        current_state.values["messages"].append(HumanMessage(content=user_response))
-
-        # Update the state with the user's message
-        self.app.update_state(config, {"messages": current_state.values["messages"]})
+        self.app.update_state(
+            config, self._answer_update(current_state.values, user_response)
+        )
 
         # Continue execution from where it was interrupted
         result = self.app.invoke(None, config)
+        self._prefetch_next_question(result, config)
+
+        return result
+
+    async def astart_interview(
+        self, thread_id: str = "interview_1", taxonomy_id: str = DEFAULT_TAXONOMY_ID
+    ):
+        """Start a new interview session without blocking the event loop"""
+
+        initial_state = await asyncio.to_thread(self._initial_state, taxonomy_id)
+        config = {"configurable": {"thread_id": thread_id}}
+
+        result = await self.app.ainvoke(initial_state, config)
+        self._prefetch_next_question(result, config)
+
+        return result, config
+
+    async def acontinue_interview(self, user_response: str, config: Dict[str, Any]):
+        """Continue the interview with a user response without blocking"""
+
+        current_state = await self.app.aget_state(config)
+        await self.app.aupdate_state(
+            config, self._answer_update(current_state.values, user_response)
+        )
+
+        result = await self.app.ainvoke(None, config)
+        self._prefetch_next_question(result, config)
 
         return result
 
+    def stream_start_interview(
+        self, thread_id: str = "interview_1", taxonomy_id: str = DEFAULT_TAXONOMY_ID
+    ) -> Iterator[Dict[str, Any]]:
+        """Start an interview, yielding progress events and first question tokens.
+
+        The final event has type ``state`` and carries the resulting ``state`` and
+        ``config``, like the return value of ``start_interview``.
+        """
+
+        config = {"configurable": {"thread_id": thread_id}}
+        yield from self._stream(self._initial_state(taxonomy_id), config)
+
+    def stream_continue_interview(
+        self, user_response: str, config: Dict[str, Any]
+    ) -> Iterator[Dict[str, Any]]:
+        """Continue the interview, yielding progress events and question tokens"""
+
+        current_state = self.app.get_state(config)
+        self.app.update_state(
+            config, self._answer_update(current_state.values, user_response)
+        )
+
+        yield from self._stream(None, config)
+
+    async def astream_start_interview(
+        self, thread_id: str = "interview_1", taxonomy_id: str = DEFAULT_TAXONOMY_ID
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Async version of stream_start_interview"""
+
+        config = {"configurable": {"thread_id": thread_id}}
+        initial_state = await asyncio.to_thread(self._initial_state, taxonomy_id)
+        async for event in self._astream(initial_state, config):
+            yield event
+
+    async def astream_continue_interview(
+        self, user_response: str, config: Dict[str, Any]
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Async version of stream_continue_interview"""
+
+        current_state = await self.app.aget_state(config)
+        await self.app.aupdate_state(
+            config, self._answer_update(current_state.values, user_response)
+        )
+
+        async for event in self._astream(None, config):
+            yield event
+
+    def _answer_update(
+        self, values: Dict[str, Any], user_response: str
+    ) -> Dict[str, Any]:
+        """State update recording the candidate's answer before resuming.
+
+        States saved with an inline taxonomy copy are moved to a registry
+        reference at the same time.
+        """
+        update = {"messages": [HumanMessage(content=user_response)]}
+        update.update(migrate_taxonomy_reference(values))
+        return update
+
+    def _stream(self, graph_input, config: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+        translator = InterviewStreamTranslator()
+        for mode, payload in self.app.stream(
+            graph_input, config, stream_mode=STREAM_MODES
+        ):
+            yield from translator.feed(mode, payload)
+
+        state = self.app.get_state(config).values
+        self._prefetch_next_question(state, config)
+        yield {"type": "state", "state": state, "config": config}
+
+    async def _astream(
+        self, graph_input, config: Dict[str, Any]
+    ) -> AsyncIterator[Dict[str, Any]]:
+        translator = InterviewStreamTranslator()
+        async for mode, payload in self.app.astream(
+            graph_input, config, stream_mode=STREAM_MODES
+        ):
+            for event in translator.feed(mode, payload):
+                yield event
+
+        state = (await self.app.aget_state(config)).values
+        self._prefetch_next_question(state, config)
+        yield {"type": "state", "state": state, "config": config}
+
+    def _prefetch_next_question(self, state, config: Dict[str, Any]):
+        """Speculatively generate the next question while the candidate answers"""
+        if settings.enable_question_speculation and not state.get("interview_complete"):
+            question_speculator.prefetch(config["configurable"]["thread_id"], state)
+
+    def get_speculation_stats(self) -> Dict[str, Any]:
+        """Get hit rate and wasted tokens of speculative question generation"""
+        return question_speculator.stats()
+
+    def get_llm_cache_stats(self) -> Dict[str, Any]:
+        """Get hit and byte counters of the LLM response cache, if it keeps them"""
+        install_llm_cache()
+        cache = get_llm_cache()
+        return cache.stats() if hasattr(cache, "stats") else {}
+
+    def get_evaluation_cache_report(self) -> Dict[str, Any]:
+        """Get hit rate and drift from fresh evaluations of the evaluation cache"""
+        return evaluation_cache.report()
+
+    def get_metrics(self) -> str:
+        """Get node, LLM and checkpoint metrics in the Prometheus text format"""
+        return metrics.render()
+
+    def get_http_pool_stats(self) -> Dict[str, Any]:
+        """Get limits and connection usage of the LLM providers' HTTP pools"""
+        return http_pool_stats()
+
+    def get_taxonomy_registry_stats(self) -> Dict[str, Any]:
+        """Taxonomy cache size, hits, misses, load time and evictions"""
+        return taxonomy_registry.stats()
+
+    def get_question_bank_stats(self) -> Dict[str, Any]:
+        """Get the size of the question bank and how often it served a question"""
+        return question_bank.stats()
+
+    def get_budget_usage(self, state) -> Dict[str, Any]:
+        """Get an interview's LLM calls, tokens, cost and the budget left"""
+        return interview_budget.summary(state.get("budget_usage") or {})
+
+    def get_taxonomy(self) -> Dict[str, Any]:
+        """The taxonomy a new interview would start with"""
+        return taxonomy_registry.get(DEFAULT_TAXONOMY_ID, default_taxonomy_version())
+
     def get_latest_question(self, state):
         """Extract the latest question from the state"""
         from langchain_core.messages import AIMessage
@@ -1,75 +1,250 @@
+import asyncio
 import json
-from typing import Literal
+import threading
+from functools import lru_cache
+from typing import Any, Dict, List, Literal, Optional, Tuple
 
-from langchain.globals import set_llm_cache
-from langchain_community.cache import InMemoryCache
-from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
-from langchain_core.tracers import LangChainTracer
-from langsmith import Client
+from langchain_core.globals import set_llm_cache
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage, SystemMessage
+from langchain_core.runnables import Runnable, RunnableConfig
 
 from ..config.settings import settings
-from ..models.interview_state import InterviewState
-from ..models.pydantic_models import Question, ResponseEvaluation, TopicSelection
+from ..models.interview_state import InterviewState, apply_update
+from ..models.pydantic_models import (
+    Question,
+    ResponseEvaluation,
+    TopicSelection,
+    TurnPlan,
+)
+from ..utils.conversation_context import render_context, summarize
+from ..utils.evaluation_cache import EvaluationCache
+from ..utils.http_pool import HttpPool, get_http_pool
+from ..utils.interview_budget import InterviewBudget, UsageRecorder
+from ..utils.llm_cache import create_llm_cache
+from ..utils.question_bank import QuestionBank, target_difficulty
+from ..utils.skill_estimator import (
+    confidence,
+    difficulty_value,
+    overall_estimate,
+    target_difficulty_for,
+    update_skill_estimate,
+)
+from ..utils.taxonomy_prompt import render_taxonomy_for_prompt
+from ..utils.taxonomy_registry import resolve_compiled_taxonomy, resolve_taxonomy
+from ..utils.tokens import estimate_messages_tokens, estimate_tokens
+from ..utils.topic_scheduler import select_next_topic, topic_key
+from .speculation import CONTINUE_TOPIC, NEXT_TOPIC, QuestionSpeculator
+
+
+@lru_cache(maxsize=None)
+def install_llm_cache():
+    """Install the configured LLM response cache, once per process"""
+    if settings.enable_llm_caching:
+        set_llm_cache(
+            create_llm_cache(
+                settings.llm_cache_backend,
+                settings.llm_cache_path,
+                settings.llm_cache_max_bytes,
+                settings.llm_cache_ttl_seconds,
+            )
+        )
 
-# Initialize LangSmith client
-langsmith_client = Client() if settings.langchain_tracing_v2 else None
 
-# Enable caching if configured
-if settings.enable_llm_caching:
-    set_llm_cache(InMemoryCache())
+def _http_pool() -> HttpPool:
+    return get_http_pool(
+        settings.model_provider,
+        max_connections=settings.llm_max_connections,
+        max_keepalive_connections=settings.llm_max_keepalive_connections,
+        keepalive_expiry=settings.llm_keepalive_expiry,
+        http2=settings.llm_http2,
+        timeout=settings.llm_timeout,
+    )
 
 
-# Enhanced LLM initialization with tracing
-def create_llm_with_tracing(run_name: str, tags: list | None = None):
-    """Create LLM instance with proper tracing and callbacks"""
-    callbacks = []
+@lru_cache(maxsize=None)
+def get_chat_model(model_name: Optional[str] = None) -> BaseChatModel:
+    """Build the provider's chat model once; every task and session shares it.
 
-    if settings.langchain_tracing_v2:
-        tracer = LangChainTracer(
-            project_name=settings.langchain_project, tags=tags or []
-        )
-        callbacks.append(tracer)
+    ``model_name`` selects a cheaper budget tier instead of the configured
+    model. Its SDK clients send requests through the provider's pooled,
+    keep-alive HTTP connections.
+    """
+    install_llm_cache()
+    model_name = model_name or settings.model_name
+    pool = _http_pool()
 
     if settings.model_provider == "openai":
         from langchain_openai import ChatOpenAI
 
         return ChatOpenAI(
             temperature=settings.temperature,
-            model=settings.model_name,
+            model=model_name,
             request_timeout=settings.llm_timeout,
             max_retries=settings.llm_max_retries,
-            callbacks=callbacks,
-            tags=tags,
+            http_client=pool.client,
+            http_async_client=pool.async_client,
         )
     elif settings.model_provider == "anthropic":
-        from langchain_anthropic import ChatAnthropic
+        from ..utils.pooled_anthropic import PooledChatAnthropic
 
-        return ChatAnthropic(
+        return PooledChatAnthropic(
             temperature=settings.temperature,
-            model=settings.model_name,
+            model=model_name,
             timeout=settings.llm_timeout,
             max_retries=settings.llm_max_retries,
-            callbacks=callbacks,
-            tags=tags,
+            http_pool=pool,
         )
+    raise ValueError(f"Unsupported model provider: {settings.model_provider}")
 
 
-# Create specialized LLMs with tags
-topic_selector_llm = create_llm_with_tracing(
-    "topic_selection", tags=["topic_selection", "interview_flow"]
-).with_structured_output(TopicSelection)
+def warm_up_llm_connections(loop: Optional[asyncio.AbstractEventLoop] = None) -> int:
+    """Open the configured number of connections to the provider in advance.
 
-question_generator_llm = create_llm_with_tracing(
-    "question_generation", tags=["question_generation", "interview_flow"]
-).with_structured_output(Question)
+    With a ``loop``, that loop's async connections are opened too.
+    """
+    get_chat_model()
+    return _http_pool().warm_up(settings.llm_warmup_connections, loop)
 
-evaluator_llm = create_llm_with_tracing(
-    "response_evaluation", tags=["evaluation", "interview_flow"]
-).with_structured_output(ResponseEvaluation)
 
+# Enhanced LLM initialization with tracing
+def create_llm_with_tracing(
+    run_name: str,
+    tags: list | None = None,
+    schema: Optional[type] = None,
+    model_name: Optional[str] = None,
+) -> Runnable:
+    """Configure the shared chat model for one task, with tracing and callbacks"""
+    llm = get_chat_model(model_name)
+    if schema is not None:
+        llm = llm.with_structured_output(schema)
+
+    config: Dict[str, Any] = {"run_name": run_name, "tags": tags or []}
+    if settings.langchain_tracing_v2:
+        from langchain_core.tracers import LangChainTracer
+
+        tracer = LangChainTracer(
+            project_name=settings.langchain_project, tags=tags or []
+        )
+        config["callbacks"] = [tracer]
+
+    return llm.with_config(config)
+
+
+# Run name, tags and output schema of the LLM for each interview task
+LLM_SPECS = {
+    "topic_selector": (
+        "topic_selection",
+        ["topic_selection", "interview_flow"],
+        TopicSelection,
+    ),
+    "question_generator": (
+        "question_generation",
+        ["question_generation", "interview_flow"],
+        Question,
+    ),
+    "evaluator": (
+        "response_evaluation",
+        ["evaluation", "interview_flow"],
+        ResponseEvaluation,
+    ),
+    "turn_planner": (
+        "turn_planning",
+        ["evaluation", "topic_selection", "interview_flow"],
+        TurnPlan,
+    ),
+}
+
+# Keyed by task and model; a None model is a replacement used on every model
+_llms: Dict[Tuple[str, Optional[str]], Runnable] = {}
+_llms_lock = threading.Lock()
+
+
+def get_llm(task: str, model_name: Optional[str] = None) -> Runnable:
+    """Get the structured output LLM for an interview task, built on first use"""
+    key = (task, model_name or settings.model_name)
+    llm = _llms.get((task, None)) or _llms.get(key)
+    if llm is None:
+        with _llms_lock:
+            if key not in _llms:
+                run_name, tags, schema = LLM_SPECS[task]
+                # The configured model is built once, whichever way it is named
+                tier = None if key[1] == settings.model_name else key[1]
+                _llms[key] = create_llm_with_tracing(run_name, tags, schema, tier)
+            llm = _llms[key]
+    return llm
+
+
+def set_llm(task: str, llm: Runnable):
+    """Replace the LLM for an interview task on every model, e.g. with a fake one"""
+    if task not in LLM_SPECS:
+        raise KeyError(f"Unknown LLM task: {task}")
+    with _llms_lock:
+        _llms[(task, None)] = llm
+
+
+def _invoke_llm(
+    task: str, messages: List[BaseMessage], recorder: Optional[UsageRecorder] = None
+) -> Any:
+    """Call a task's LLM, on the recorder's model and charged to it if given"""
+    if recorder is None:
+        return get_llm(task).invoke(messages)
+    return get_llm(task, recorder.model_name).invoke(messages, recorder.config())
+
+
+async def _ainvoke_llm(
+    task: str, messages: List[BaseMessage], recorder: Optional[UsageRecorder] = None
+) -> Any:
+    """Async version of _invoke_llm"""
+    if recorder is None:
+        return await get_llm(task).ainvoke(messages)
+    return await get_llm(task, recorder.model_name).ainvoke(messages, recorder.config())
+
+
+def _recorder(state: InterviewState) -> UsageRecorder:
+    return interview_budget.recorder(state.get("budget_usage") or {})
+
+
+def _charge(
+    state: InterviewState, recorder: UsageRecorder, thread_id: Optional[str] = None
+) -> Dict[str, Any]:
+    """State update adding a node's LLM calls to the interview's budget usage.
+
+    With a ``thread_id``, calls speculated for the thread are added too, whether
+    their question was used or thrown away.
+    """
+    recorders = [recorder]
+    if settings.enable_question_speculation and thread_id:
+        recorders += question_speculator.pop_usage(thread_id)
+    recorders = [recorded for recorded in recorders if recorded.calls]
+    if not recorders:
+        return {}
+    usage = state.get("budget_usage") or {}
+    for recorded in recorders:
+        usage = interview_budget.charge(usage, recorded)
+    return {"budget_usage": usage}
+
+
+def _taxonomy_prompt(state: InterviewState) -> Tuple[str, str]:
+    """Render the taxonomy and the topics covered for a prompt"""
+
+    taxonomy, version = resolve_taxonomy(state)
+    if settings.enable_prompt_optimization:
+        taxonomy_str = render_taxonomy_for_prompt(
+            taxonomy,
+            state["topics_covered"],
+            token_budget=settings.taxonomy_prompt_token_budget,
+            version=version,
+        )
+        topics_covered_str = json.dumps(state["topics_covered"], separators=(",", ":"))
+    else:
+        taxonomy_str = json.dumps(taxonomy, indent=2)
+        topics_covered_str = json.dumps(state["topics_covered"], indent=2)
+    return taxonomy_str, topics_covered_str
 
-def analyze_taxonomy_and_select_topic(state: InterviewState) -> InterviewState:
-    """Step 1: Analyze taxonomy and identify topic for question"""
+
+def _build_topic_selection_messages(state: InterviewState) -> List[BaseMessage]:
+    """Build the prompt for the topic selector LLM"""
 
     system_prompt = """You are an expert technical interviewer. Analyze the provided skills taxonomy and conversation history to select the most appropriate topic for the next question.
 
@@ -81,8 +256,7 @@ def analyze_taxonomy_and_select_topic(state: InterviewState) -> InterviewState:
 
     Select a domain, subdomain, and specific skill that would provide the most valuable assessment data."""
 
-    taxonomy_str = json.dumps(state["taxonomy"], indent=2)
-    topics_covered_str = json.dumps(state["topics_covered"], indent=2)
+    taxonomy_str, topics_covered_str = _taxonomy_prompt(state)
 
     messages = [
         SystemMessage(content=system_prompt),
@@ -101,15 +275,168 @@ def analyze_taxonomy_and_select_topic(state: InterviewState) -> InterviewState:
         ),
     ]
 
-    topic_selection = topic_selector_llm.invoke(messages)
+    return messages
+
+
+def _local_topic_selection(state: InterviewState) -> Optional[TopicSelection]:
+    """Pick the next topic with the local scheduler, if it is enabled"""
+
+    if settings.topic_selection_mode != "local":
+        return None
+
+    return _schedule_topic(state, keep_current=True)
+
+
+def _schedule_topic(
+    state: InterviewState, keep_current: bool = False
+) -> Optional[TopicSelection]:
+    """Run the local scheduler on the state's taxonomy, with the configured weights"""
+
+    current = (
+        (state["current_domain"], state["current_subdomain"], state["current_skill"])
+        if keep_current
+        else ("", "", "")
+    )
+    return select_next_topic(
+        resolve_compiled_taxonomy(state),
+        state["topics_covered"],
+        state["overall_performance"],
+        *current,
+        uncovered_weight=settings.scheduler_uncovered_weight,
+        domain_balance_weight=settings.scheduler_domain_balance_weight,
+        borderline_weight=settings.scheduler_borderline_weight,
+    )
+
+
+def _snap_topic_selection(
+    state: InterviewState, topic_selection: TopicSelection
+) -> TopicSelection:
+    """Resolve an LLM-selected topic to a skill that exists in the taxonomy.
+
+    Near-miss names snap to the closest real skill. A selection that matches
+    nothing falls back to the local scheduler's pick.
+    """
+    skill = resolve_compiled_taxonomy(state).snap(
+        topic_selection.selected_topic,
+        topic_selection.selected_subdomain,
+        topic_selection.selected_skill,
+    )
+    if skill is None:
+        return _schedule_topic(state) or topic_selection
+    if skill.path == (
+        topic_selection.selected_topic,
+        topic_selection.selected_subdomain,
+        topic_selection.selected_skill,
+    ):
+        return topic_selection
+    return topic_selection.model_copy(
+        update={
+            "selected_topic": skill.domain,
+            "selected_subdomain": skill.subdomain,
+            "selected_skill": skill.name,
+        }
+    )
+
+
+def _choose_topic(
+    state: InterviewState, recorder: Optional[UsageRecorder] = None
+) -> Tuple[TopicSelection, int]:
+    """Pick the next topic locally or with the LLM, returning estimated tokens"""
+
+    topic_selection = _local_topic_selection(state)
+    if topic_selection is not None:
+        return topic_selection, 0
+
+    messages = _build_topic_selection_messages(state)
+    topic_selection = _invoke_llm("topic_selector", messages, recorder)
+    tokens = estimate_messages_tokens(messages) + estimate_tokens(
+        topic_selection.model_dump_json()
+    )
+    return _snap_topic_selection(state, topic_selection), tokens
+
+
+async def _achoose_topic(
+    state: InterviewState, recorder: Optional[UsageRecorder] = None
+) -> Tuple[TopicSelection, int]:
+    """Async version of _choose_topic"""
+
+    # Resolving the taxonomy can load it from disk, so off the event loop
+    topic_selection = await asyncio.to_thread(_local_topic_selection, state)
+    if topic_selection is not None:
+        return topic_selection, 0
+
+    messages = await asyncio.to_thread(_build_topic_selection_messages, state)
+    topic_selection = await _ainvoke_llm("topic_selector", messages, recorder)
+    tokens = estimate_messages_tokens(messages) + estimate_tokens(
+        topic_selection.model_dump_json()
+    )
+    snapped = await asyncio.to_thread(_snap_topic_selection, state, topic_selection)
+    return snapped, tokens
+
+
+def _thread_id(config: Optional[RunnableConfig]) -> Optional[str]:
+    return (config or {}).get("configurable", {}).get("thread_id")
+
+
+def _can_use_speculated_topic(state: InterviewState, thread_id: Optional[str]) -> bool:
+    # A speculated selection is only valid for an LLM-picked new topic, whose
+    # prompt does not depend on the evaluation that has just been made
+    return bool(
+        settings.enable_question_speculation
+        and settings.topic_selection_mode != "local"
+        and thread_id
+        and not state["current_domain"]
+    )
+
+
+def analyze_taxonomy_and_select_topic(
+    state: InterviewState, config: Optional[RunnableConfig] = None
+) -> Dict[str, Any]:
+    """Step 1: Analyze taxonomy and identify topic for question"""
+
+    topic_selection = None
+    recorder = _recorder(state)
+    thread_id = _thread_id(config)
+    if _can_use_speculated_topic(state, thread_id):
+        topic_selection = question_speculator.peek_topic(thread_id)
+    if topic_selection is None:
+        topic_selection, _ = _choose_topic(state, recorder)
+
+    return {
+        **_apply_topic_selection(topic_selection),
+        **_charge(state, recorder, thread_id),
+    }
+
+
+async def aanalyze_taxonomy_and_select_topic(
+    state: InterviewState, config: Optional[RunnableConfig] = None
+) -> Dict[str, Any]:
+    """Async version of analyze_taxonomy_and_select_topic"""
+
+    topic_selection = None
+    recorder = _recorder(state)
+    thread_id = _thread_id(config)
+    if _can_use_speculated_topic(state, thread_id):
+        topic_selection = await asyncio.to_thread(
+            question_speculator.peek_topic, thread_id
+        )
+    if topic_selection is None:
+        topic_selection, _ = await _achoose_topic(state, recorder)
+
+    return {
+        **_apply_topic_selection(topic_selection),
+        **_charge(state, recorder, thread_id),
+    }
+
+
+def _apply_topic_selection(topic_selection: TopicSelection) -> Dict[str, Any]:
+    """Make the selected topic the current one"""
 
     return {
-        **state,
         "current_domain": topic_selection.selected_topic,
         "current_subdomain": topic_selection.selected_subdomain,
         "current_skill": topic_selection.selected_skill,
-        "messages": state["messages"]
-        + [
+        "messages": [
             AIMessage(
                 content=f"[INTERNAL] Selected topic: {topic_selection.selected_topic} - {topic_selection.selected_subdomain} - {topic_selection.selected_skill}. Reasoning: {topic_selection.reasoning}"
             )
@@ -117,8 +444,19 @@ def analyze_taxonomy_and_select_topic(state: InterviewState) -> InterviewState:
     }
 
 
-def generate_question(state: InterviewState) -> InterviewState:
-    """Step 2: Create a question for user"""
+def _conversation_context(state: InterviewState, token_budget: int) -> str:
+    """Summary of older answers and the most recent ones, within a token budget"""
+
+    performance = state["overall_performance"]
+    recent_turns = settings.context_recent_turns
+    # Catches up states saved before the summary was kept; usually a no-op
+    summary = summarize(state.get("context_summary") or {}, performance, recent_turns)
+    recent = performance[-recent_turns:] if recent_turns else []
+    return render_context(summary, recent, token_budget)
+
+
+def _build_question_messages(state: InterviewState) -> List[BaseMessage]:
+    """Build the prompt for the question generator LLM"""
 
     system_prompt = """You are an expert technical interviewer. Generate a thoughtful, targeted question based on the selected topic and the candidate's conversation history.
 
@@ -129,15 +467,8 @@ def generate_question(state: InterviewState) -> InterviewState:
     4. Be clear and unambiguous
     5. Encourage detailed responses"""
 
-    recent_messages = (
-        state["messages"][-6:] if len(state["messages"]) > 6 else state["messages"]
-    )
-    conversation_context = "\n".join(
-        [
-            f"{msg.__class__.__name__}: {msg.content}"
-            for msg in recent_messages
-            if not msg.content.startswith("[INTERNAL]")
-        ]
+    conversation_context = _conversation_context(
+        state, settings.question_context_token_budget
     )
 
     messages = [
@@ -151,30 +482,158 @@ def generate_question(state: InterviewState) -> InterviewState:
 
         Questions asked on this topic: {state["questions_asked_current_topic"]}
 
-        Recent conversation context:
+        Conversation context:
         {conversation_context}
 
         Generate an appropriate interview question."""
         ),
     ]
 
-    question_obj = question_generator_llm.invoke(messages)
+    return messages
+
+
+def _bank_question(state: InterviewState) -> Optional[Question]:
+    """Serve the opening question of a topic from the question bank"""
+
+    # Follow-ups respond to the candidate's last answer, so they stay live
+    if settings.question_source != "bank" or state["questions_asked_current_topic"]:
+        return None
+
+    # Older questions have left the message window, but are in the evaluations
+    asked = {record.get("question") for record in state["overall_performance"]}
+    asked.update(msg.content for msg in state["messages"] if isinstance(msg, AIMessage))
+    return question_bank.take(
+        (state["current_domain"], state["current_subdomain"], state["current_skill"]),
+        asked,
+        _target_difficulty(state),
+    )
+
+
+def _target_difficulty(state: InterviewState) -> str:
+    """Difficulty the next question should have, given the answers so far"""
+
+    estimates = state.get("skill_estimates") or {}
+    if settings.next_step_mode == "adaptive" and estimates:
+        # Aim at the estimated ability, where an answer says most about it
+        return target_difficulty_for(_overall_estimate(estimates))
+    scores = [record["quality_score"] for record in state["overall_performance"]]
+    return target_difficulty(scores)
+
+
+def _generate_question_for_state(
+    state: InterviewState, recorder: Optional[UsageRecorder] = None
+) -> Tuple[Question, int]:
+    """Generate a question for the current topic, returning estimated tokens"""
+
+    question_obj = _bank_question(state)
+    if question_obj is not None:
+        return question_obj, 0
+
+    messages = _build_question_messages(state)
+    question_obj = _invoke_llm("question_generator", messages, recorder)
+    tokens = estimate_messages_tokens(messages) + estimate_tokens(
+        question_obj.model_dump_json()
+    )
+    return question_obj, tokens
+
+
+async def _agenerate_question_for_state(
+    state: InterviewState, recorder: Optional[UsageRecorder] = None
+) -> Tuple[Question, int]:
+    """Async version of _generate_question_for_state"""
+
+    # The question bank is a SQLite file
+    question_obj = await asyncio.to_thread(_bank_question, state)
+    if question_obj is not None:
+        return question_obj, 0
+
+    messages = _build_question_messages(state)
+    question_obj = await _ainvoke_llm("question_generator", messages, recorder)
+    tokens = estimate_messages_tokens(messages) + estimate_tokens(
+        question_obj.model_dump_json()
+    )
+    return question_obj, tokens
+
+
+def _take_speculated_question(
+    state: InterviewState, thread_id: Optional[str]
+) -> Optional[Question]:
+    """Commit a pre-generated question for this turn, if there is a matching one"""
+
+    if not (settings.enable_question_speculation and thread_id):
+        return None
+
+    # A fresh topic means decide_next_step took the next_topic branch
+    if state["questions_asked_current_topic"] == 0:
+        branch = NEXT_TOPIC
+    else:
+        branch = CONTINUE_TOPIC
+    return question_speculator.take(
+        thread_id,
+        branch,
+        (state["current_domain"], state["current_subdomain"], state["current_skill"]),
+        state,
+    )
+
+
+def generate_question(
+    state: InterviewState, config: Optional[RunnableConfig] = None
+) -> Dict[str, Any]:
+    """Step 2: Create a question for user"""
+
+    thread_id = _thread_id(config)
+    question_obj = _take_speculated_question(state, thread_id)
+    recorder = _recorder(state)
+    if question_obj is None:
+        question_obj, _ = _generate_question_for_state(state, recorder)
+
+    return {
+        **_apply_question(state, question_obj),
+        **_charge(state, recorder, thread_id),
+    }
+
+
+async def agenerate_question(
+    state: InterviewState, config: Optional[RunnableConfig] = None
+) -> Dict[str, Any]:
+    """Async version of generate_question"""
+
+    thread_id = _thread_id(config)
+    question_obj = await asyncio.to_thread(_take_speculated_question, state, thread_id)
+    recorder = _recorder(state)
+    if question_obj is None:
+        question_obj, _ = await _agenerate_question_for_state(state, recorder)
+
+    return {
+        **_apply_question(state, question_obj),
+        **_charge(state, recorder, thread_id),
+    }
+
+
+def _apply_question(state: InterviewState, question_obj: Question) -> Dict[str, Any]:
+    """Ask a question to the candidate"""
 
     return {
-        **state,
-        "messages": state["messages"] + [AIMessage(content=question_obj.question)],
+        "messages": [AIMessage(content=question_obj.question)],
         "questions_asked_current_topic": state["questions_asked_current_topic"] + 1,
         "total_questions_asked": state["total_questions_asked"] + 1,
+        "current_question_difficulty": question_obj.difficulty_level,
     }
 
 
-def analyze_response(state: InterviewState) -> InterviewState:
-    """Step 4: Analyze user response using system prompt"""
+def _latest_question(state: InterviewState) -> str:
+    """Get the most recent question asked to the candidate"""
 
-    if not state["messages"] or not isinstance(state["messages"][-1], HumanMessage):
-        return state
+    for msg in reversed(state["messages"]):
+        if isinstance(msg, AIMessage) and not msg.content.startswith("[INTERNAL]"):
+            return msg.content
+    return "No previous question found"
 
-    user_response = state["messages"][-1].content
+
+def build_evaluation_messages(
+    state: InterviewState, last_question: str, user_response: str
+) -> List[BaseMessage]:
+    """Build the prompt for the evaluator LLM; rescoring replays it on old turns"""
 
     system_prompt = f"""You are an expert technical interviewer evaluating a candidate's response. Analyze the response thoroughly and provide detailed feedback.
 
@@ -193,16 +652,7 @@ def analyze_response(state: InterviewState) -> InterviewState:
 
     Provide a quality score between 0-1 and determine if we should continue with this topic or move on."""
 
-    ai_messages = [
-        msg
-        for msg in state["messages"]
-        if isinstance(msg, AIMessage) and not msg.content.startswith("[INTERNAL]")
-    ]
-    last_question = (
-        ai_messages[-1].content if ai_messages else "No previous question found"
-    )
-
-    messages = [
+    return [
         SystemMessage(content=system_prompt),
         HumanMessage(
             content=f"""
@@ -214,7 +664,29 @@ def analyze_response(state: InterviewState) -> InterviewState:
         ),
     ]
 
-    evaluation = evaluator_llm.invoke(messages)
+
+def _evaluation_topic(state: InterviewState) -> str:
+    return topic_key(
+        state["current_domain"], state["current_subdomain"], state["current_skill"]
+    )
+
+
+def _apply_evaluation(
+    state: InterviewState,
+    evaluation: ResponseEvaluation,
+    last_question: str,
+    user_response: str,
+) -> Dict[str, Any]:
+    """Record an evaluation of the candidate's latest response"""
+
+    topic = _evaluation_topic(state)
+    skill_estimates = dict(state.get("skill_estimates") or {})
+    skill_estimates[topic] = update_skill_estimate(
+        skill_estimates.get(topic, {}),
+        evaluation.quality_score,
+        difficulty_value(state.get("current_question_difficulty") or "Intermediate"),
+        settings.adaptive_score_noise,
+    )
 
     evaluation_data = {
         "question": last_question,
@@ -225,15 +697,22 @@ def analyze_response(state: InterviewState) -> InterviewState:
         "areas_for_improvement": evaluation.areas_for_improvement,
         "should_continue_topic": evaluation.should_continue_topic,
         "reasoning": evaluation.reasoning,
-        "topic": f"{state['current_domain']} - {state['current_subdomain']} - {state['current_skill']}",
+        "topic": topic,
     }
 
+    # Fold the answer leaving the verbatim window into the rolling summary
+    context_summary = summarize(
+        state.get("context_summary") or {},
+        state["overall_performance"] + [evaluation_data],
+        settings.context_recent_turns,
+    )
+
     return {
-        **state,
         "current_evaluation": evaluation_data,
-        "overall_performance": state["overall_performance"] + [evaluation_data],
-        "messages": state["messages"]
-        + [
+        "overall_performance": [evaluation_data],
+        "context_summary": context_summary,
+        "skill_estimates": skill_estimates,
+        "messages": [
             AIMessage(
                 content=f"[INTERNAL] Evaluation complete. Quality score: {evaluation.quality_score:.2f}. Should continue topic: {evaluation.should_continue_topic}"
             )
@@ -241,6 +720,204 @@ def analyze_response(state: InterviewState) -> InterviewState:
     }
 
 
+def _has_new_response(state: InterviewState) -> bool:
+    return bool(state["messages"]) and isinstance(state["messages"][-1], HumanMessage)
+
+
+def analyze_response(state: InterviewState) -> Dict[str, Any]:
+    """Step 4: Analyze user response using system prompt"""
+
+    if not _has_new_response(state):
+        return {}
+
+    user_response = state["messages"][-1].content
+    last_question = _latest_question(state)
+
+    messages = build_evaluation_messages(state, last_question, user_response)
+    recorder = _recorder(state)
+    if settings.enable_evaluation_cache:
+        evaluation = evaluation_cache.evaluate(
+            _evaluation_topic(state),
+            last_question,
+            user_response,
+            lambda: _invoke_llm("evaluator", messages, recorder),
+        )
+    else:
+        evaluation = _invoke_llm("evaluator", messages, recorder)
+
+    return {
+        **_apply_evaluation(state, evaluation, last_question, user_response),
+        **_charge(state, recorder),
+    }
+
+
+async def aanalyze_response(state: InterviewState) -> Dict[str, Any]:
+    """Async version of analyze_response"""
+
+    if not _has_new_response(state):
+        return {}
+
+    user_response = state["messages"][-1].content
+    last_question = _latest_question(state)
+
+    messages = build_evaluation_messages(state, last_question, user_response)
+    recorder = _recorder(state)
+    if settings.enable_evaluation_cache:
+        evaluation = await evaluation_cache.aevaluate(
+            _evaluation_topic(state),
+            last_question,
+            user_response,
+            lambda: _ainvoke_llm("evaluator", messages, recorder),
+        )
+    else:
+        evaluation = await _ainvoke_llm("evaluator", messages, recorder)
+
+    return {
+        **_apply_evaluation(state, evaluation, last_question, user_response),
+        **_charge(state, recorder),
+    }
+
+
+def _build_turn_plan_messages(
+    state: InterviewState, last_question: str, user_response: str
+) -> List[BaseMessage]:
+    """Build the prompt for the fused evaluate-and-plan LLM"""
+
+    # With the local scheduler, new topics are its pick, so the taxonomy is not sent
+    scheduled = None
+    if settings.topic_selection_mode == "local":
+        scheduled = _local_topic_selection(
+            apply_update(state, move_to_next_topic(state))
+        )
+    if scheduled is not None:
+        new_topic = (
+            f"Otherwise move on to domain {scheduled.selected_topic}, subdomain "
+            f"{scheduled.selected_subdomain}, skill {scheduled.selected_skill}, "
+            "and ask its first question."
+        )
+        topic_context = ""
+    else:
+        taxonomy_str, topics_covered_str = _taxonomy_prompt(state)
+        new_topic = (
+            "Otherwise select a new topic from the taxonomy and ask its first "
+            "question."
+        )
+        topic_context = f"""
+        Skills Taxonomy:
+        {taxonomy_str}
+
+        Topics Already Covered:
+        {topics_covered_str}
+"""
+    conversation_context = _conversation_context(
+        state, settings.turn_plan_context_token_budget
+    )
+
+    messages = build_evaluation_messages(state, last_question, user_response)
+    messages.append(
+        HumanMessage(
+            content=f"""
+        After evaluating, plan the next turn of the interview.
+
+        Interview rules, applied to your evaluation:
+        - At most {settings.max_questions_per_topic} questions per topic; {state["questions_asked_current_topic"]} asked on the current topic so far
+        - Move on if the score is below 0.3 after 2 or more questions on the topic
+        - Move on if the candidate demonstrates knowledge with a score above 0.7
+        - Otherwise stay on the topic if another question would be valuable
+
+        If the interview stays on the current topic, set the next topic to the current domain, subdomain and skill and ask a follow-up question. {new_topic}
+{topic_context}
+        Earlier conversation:
+        {conversation_context}"""
+        )
+    )
+
+    return messages
+
+
+def _apply_turn_plan(
+    state: InterviewState, plan: TurnPlan, last_question: str, user_response: str
+) -> Dict[str, Any]:
+    """Record the evaluation and keep the planned next turn for later"""
+
+    return {
+        **_apply_evaluation(state, plan.evaluation, last_question, user_response),
+        "planned_turn": {
+            "topic_selection": plan.next_topic.model_dump(),
+            "question": plan.next_question.model_dump(),
+        },
+    }
+
+
+def analyze_response_and_plan(state: InterviewState) -> Dict[str, Any]:
+    """Step 4 (fused mode): Evaluate the response and plan the next turn in one call"""
+
+    if not _has_new_response(state):
+        return {}
+
+    user_response = state["messages"][-1].content
+    last_question = _latest_question(state)
+
+    messages = _build_turn_plan_messages(state, last_question, user_response)
+    recorder = _recorder(state)
+    plan = _invoke_llm("turn_planner", messages, recorder)
+
+    return {
+        **_apply_turn_plan(state, plan, last_question, user_response),
+        **_charge(state, recorder),
+    }
+
+
+async def aanalyze_response_and_plan(state: InterviewState) -> Dict[str, Any]:
+    """Async version of analyze_response_and_plan"""
+
+    if not _has_new_response(state):
+        return {}
+
+    user_response = state["messages"][-1].content
+    last_question = _latest_question(state)
+
+    messages = await asyncio.to_thread(
+        _build_turn_plan_messages, state, last_question, user_response
+    )
+    recorder = _recorder(state)
+    plan = await _ainvoke_llm("turn_planner", messages, recorder)
+
+    return {
+        **_apply_turn_plan(state, plan, last_question, user_response),
+        **_charge(state, recorder),
+    }
+
+
+def _overall_estimate(estimates: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+    return overall_estimate(estimates.values(), settings.adaptive_score_noise)
+
+
+def _adaptive_next_step(
+    state: InterviewState,
+) -> Literal["continue_topic", "next_topic", "end_interview"]:
+    """Move on once the ability estimates give a confident pass or fail verdict"""
+
+    estimates = state.get("skill_estimates") or {}
+    topic_estimate = estimates.get(_evaluation_topic(state))
+
+    # The current topic counts as covered once it has an answer
+    if (
+        topic_estimate
+        and state["topics_completed"] + 1 >= settings.adaptive_min_topics
+        and confidence(_overall_estimate(estimates)) >= settings.adaptive_confidence
+    ):
+        return "end_interview"
+
+    if state["questions_asked_current_topic"] >= settings.max_questions_per_topic:
+        return "next_topic"
+
+    if topic_estimate and confidence(topic_estimate) >= settings.adaptive_confidence:
+        return "next_topic"
+
+    return "continue_topic"
+
+
 def decide_next_step(
     state: InterviewState,
 ) -> Literal["continue_topic", "next_topic", "end_interview"]:
@@ -249,6 +926,14 @@ def decide_next_step(
     if state["topics_completed"] >= settings.max_topics:
         return "end_interview"
 
+    if not interview_budget.can_afford_question(
+        state.get("budget_usage") or {}, state["total_questions_asked"]
+    ):
+        return "end_interview"
+
+    if settings.next_step_mode == "adaptive":
+        return _adaptive_next_step(state)
+
     if state["questions_asked_current_topic"] >= settings.max_questions_per_topic:
         return "next_topic"
 
@@ -273,7 +958,15 @@ def decide_next_step(
     return "continue_topic"
 
 
-def move_to_next_topic(state: InterviewState) -> InterviewState:
+async def adecide_next_step(
+    state: InterviewState,
+) -> Literal["continue_topic", "next_topic", "end_interview"]:
+    """Async version of decide_next_step"""
+
+    return decide_next_step(state)
+
+
+def move_to_next_topic(state: InterviewState) -> Dict[str, Any]:
     """Step 6: Move onto next topic"""
 
     completed_topic = {
@@ -284,15 +977,13 @@ def move_to_next_topic(state: InterviewState) -> InterviewState:
     }
 
     return {
-        **state,
-        "topics_covered": state["topics_covered"] + [completed_topic],
+        "topics_covered": [completed_topic],
         "topics_completed": state["topics_completed"] + 1,
         "questions_asked_current_topic": 0,
         "current_domain": "",
         "current_subdomain": "",
         "current_skill": "",
-        "messages": state["messages"]
-        + [
+        "messages": [
             AIMessage(
                 content=f"[INTERNAL] Moving to next topic. Topics completed: {state['topics_completed'] + 1}"
             )
@@ -300,9 +991,102 @@ def move_to_next_topic(state: InterviewState) -> InterviewState:
     }
 
 
-def end_interview(state: InterviewState) -> InterviewState:
+async def amove_to_next_topic(state: InterviewState) -> Dict[str, Any]:
+    """Async version of move_to_next_topic"""
+
+    return move_to_next_topic(state)
+
+
+def _ask_planned_turn(state: InterviewState) -> Tuple[Dict[str, Any], bool]:
+    """Ask the planned question if it agrees with decide_next_step"""
+
+    plan = state.get("planned_turn") or {}
+    update = {"planned_turn": {}}
+
+    if plan:
+        topic_selection = _snap_topic_selection(
+            state, TopicSelection(**plan["topic_selection"])
+        )
+        planned_topic = (
+            topic_selection.selected_topic,
+            topic_selection.selected_subdomain,
+            topic_selection.selected_skill,
+        )
+        current_topic = (
+            state["current_domain"],
+            state["current_subdomain"],
+            state["current_skill"],
+        )
+        # decide_next_step has the final say; the plan only counts if it agrees
+        if state["current_domain"]:
+            plan_matches_decision = planned_topic == current_topic
+        elif settings.topic_selection_mode == "local":
+            # The scheduler picks the new topic, now with this answer's score
+            scheduled = _local_topic_selection(state)
+            plan_matches_decision = scheduled is not None and planned_topic == (
+                scheduled.selected_topic,
+                scheduled.selected_subdomain,
+                scheduled.selected_skill,
+            )
+        else:
+            last_topic = state["topics_covered"][-1] if state["topics_covered"] else {}
+            plan_matches_decision = planned_topic != (
+                last_topic.get("domain"),
+                last_topic.get("subdomain"),
+                last_topic.get("skill"),
+            )
+
+        if plan_matches_decision:
+            update = apply_update(update, _apply_topic_selection(topic_selection))
+            question = _apply_question(state, Question(**plan["question"]))
+            return apply_update(update, question), True
+
+    return update, False
+
+
+def ask_planned_question(
+    state: InterviewState, config: Optional[RunnableConfig] = None
+) -> Dict[str, Any]:
+    """Step 1+2 (fused mode): Ask the planned question, or fall back to the LLMs"""
+
+    update, asked = _ask_planned_turn(state)
+    if asked:
+        return update
+
+    update = apply_update(
+        update, analyze_taxonomy_and_select_topic(apply_update(state, update), config)
+    )
+    return apply_update(update, generate_question(apply_update(state, update), config))
+
+
+async def aask_planned_question(
+    state: InterviewState, config: Optional[RunnableConfig] = None
+) -> Dict[str, Any]:
+    """Async version of ask_planned_question"""
+
+    update, asked = await asyncio.to_thread(_ask_planned_turn, state)
+    if asked:
+        return update
+
+    update = apply_update(
+        update,
+        await aanalyze_taxonomy_and_select_topic(apply_update(state, update), config),
+    )
+    question = await agenerate_question(apply_update(state, update), config)
+    return apply_update(update, question)
+
+
+def end_interview(
+    state: InterviewState, config: Optional[RunnableConfig] = None
+) -> Dict[str, Any]:
     """Step 7: End interview and provide summary"""
 
+    thread_id = _thread_id(config)
+    budget_update = {}
+    if settings.enable_question_speculation and thread_id:
+        question_speculator.discard(thread_id, charge=False)
+        budget_update = _charge(state, _recorder(state), thread_id)
+
     total_score = sum(
         [eval_data["quality_score"] for eval_data in state["overall_performance"]]
     )
@@ -326,9 +1110,73 @@ def end_interview(state: InterviewState) -> InterviewState:
     for eval_data in state["overall_performance"]:
         summary += f"\n- {eval_data['topic']}: {eval_data['quality_score']:.2f}/1.0"
 
+    usage = interview_budget.summary(
+        budget_update.get("budget_usage") or state.get("budget_usage") or {}
+    )
+    summary += f"""
+
+    Budget Used:
+    - LLM Calls: {usage["llm_calls"]} ({usage["llm_seconds"]:.1f}s)
+    - Tokens: {usage["tokens"]}
+    - Cost: ${usage["cost"]:.4f}"""
+    for name, remaining in usage["remaining"].items():
+        summary += f"\n    - Remaining {name}: {remaining:g}"
+
+    if settings.next_step_mode == "adaptive" and state.get("skill_estimates"):
+        estimate = _overall_estimate(state["skill_estimates"])
+        summary += (
+            f"\n\n    Estimated Ability: {estimate['ability']:+.2f} "
+            f"(± {estimate['sd']:.2f}), pass probability "
+            f"{estimate['pass_probability']:.0%}"
+        )
+
     return {
-        **state,
         "interview_complete": True,
         "should_continue_interview": False,
-        "messages": state["messages"] + [AIMessage(content=summary)],
+        "messages": [AIMessage(content=summary)],
+        **budget_update,
     }
+
+
+async def aend_interview(
+    state: InterviewState, config: Optional[RunnableConfig] = None
+) -> Dict[str, Any]:
+    """Async version of end_interview"""
+
+    return end_interview(state, config)
+
+
+# Pre-generated opening questions, read on first use
+question_bank = QuestionBank(settings.question_bank_path)
+
+# Token, cost and time caps of each interview, and the cheaper models used as
+# they run low
+interview_budget = InterviewBudget(
+    settings.model_name,
+    max_tokens=settings.interview_max_tokens,
+    max_cost=settings.interview_max_cost,
+    max_seconds=settings.interview_max_seconds,
+    model_tiers=settings.budget_model_tiers,
+    prices=settings.budget_model_prices,
+)
+
+# Evaluations of near-identical answers to the same question, reused locally
+evaluation_cache = EvaluationCache(
+    threshold=settings.evaluation_cache_threshold,
+    max_entries=settings.evaluation_cache_max_entries,
+    audit_rate=settings.evaluation_cache_audit_rate,
+)
+
+# Background question generation for the likely next branches. Defined after
+# the nodes it reuses, which only look it up when they run
+question_speculator = QuestionSpeculator(
+    select_topic=_choose_topic,
+    generate_question=_generate_question_for_state,
+    advance_topic=move_to_next_topic,
+    max_workers=settings.speculation_max_workers,
+    recorder_for=_recorder,
+    # Questions were generated before the answer; one that moves the target
+    # difficulty needs a new question
+    question_inputs=_target_difficulty,
+    ttl=settings.speculation_ttl_seconds,
+)
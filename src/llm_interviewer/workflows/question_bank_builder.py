@@ -0,0 +1,48 @@
+"""Pre-generate the question bank served when ``question_source`` is ``bank``.
+
+Run from the repository root:
+
+    python -m src.llm_interviewer.workflows.question_bank_builder --per-slot 3
+"""
+
+import argparse
+import logging
+
+from ..config.settings import settings
+from ..config.taxonomy import load_taxonomy
+from ..models.pydantic_models import QuestionPool
+from ..utils.question_bank import build_question_bank
+from .nodes import create_llm_with_tracing
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--taxonomy", help="Taxonomy JSON file (default: bundled)")
+    parser.add_argument("--output", default=settings.question_bank_path)
+    parser.add_argument(
+        "--per-slot",
+        type=int,
+        default=3,
+        help="Questions per skill, knowledge area and difficulty",
+    )
+    parser.add_argument("--max-concurrency", type=int, default=8)
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+    pool_llm = create_llm_with_tracing("question_bank", ["question_bank"], QuestionPool)
+
+    written = build_question_bank(
+        load_taxonomy(args.taxonomy),
+        args.output,
+        lambda prompts: pool_llm.batch(
+            prompts, config={"max_concurrency": args.max_concurrency}
+        ),
+        per_slot=args.per_slot,
+        batch_size=4 * args.max_concurrency,
+    )
+    print(f"Wrote {written} questions to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
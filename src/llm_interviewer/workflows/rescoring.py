@@ -0,0 +1,265 @@
+"""Re-score past answers in bulk with the current evaluator prompt and model.
+
+Input is JSONL with one answer per line: ``question``, ``response`` and
+``topic``, the "Domain - Subdomain - Skill" label of evaluation records. Other
+fields are copied to the output. Results go to JSONL, or to a directory of
+Parquet parts when the output ends in ``.parquet``.
+
+Run from the repository root:
+
+    python -m src.llm_interviewer.workflows.rescoring answers.jsonl scores.jsonl
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import os
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from langchain_core.runnables import Runnable, RunnableLambda
+
+from ..config.settings import settings
+from .nodes import build_evaluation_messages, get_llm
+
+PROGRESS_SUFFIX = ".progress.json"
+
+
+def iter_records(path: str, start: int = 0) -> Iterator[Dict[str, Any]]:
+    """Stream the records of a JSONL file, skipping the first ``start``"""
+    with open(path, "r", encoding="utf-8") as f:
+        lines = (line for line in f if line.strip())
+        for line in itertools.islice(lines, start, None):
+            yield json.loads(line)
+
+
+def iter_batches(
+    records: Iterable[Dict[str, Any]], size: int
+) -> Iterator[List[Dict[str, Any]]]:
+    iterator = iter(records)
+    while batch := list(itertools.islice(iterator, size)):
+        yield batch
+
+
+def record_state(record: Dict[str, Any]) -> Dict[str, Any]:
+    """Build the state fields the evaluation prompt reads from a record"""
+    topic = record.get("topic") or ""
+    domain, subdomain, skill = (topic.split(" - ", 2) + ["", "", ""])[:3]
+    return {
+        "current_domain": record.get("domain", domain),
+        "current_subdomain": record.get("subdomain", subdomain),
+        "current_skill": record.get("skill", skill),
+        "questions_asked_current_topic": record.get("question_number", 1),
+    }
+
+
+def record_evaluator() -> Runnable:
+    """Evaluate records with the interview's evaluator prompt and LLM"""
+    build_messages = RunnableLambda(
+        lambda record: build_evaluation_messages(
+            record_state(record), record["question"], record["response"]
+        )
+    )
+    return build_messages | get_llm("evaluator")
+
+
+class JsonlResultWriter:
+    """Append results to a JSONL file, truncated to the last committed batch"""
+
+    def __init__(self, path: str, committed_bytes: int):
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.file = open(path, "r+b" if os.path.exists(path) else "wb")
+        # Drop results written after the last checkpoint by a crashed run
+        self.file.truncate(committed_bytes)
+        self.file.seek(committed_bytes)
+
+    def write(self, rows: List[Dict[str, Any]], offset: int) -> int:
+        """Write rows durably, returning the committed size of the file"""
+        for row in rows:
+            self.file.write(json.dumps(row, ensure_ascii=False).encode("utf-8"))
+            self.file.write(b"\n")
+        self.file.flush()
+        os.fsync(self.file.fileno())
+        return self.file.tell()
+
+    def close(self):
+        self.file.close()
+
+
+class ParquetResultWriter:
+    """Write each batch of results as a Parquet part named by its offset"""
+
+    def __init__(self, path: str, committed_bytes: int):
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise ImportError("Parquet output requires pyarrow: pip install pyarrow")
+
+        self.pa, self.pq = pa, pq
+        self.path = path
+        os.makedirs(path, exist_ok=True)
+
+    def write(self, rows: List[Dict[str, Any]], offset: int) -> int:
+        # Rewriting the part of an unfinished batch on resume replaces it
+        part = os.path.join(self.path, f"part-{offset:09d}.parquet")
+        self.pq.write_table(self.pa.Table.from_pylist(rows), part)
+        return 0
+
+    def close(self):
+        pass
+
+
+def _open_writer(path: str, committed_bytes: int):
+    if path.endswith(".parquet"):
+        return ParquetResultWriter(path, committed_bytes)
+    return JsonlResultWriter(path, committed_bytes)
+
+
+def _progress_path(output_path: str) -> str:
+    return output_path.rstrip("/") + PROGRESS_SUFFIX
+
+
+def _load_progress(output_path: str, input_path: str) -> Dict[str, Any]:
+    path = _progress_path(output_path)
+    if not os.path.exists(path):
+        return {"input": os.path.abspath(input_path), "offset": 0, "output_bytes": 0}
+
+    with open(path, "r", encoding="utf-8") as f:
+        progress = json.load(f)
+    if progress["input"] != os.path.abspath(input_path):
+        raise ValueError(
+            f"{output_path} holds results for {progress['input']}; "
+            "choose another output to re-score a different input"
+        )
+    return progress
+
+
+def _save_progress(output_path: str, progress: Dict[str, Any]):
+    path = _progress_path(output_path)
+    with open(f"{path}.tmp", "w", encoding="utf-8") as f:
+        json.dump(progress, f)
+    os.replace(f"{path}.tmp", path)
+
+
+def _result(record: Dict[str, Any], evaluation: Any) -> Dict[str, Any]:
+    if isinstance(evaluation, Exception):
+        return {
+            **record,
+            "evaluation": None,
+            "error": f"{type(evaluation).__name__}: {evaluation}",
+        }
+    return {**record, "evaluation": evaluation.model_dump(), "error": None}
+
+
+class _Run:
+    """Checkpointed state of one re-scoring run"""
+
+    def __init__(self, input_path: str, output_path: str):
+        self.output_path = output_path
+        self.progress = _load_progress(output_path, input_path)
+        self.writer = _open_writer(output_path, self.progress["output_bytes"])
+        self.stats = {"skipped": self.progress["offset"], "scored": 0, "failed": 0}
+
+    def batches(self, batch_size: int) -> Iterator[List[Dict[str, Any]]]:
+        records = iter_records(self.progress["input"], self.progress["offset"])
+        return iter_batches(records, batch_size)
+
+    def commit(self, batch: List[Dict[str, Any]], evaluations: List[Any]):
+        """Write a batch's results, then move the checkpoint past it"""
+        # Interrupts stop the run before the batch is committed
+        for evaluation in evaluations:
+            if isinstance(evaluation, BaseException) and not isinstance(
+                evaluation, Exception
+            ):
+                raise evaluation
+
+        rows = [_result(record, e) for record, e in zip(batch, evaluations)]
+        failed = sum(row["error"] is not None for row in rows)
+        self.stats["failed"] += failed
+        self.stats["scored"] += len(rows) - failed
+
+        output_bytes = self.writer.write(rows, self.progress["offset"])
+        self.progress.update(
+            offset=self.progress["offset"] + len(rows), output_bytes=output_bytes
+        )
+        _save_progress(self.output_path, self.progress)
+
+
+def rescore_transcripts(
+    input_path: str,
+    output_path: str,
+    evaluator: Optional[Runnable] = None,
+    max_concurrency: int = 8,
+    max_attempts: int = 3,
+    batch_size: int = 64,
+) -> Dict[str, int]:
+    """Evaluate every record of a JSONL file, resuming an interrupted run.
+
+    Records are read and written one batch at a time, so memory does not grow
+    with the input. Each evaluation is retried up to ``max_attempts`` times; one
+    still failing is written with its error instead of stopping the run.
+    Progress is checkpointed next to the output after each batch.
+    """
+    run = _Run(input_path, output_path)
+    evaluator = (evaluator or record_evaluator()).with_retry(
+        stop_after_attempt=max_attempts
+    )
+    config = {"max_concurrency": max_concurrency}
+    try:
+        for batch in run.batches(batch_size):
+            run.commit(batch, evaluator.batch(batch, config, return_exceptions=True))
+    finally:
+        run.writer.close()
+    return run.stats
+
+
+async def arescore_transcripts(
+    input_path: str,
+    output_path: str,
+    evaluator: Optional[Runnable] = None,
+    max_concurrency: int = 8,
+    max_attempts: int = 3,
+    batch_size: int = 64,
+) -> Dict[str, int]:
+    """Async version of rescore_transcripts"""
+    run = _Run(input_path, output_path)
+    evaluator = (evaluator or record_evaluator()).with_retry(
+        stop_after_attempt=max_attempts
+    )
+    config = {"max_concurrency": max_concurrency}
+    try:
+        for batch in run.batches(batch_size):
+            evaluations = await evaluator.abatch(batch, config, return_exceptions=True)
+            run.commit(batch, evaluations)
+    finally:
+        run.writer.close()
+    return run.stats
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("input", help="JSONL file of question, response and topic")
+    parser.add_argument("output", help="JSONL file, or a directory ending .parquet")
+    parser.add_argument("--max-concurrency", type=int, default=8)
+    parser.add_argument(
+        "--max-attempts", type=int, default=settings.llm_max_retries + 1
+    )
+    parser.add_argument("--batch-size", type=int, default=64)
+    parser.add_argument("--use-async", action="store_true", help="Use abatch")
+    args = parser.parse_args(argv)
+
+    kwargs = dict(
+        max_concurrency=args.max_concurrency,
+        max_attempts=args.max_attempts,
+        batch_size=args.batch_size,
+    )
+    if args.use_async:
+        stats = asyncio.run(arescore_transcripts(args.input, args.output, **kwargs))
+    else:
+        stats = rescore_transcripts(args.input, args.output, **kwargs)
+    print(json.dumps(stats))
+
+
+if __name__ == "__main__":
+    main()
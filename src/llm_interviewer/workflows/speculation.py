@@ -0,0 +1,295 @@
+import logging
+import threading
+import time
+from concurrent.futures import CancelledError, Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from ..models.interview_state import InterviewState, apply_update
+from ..models.pydantic_models import Question, TopicSelection
+from ..utils.interview_budget import UsageRecorder
+
+logger = logging.getLogger(__name__)
+
+CONTINUE_TOPIC = "continue_topic"
+NEXT_TOPIC = "next_topic"
+
+
+@dataclass
+class SpeculativeQuestion:
+    """A question generated ahead of time for one branch of decide_next_step"""
+
+    branch: str
+    topic_selection: Optional[TopicSelection]
+    question: Question
+    domain: str
+    subdomain: str
+    skill: str
+    tokens: int
+    recorder: Optional[UsageRecorder] = None
+    inputs: Any = None
+
+    @property
+    def topic(self) -> Tuple[str, str, str]:
+        return (self.domain, self.subdomain, self.skill)
+
+
+class QuestionSpeculator:
+    """Pre-generate the next question while the candidate is answering.
+
+    After the graph pauses for input, ``prefetch`` starts one background job per
+    likely branch of ``decide_next_step``. The nodes then ``take`` the job for the
+    branch that actually ran and keep it if it targets the same topic. All other
+    jobs for the thread are discarded and their tokens counted as wasted. The
+    next_topic job's topic selection has its own future, so ``peek_topic`` does
+    not wait for that job's question.
+
+    A job runs on the state before the answer. With ``question_inputs``, what
+    it returns for that state, e.g. the target difficulty, must also be what it
+    returns once the answer is in, or the question is not used.
+
+    With ``recorder_for``, each job's LLM calls are recorded with the recorder it
+    returns for the paused state, which is passed on to ``select_topic`` and
+    ``generate_question``. Recorders of taken and discarded jobs alike are kept
+    until the thread's nodes collect them with ``pop_usage``, so the interview
+    pays for everything it speculated. Threads that are not resumed within
+    ``ttl`` seconds are dropped, usage included.
+    """
+
+    # Seconds between sweeps for threads past their ttl
+    expiry_interval = 60.0
+
+    def __init__(
+        self,
+        select_topic: Callable[..., Tuple[TopicSelection, int]],
+        generate_question: Callable[..., Tuple[Question, int]],
+        advance_topic: Callable[[InterviewState], Dict[str, Any]],
+        max_workers: int = 4,
+        recorder_for: Optional[Callable[[InterviewState], UsageRecorder]] = None,
+        question_inputs: Optional[Callable[[InterviewState], Any]] = None,
+        ttl: Optional[float] = 3600.0,
+    ):
+        self._select_topic = select_topic
+        self._generate_question = generate_question
+        self._advance_topic = advance_topic
+        self._max_workers = max_workers
+        self._recorder_for = recorder_for
+        self._question_inputs = question_inputs
+        self.ttl = ttl
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._pending: Dict[str, Dict[str, Future]] = {}
+        # Topic selections of pending next_topic jobs, resolved before the question
+        self._topics: Dict[str, Future] = {}
+        # Recorders of finished jobs not yet charged to their thread
+        self._usage: Dict[str, List[UsageRecorder]] = {}
+        # When each thread last prefetched
+        self._touched: Dict[str, float] = {}
+        self._last_expiry = time.monotonic()
+        self._lock = threading.Lock()
+        self.reset_stats()
+
+    def reset_stats(self):
+        """Reset hit, miss and token counters"""
+        self.launched = 0
+        self.hits = 0
+        self.misses = 0
+        self.used_tokens = 0
+        self.wasted_tokens = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Get speculation hit rate and token usage"""
+        resolved = self.hits + self.misses
+        return {
+            "launched": self.launched,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / resolved if resolved else 0.0,
+            "used_tokens": self.used_tokens,
+            "wasted_tokens": self.wasted_tokens,
+        }
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self._max_workers,
+                thread_name_prefix="question-speculation",
+            )
+        return self._executor
+
+    def _speculate(
+        self, branch: str, state: InterviewState, topic: Optional[Future] = None
+    ) -> SpeculativeQuestion:
+        topic_selection = None
+        tokens = 0
+        recorder = None
+        args = ()
+        if self._recorder_for is not None:
+            recorder = self._recorder_for(state)
+            args = (recorder,)
+        if branch == NEXT_TOPIC:
+            if topic is not None and not topic.set_running_or_notify_cancel():
+                raise CancelledError()
+            try:
+                state = apply_update(state, self._advance_topic(state))
+                topic_selection, tokens = self._select_topic(state, *args)
+            except BaseException as e:
+                if topic is not None:
+                    topic.set_exception(e)
+                raise
+            if topic is not None:
+                topic.set_result(topic_selection)
+            state = {
+                **state,
+                "current_domain": topic_selection.selected_topic,
+                "current_subdomain": topic_selection.selected_subdomain,
+                "current_skill": topic_selection.selected_skill,
+            }
+
+        question, question_tokens = self._generate_question(state, *args)
+        return SpeculativeQuestion(
+            branch=branch,
+            topic_selection=topic_selection,
+            question=question,
+            domain=state["current_domain"],
+            subdomain=state["current_subdomain"],
+            skill=state["current_skill"],
+            tokens=tokens + question_tokens,
+            recorder=recorder,
+            inputs=self._inputs(state),
+        )
+
+    def _inputs(self, state: InterviewState) -> Any:
+        return self._question_inputs(state) if self._question_inputs else None
+
+    def prefetch(self, thread_id: str, state: InterviewState):
+        """Start generating the next question for every likely branch"""
+        self.discard(thread_id)
+        self._expire()
+
+        executor = self._get_executor()
+        topic: Future = Future()
+        futures = {
+            CONTINUE_TOPIC: executor.submit(self._speculate, CONTINUE_TOPIC, state),
+            NEXT_TOPIC: executor.submit(self._speculate, NEXT_TOPIC, state, topic),
+        }
+        with self._lock:
+            self._pending[thread_id] = futures
+            self._topics[thread_id] = topic
+            self._touched[thread_id] = time.monotonic()
+            self.launched += len(futures)
+
+    def _expire(self):
+        """Drop threads that were not resumed within the ttl, e.g. abandoned ones"""
+        now = time.monotonic()
+        if self.ttl is None or now - self._last_expiry < self.expiry_interval:
+            return
+        dropped = []
+        with self._lock:
+            self._last_expiry = now
+            for thread_id, touched in list(self._touched.items()):
+                if now - touched > self.ttl:
+                    del self._touched[thread_id]
+                    self._usage.pop(thread_id, None)
+                    dropped.append(self._topics.pop(thread_id, None))
+                    dropped.extend(self._pending.pop(thread_id, {}).values())
+        for future in dropped:
+            if future is not None:
+                future.cancel()
+
+    def _result(self, future: Future) -> Optional[SpeculativeQuestion]:
+        try:
+            return future.result()
+        except Exception as e:
+            logger.warning(f"Speculative question generation failed: {e}")
+            return None
+
+    def _keep_usage(self, thread_id: str, result: SpeculativeQuestion):
+        """Hold a job's recorder until its thread is charged; call with the lock"""
+        if result.recorder is not None and result.recorder.calls:
+            self._usage.setdefault(thread_id, []).append(result.recorder)
+
+    def _waste(self, thread_id: str, future: Future, charge: bool = True):
+        """Count a discarded job's tokens, and keep its usage, once it finishes"""
+        if future.cancel():
+            return
+        # Usage of a job that already finished is kept even for a finished thread
+        charge = charge or future.done()
+
+        def record(done: Future):
+            if not done.cancelled() and done.exception() is None:
+                with self._lock:
+                    self.wasted_tokens += done.result().tokens
+                    if charge:
+                        self._keep_usage(thread_id, done.result())
+
+        future.add_done_callback(record)
+
+    def pop_usage(self, thread_id: str) -> List[UsageRecorder]:
+        """Take the recorders of a thread's finished jobs, to charge to its budget"""
+        with self._lock:
+            return self._usage.pop(thread_id, [])
+
+    def peek_topic(self, thread_id: str) -> Optional[TopicSelection]:
+        """Get the speculated topic selection for the next_topic branch.
+
+        Waits for the selection only, not for the question generated after it.
+        """
+        with self._lock:
+            topic = self._topics.get(thread_id)
+        if topic is None:
+            return None
+        return self._result(topic)
+
+    def take(
+        self,
+        thread_id: str,
+        branch: str,
+        topic: Tuple[str, str, str],
+        state: Optional[InterviewState] = None,
+    ) -> Optional[Question]:
+        """Commit the speculated question for a branch if it is still valid.
+
+        It must target ``topic`` and, given the current ``state``, have the same
+        ``question_inputs`` as when it was generated.
+        """
+        with self._lock:
+            futures = self._pending.pop(thread_id, None)
+            self._topics.pop(thread_id, None)
+        if not futures:
+            return None
+
+        future = futures.pop(branch, None)
+        for other in futures.values():
+            self._waste(thread_id, other)
+
+        result = self._result(future) if future is not None else None
+        inputs = self._inputs(state) if state is not None else None
+        with self._lock:
+            if result is not None:
+                self._keep_usage(thread_id, result)
+            if result is not None and result.topic == topic:
+                if state is None or result.inputs == inputs:
+                    self.hits += 1
+                    self.used_tokens += result.tokens
+                    return result.question
+            self.misses += 1
+            if result is not None:
+                self.wasted_tokens += result.tokens
+        return None
+
+    def discard(self, thread_id: str, charge: bool = True):
+        """Throw away any speculation for a thread.
+
+        Without ``charge`` the thread is finished, so only jobs that are already
+        done keep their usage for ``pop_usage``, and ones still running do not
+        leave usage behind that nothing would collect.
+        """
+        with self._lock:
+            futures = self._pending.pop(thread_id, None)
+            topic = self._topics.pop(thread_id, None)
+            if not charge:
+                self._touched.pop(thread_id, None)
+        if topic is not None:
+            topic.cancel()
+        for future in (futures or {}).values():
+            self._waste(thread_id, future, charge)
@@ -0,0 +1,119 @@
+from typing import Any, Dict, List, Optional, Tuple
+
+from langchain_core.messages import AIMessage, AIMessageChunk
+from langchain_core.utils.json import parse_partial_json
+
+# Tag carried by the question generator LLM, used to pick its tokens out of the
+# "messages" stream
+QUESTION_GENERATION_TAG = "question_generation"
+
+NODE_PROGRESS = {
+    "analyze_response": "Evaluation complete",
+    "analyze_and_select": "Topic chosen",
+    "generate_question": "Question ready",
+    "ask_planned_question": "Question ready",
+    "next_topic": "Moving to the next topic",
+    "end_interview": "Interview complete",
+}
+
+QUESTION_NODES = ("generate_question", "ask_planned_question")
+
+
+def _chunk_text(chunk: AIMessageChunk) -> str:
+    """Get the raw structured-output text carried by a streamed chunk"""
+    if chunk.tool_call_chunks:
+        return "".join(tc.get("args") or "" for tc in chunk.tool_call_chunks)
+    return chunk.content if isinstance(chunk.content, str) else ""
+
+
+class InterviewStreamTranslator:
+    """Turn LangGraph "updates" and "messages" stream parts into UI events.
+
+    Events are dicts with a ``type`` of ``progress`` (a node finished, with a short
+    ``message`` and the node's ``data``) or ``token`` (the next piece of the
+    question ``text``). Question tokens are decoded from the partial JSON of the
+    question generator's structured output as it arrives.
+    """
+
+    def __init__(self):
+        self._buffer = ""
+        self._streamed = 0
+
+    def feed(self, mode: str, payload: Any) -> List[Dict[str, Any]]:
+        if mode == "messages":
+            return self._on_message(*payload)
+        if mode == "updates":
+            return self._on_updates(payload)
+        return []
+
+    def _on_message(self, chunk: Any, metadata: Dict[str, Any]) -> List[Dict[str, Any]]:
+        if not isinstance(chunk, AIMessageChunk):
+            return []
+        if QUESTION_GENERATION_TAG not in (metadata.get("tags") or []):
+            return []
+
+        self._buffer += _chunk_text(chunk)
+        parsed = parse_partial_json(self._buffer) if self._buffer else None
+        question = parsed.get("question") if isinstance(parsed, dict) else None
+        if not isinstance(question, str) or len(question) <= self._streamed:
+            return []
+
+        text = question[self._streamed :]
+        self._streamed = len(question)
+        return [{"type": "token", "text": text}]
+
+    def _on_updates(self, updates: Dict[str, Any]) -> List[Dict[str, Any]]:
+        events = []
+        for node, update in (updates or {}).items():
+            if node not in NODE_PROGRESS:
+                continue
+            update = update or {}
+            events.append(
+                {
+                    "type": "progress",
+                    "node": node,
+                    "message": NODE_PROGRESS[node],
+                    "data": _progress_data(node, update),
+                }
+            )
+            if node in QUESTION_NODES:
+                events.extend(self._finish_question(update))
+        return events
+
+    def _finish_question(self, update: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Emit whatever part of the question was not streamed token by token"""
+        question = _latest_question(update.get("messages") or [])
+        events = []
+        if question and len(question) > self._streamed:
+            events.append({"type": "token", "text": question[self._streamed :]})
+        self._buffer = ""
+        self._streamed = 0
+        return events
+
+
+def _latest_question(messages: List[Any]) -> Optional[str]:
+    for msg in reversed(messages):
+        if isinstance(msg, AIMessage) and not msg.content.startswith("[INTERNAL]"):
+            return msg.content
+    return None
+
+
+def _topic(update: Dict[str, Any]) -> Tuple[str, str, str]:
+    return (
+        update.get("current_domain", ""),
+        update.get("current_subdomain", ""),
+        update.get("current_skill", ""),
+    )
+
+
+def _progress_data(node: str, update: Dict[str, Any]) -> Dict[str, Any]:
+    if node == "analyze_response":
+        evaluation = update.get("current_evaluation") or {}
+        return {
+            "quality_score": evaluation.get("quality_score"),
+            "should_continue_topic": evaluation.get("should_continue_topic"),
+        }
+    if node == "analyze_and_select":
+        domain, subdomain, skill = _topic(update)
+        return {"domain": domain, "subdomain": subdomain, "skill": skill}
+    return {}
@@ -1,4 +1,5 @@
 import os
+import uuid
 from datetime import datetime
 
 import streamlit as st
@@ -8,7 +9,6 @@ if "OPENAI_API_KEY" not in os.environ:
     st.error("Please set OPENAI_API_KEY environment variable")
     st.stop()
 
-from llm_interviewer.config.taxonomy import INTERVIEW_DOMAINS
 from llm_interviewer.workflows.interview_workflow import InterviewWorkflow
 
 # Page configuration
@@ -19,9 +19,18 @@ st.set_page_config(
     initial_sidebar_state="expanded",
 )
 
+
+@st.cache_resource
+def get_interview_workflow() -> InterviewWorkflow:
+    """One compiled graph and checkpointer shared by every browser session"""
+    workflow = InterviewWorkflow.shared()
+    workflow.warm_up()
+    return workflow
+
+
 # Initialize session state
 if "interview_workflow" not in st.session_state:
-    st.session_state.interview_workflow = InterviewWorkflow()
+    st.session_state.interview_workflow = get_interview_workflow()
 
 if "interview_started" not in st.session_state:
     st.session_state.interview_started = False
@@ -39,6 +48,25 @@ if "conversation_history" not in st.session_state:
 if "current_response" not in st.session_state:
     st.session_state.current_response = ""
 
+
+def consume_stream(events):
+    """Render progress and question tokens as they arrive, return the final state"""
+    status = st.empty()
+    question = st.empty()
+    text = ""
+    result, config = None, None
+    for event in events:
+        if event["type"] == "progress":
+            status.caption(f"⏳ {event['message']}...")
+        elif event["type"] == "token":
+            text += event["text"]
+            question.markdown(f"*{text}*")
+        elif event["type"] == "state":
+            result, config = event["state"], event["config"]
+    status.empty()
+    return result, config
+
+
 # Sidebar
 with st.sidebar:
     st.title("🤖 AI Technical Interviewer")
@@ -49,9 +77,10 @@ with st.sidebar:
 
     if not st.session_state.interview_started:
         if st.button("Start Interview", type="primary", use_container_width=True):
-            thread_id = f"interview_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-            result, config = st.session_state.interview_workflow.start_interview(
-                thread_id
+            # Sessions share the checkpointer, so thread IDs must be unique
+            thread_id = f"interview_{uuid.uuid4().hex}"
+            result, config = consume_stream(
+                st.session_state.interview_workflow.stream_start_interview(thread_id)
             )
 
             st.session_state.interview_state = result
@@ -146,7 +175,7 @@ if not st.session_state.interview_started:
 
     # Show taxonomy
     with st.expander("📋 View Interview Taxonomy"):
-        st.json(INTERVIEW_DOMAINS)
+        st.json(st.session_state.interview_workflow.get_taxonomy())
 
 else:
     # Interview in progress
@@ -188,12 +217,15 @@ else:
 
                 st.session_state.current_response = ""
 
-                # Continue interview
-                with st.spinner("AI is evaluating your response..."):
-                    result = st.session_state.interview_workflow.continue_interview(
+                # Continue interview, showing progress and the next question as
+                # it is generated
+                st.markdown("### 🤖 Next Question:")
+                result, _ = consume_stream(
+                    st.session_state.interview_workflow.stream_continue_interview(
                         user_response, st.session_state.interview_config
                     )
-                    st.session_state.interview_state = result
+                )
+                st.session_state.interview_state = result
 
                 # Check if interview is complete
                 if result.get("interview_complete"):
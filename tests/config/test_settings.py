@@ -20,6 +20,7 @@ class TestSettings:
         assert settings.temperature == 0.05
         assert settings.max_topics == 2
         assert settings.max_questions_per_topic == 3
+        assert settings.topic_selection_mode == "llm"
         assert settings.langchain_tracing_v2 is False
         assert settings.environment == "development"
 
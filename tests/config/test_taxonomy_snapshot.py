@@ -0,0 +1,86 @@
+"""Tests for compiled taxonomy snapshots."""
+
+import json
+import os
+
+import pytest
+
+from src.llm_interviewer.config import taxonomy_snapshot
+from src.llm_interviewer.config.taxonomy import load_taxonomy
+from src.llm_interviewer.config.taxonomy_snapshot import snapshot_path
+
+
+@pytest.fixture
+def taxonomy_file(tmp_path, sample_taxonomy):
+    path = tmp_path / "taxonomy.json"
+    path.write_text(json.dumps(sample_taxonomy))
+    return path
+
+
+@pytest.fixture
+def parse_count(monkeypatch):
+    """Count full JSON parses made by load_taxonomy."""
+    calls = []
+    real_loads = json.loads
+
+    def counting_loads(*args, **kwargs):
+        calls.append(1)
+        return real_loads(*args, **kwargs)
+
+    monkeypatch.setattr(json, "loads", counting_loads)
+    return calls
+
+
+class TestTaxonomySnapshot:
+    """Test loading taxonomies through their snapshots."""
+
+    def test_written_and_reused(self, taxonomy_file, sample_taxonomy, parse_count):
+        """Test that the first load writes a snapshot and later loads use it."""
+        first = load_taxonomy(taxonomy_file)
+        second = load_taxonomy(taxonomy_file)
+
+        assert snapshot_path(taxonomy_file).exists()
+        assert first == second == sample_taxonomy
+        assert len(parse_count) == 1
+
+    def test_changed_source_is_parsed(self, taxonomy_file, sample_taxonomy):
+        """Test that an edited source replaces a stale snapshot."""
+        load_taxonomy(taxonomy_file)
+        sample_taxonomy["domains"][0]["name"] = "Edited Domain"
+        taxonomy_file.write_text(json.dumps(sample_taxonomy))
+
+        assert load_taxonomy(taxonomy_file)["domains"][0]["name"] == "Edited Domain"
+        assert load_taxonomy(taxonomy_file)["domains"][0]["name"] == "Edited Domain"
+
+    def test_touched_source_uses_hash(self, taxonomy_file, parse_count):
+        """Test that a new mtime with the same content keeps the snapshot."""
+        load_taxonomy(taxonomy_file)
+        stat = taxonomy_file.stat()
+        os.utime(taxonomy_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        load_taxonomy(taxonomy_file)
+
+        assert len(parse_count) == 1
+
+    def test_corrupt_snapshot_is_ignored(self, taxonomy_file, sample_taxonomy):
+        """Test that an unreadable snapshot falls back to parsing."""
+        load_taxonomy(taxonomy_file)
+        snapshot_path(taxonomy_file).write_bytes(taxonomy_snapshot.MAGIC + b"\xff")
+
+        assert load_taxonomy(taxonomy_file) == sample_taxonomy
+
+    def test_invalid_taxonomy_has_no_snapshot(self, tmp_path):
+        """Test that only valid taxonomies are compiled."""
+        path = tmp_path / "invalid.json"
+        path.write_text(json.dumps({"domains": [{"subdomains": []}]}))
+
+        assert load_taxonomy(path) == {"domains": [{"subdomains": []}]}
+        assert not snapshot_path(path).exists()
+        with pytest.raises(ValueError):
+            load_taxonomy(path, validate=True)
+
+    def test_compile_step(self, taxonomy_file):
+        """Test compiling a snapshot ahead of time."""
+        taxonomy_snapshot.main([str(taxonomy_file)])
+
+        assert snapshot_path(taxonomy_file).exists()
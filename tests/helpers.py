@@ -0,0 +1,40 @@
+"""Chat models and graph states shared by tests."""
+
+import operator
+from typing import Annotated, List, TypedDict
+
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import AIMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+
+
+class ProviderChatModel(BaseChatModel):
+    """Reply like a provider client, with token usage and llm_output"""
+
+    content: str = "Next question?"
+    input_tokens: int = 1000
+    output_tokens: int = 100
+
+    @property
+    def _llm_type(self) -> str:
+        return "provider"
+
+    def _generate(self, messages, stop=None, run_manager=None, **kwargs):
+        message = AIMessage(
+            content=self.content,
+            usage_metadata={
+                "input_tokens": self.input_tokens,
+                "output_tokens": self.output_tokens,
+                "total_tokens": self.input_tokens + self.output_tokens,
+            },
+        )
+        return ChatResult(
+            generations=[ChatGeneration(message=message)],
+            llm_output={"model_name": "provider"},
+        )
+
+
+class State(TypedDict):
+    """Graph state that collects the messages of each node"""
+
+    messages: Annotated[List[str], operator.add]
@@ -2,7 +2,8 @@
 
 from langchain_core.messages import AIMessage, HumanMessage
 
-from src.llm_interviewer.models.interview_state import InterviewState
+from src.llm_interviewer.config.settings import settings
+from src.llm_interviewer.models.interview_state import InterviewState, apply_update
 
 
 class TestInterviewState:
@@ -146,3 +147,57 @@ class TestInterviewState:
         assert state["current_evaluation"]["quality_score"] == 0.85
         assert len(state["overall_performance"]) == 1
         assert state["overall_performance"][0]["average_score"] == 0.75
+
+
+class TestApplyUpdate:
+    """Test applying node updates the way the graph reducers do."""
+
+    def test_appends_list_fields_and_replaces_others(self):
+        """Test that reducer fields are appended and plain fields replaced."""
+        state = {
+            "messages": [AIMessage(content="Question?")],
+            "topics_covered": [],
+            "total_questions_asked": 1,
+        }
+        update = {
+            "messages": [HumanMessage(content="Answer")],
+            "total_questions_asked": 2,
+        }
+
+        merged = apply_update(state, update)
+
+        assert [msg.content for msg in merged["messages"]] == ["Question?", "Answer"]
+        assert merged["total_questions_asked"] == 2
+        assert merged["topics_covered"] == []
+        assert len(state["messages"]) == 1
+
+    def test_combines_consecutive_updates(self):
+        """Test that two updates combine into one with both appends."""
+        first = {"messages": [AIMessage(content="Topic")], "current_domain": "A"}
+        second = {"messages": [AIMessage(content="Question?")]}
+
+        combined = apply_update(first, second)
+
+        assert [msg.content for msg in combined["messages"]] == ["Topic", "Question?"]
+        assert combined["current_domain"] == "A"
+
+    def test_keeps_latest_messages(self, monkeypatch):
+        """Test that only the message window is kept, while answers all stay."""
+        monkeypatch.setattr(settings, "state_message_window", 3)
+        state = {
+            "messages": [AIMessage(content=f"Question {i}?") for i in range(3)],
+            "overall_performance": [{"question": "Question 0?"}],
+        }
+        update = {
+            "messages": [HumanMessage(content="Answer")],
+            "overall_performance": [{"question": "Question 2?"}],
+        }
+
+        merged = apply_update(state, update)
+
+        assert [msg.content for msg in merged["messages"]] == [
+            "Question 1?",
+            "Question 2?",
+            "Answer",
+        ]
+        assert len(merged["overall_performance"]) == 2
@@ -0,0 +1,130 @@
+"""Tests for the compiled, indexed taxonomy."""
+
+import pytest
+
+from src.llm_interviewer.config.taxonomy import get_taxonomy_summary
+from src.llm_interviewer.utils.compiled_taxonomy import CompiledTaxonomy, normalize_name
+from src.llm_interviewer.utils.taxonomy_manager import TaxonomyManager
+
+
+@pytest.fixture
+def taxonomy():
+    """Taxonomy with two domains and four skills."""
+    return {
+        "domains": [
+            {
+                "name": "Machine Learning",
+                "subdomains": [
+                    {
+                        "name": "Evaluation",
+                        "core_skills": [
+                            {"name": "Metrics", "knowledge_areas": ["F1"]},
+                            {"name": "Cross-Validation"},
+                        ],
+                    }
+                ],
+            },
+            {
+                "name": "Systems",
+                "subdomains": [
+                    {"name": "Serving", "core_skills": [{"name": "Metrics"}]},
+                    {"name": "Caching", "core_skills": [{"name": "Eviction"}]},
+                ],
+            },
+        ]
+    }
+
+
+@pytest.fixture
+def compiled(taxonomy):
+    return CompiledTaxonomy(taxonomy)
+
+
+class TestCompiledTaxonomy:
+    """Test indexing and exact lookups."""
+
+    def test_lookups(self, compiled):
+        """Test that each level is found by name."""
+        skill = compiled.skill("Machine Learning", "Evaluation", "Metrics")
+
+        assert len(compiled) == 4
+        assert skill.knowledge_areas == ("F1",)
+        assert skill.path == ("Machine Learning", "Evaluation", "Metrics")
+        assert ("Systems", "Caching", "Eviction") in compiled
+        assert compiled.subdomain("Systems", "Serving").skills[0].name == "Metrics"
+        assert compiled.domain("Unknown") is None
+
+    def test_summary_matches(self, taxonomy, compiled):
+        """Test that the summary has the same structure as the dict version."""
+        assert compiled.summary() == get_taxonomy_summary(taxonomy)
+
+    def test_duplicate_skill_keeps_first(self, taxonomy):
+        """Test that a repeated skill does not add a second node."""
+        skills = taxonomy["domains"][1]["subdomains"][1]["core_skills"]
+        skills.append({"name": "Eviction", "knowledge_areas": ["LRU"]})
+
+        compiled = CompiledTaxonomy(taxonomy)
+
+        assert len(compiled) == 4
+        assert compiled.skill("Systems", "Caching", "Eviction").knowledge_areas == ()
+
+    def test_skill_without_name(self, taxonomy):
+        """Test that a skill without a name is rejected."""
+        taxonomy["domains"][0]["subdomains"][0]["core_skills"].append({})
+
+        with pytest.raises(ValueError):
+            CompiledTaxonomy(taxonomy)
+
+
+class TestSnap:
+    """Test resolving LLM-selected topics to real skills."""
+
+    def test_exact(self, compiled):
+        """Test that an exact path resolves to itself."""
+        skill = compiled.snap("Systems", "Caching", "Eviction")
+
+        assert skill.path == ("Systems", "Caching", "Eviction")
+
+    def test_near_miss_names(self, compiled):
+        """Test that case, punctuation and spacing differences still match."""
+        skill = compiled.snap("machine learning", "evaluation", "cross validation")
+
+        assert skill.path == ("Machine Learning", "Evaluation", "Cross-Validation")
+
+    def test_prefers_named_subdomain(self, compiled):
+        """Test that a skill name shared by subdomains resolves by subdomain."""
+        assert compiled.snap("Wrong", "serving", "metrics").domain == "Systems"
+        assert compiled.snap("", "", "Metrics").domain == "Machine Learning"
+
+    def test_falls_back_to_subdomain_then_domain(self, compiled):
+        """Test that an unknown skill resolves within its subdomain or domain."""
+        assert compiled.snap("Systems", "Caching", "Sharding").name == "Eviction"
+        assert compiled.snap("Systems", "Storage", "Sharding").name == "Metrics"
+
+    def test_no_match(self, compiled):
+        """Test that an unrelated topic does not resolve."""
+        assert compiled.snap("Biology", "Genetics", "Sequencing") is None
+
+    def test_normalize_name(self):
+        """Test folding of names for matching."""
+        assert normalize_name("  Cross-Validation ") == "cross validation"
+
+
+class TestTaxonomyManagerIndex:
+    """Test the manager's use of the compiled index."""
+
+    def test_rebuilt_after_change(self, taxonomy):
+        """Test that mutations are visible to indexed lookups."""
+        manager = TaxonomyManager()
+        manager.taxonomy = taxonomy
+
+        assert manager.list_subdomains("Systems") == ["Serving", "Caching"]
+
+        manager.add_subdomain("Systems", {"name": "Storage", "core_skills": []})
+        manager.remove_domain("Machine Learning")
+
+        assert manager.list_subdomains("Systems") == ["Serving", "Caching", "Storage"]
+        assert manager.get_skill("Machine Learning", "Evaluation", "Metrics") is None
+        assert manager.snap_topic("", "", "metrics").domain == "Systems"
+        with pytest.raises(ValueError):
+            manager.list_subdomains("Machine Learning")
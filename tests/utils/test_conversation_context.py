@@ -0,0 +1,105 @@
+"""Tests for the rolling conversation summary."""
+
+from src.llm_interviewer.utils.conversation_context import (
+    fold_turns,
+    render_context,
+    summarize,
+)
+from src.llm_interviewer.utils.tokens import estimate_tokens
+
+
+def _record(i, topic="Domain - Subdomain - Skill", score=0.5, response=None):
+    return {
+        "topic": topic,
+        "question": f"Question {i}?",
+        "response": response or f"Answer {i}.",
+        "quality_score": score,
+        "areas_of_strength": [f"strength {i}"],
+        "areas_for_improvement": [f"gap {i}"],
+    }
+
+
+class TestSummarize:
+    """Test folding answers into the summary."""
+
+    def test_aggregates_per_topic(self):
+        """Test that answers on a topic share one entry with their mean score."""
+        records = [_record(i, score=score) for i, score in enumerate([0.2, 0.4, 0.9])]
+
+        summary = fold_turns({}, records)
+
+        entry = summary["topics"]["Domain - Subdomain - Skill"]
+        assert summary["turns"] == 3
+        assert entry["answered"] == 3
+        assert entry["score_total"] == 1.5
+        assert entry["strengths"] == ["strength 0", "strength 1", "strength 2"]
+
+    def test_keeps_latest_points(self):
+        """Test that only the most recent strengths and gaps are kept."""
+        summary = fold_turns({}, [_record(i) for i in range(6)])
+
+        assert summary["topics"]["Domain - Subdomain - Skill"]["gaps"] == [
+            "gap 3",
+            "gap 4",
+            "gap 5",
+        ]
+
+    def test_leaves_recent_turns_out(self):
+        """Test that the summary stops short of the verbatim window."""
+        performance = [_record(i) for i in range(5)]
+
+        summary = summarize({}, performance, recent_turns=2)
+
+        assert summary["turns"] == 3
+
+    def test_is_incremental(self):
+        """Test that folding turn by turn matches folding all at once."""
+        performance = [_record(i, topic=f"Topic {i % 3}") for i in range(10)]
+
+        summary = {}
+        for end in range(1, len(performance) + 1):
+            summary = summarize(summary, performance[:end], recent_turns=3)
+
+        assert summary == summarize({}, performance, recent_turns=3)
+
+    def test_does_not_modify_summary(self):
+        """Test that folding returns a new summary."""
+        summary = fold_turns({}, [_record(0)])
+
+        fold_turns(summary, [_record(1)])
+
+        assert summary["turns"] == 1
+
+
+class TestRenderContext:
+    """Test the conversation context shown in prompts."""
+
+    def test_summary_and_recent_turns(self):
+        """Test that older answers are summarized and recent ones quoted."""
+        performance = [_record(i, topic=f"Topic {i}") for i in range(4)]
+        summary = summarize({}, performance, recent_turns=2)
+
+        text = render_context(summary, performance[-2:], token_budget=500)
+
+        assert "Summary of 2 earlier answers:" in text
+        assert "- Topic 0: 1 answered, mean score 0.50" in text
+        assert "Interviewer: Question 3?\nCandidate: Answer 3." in text
+        assert "Question 1?" not in text
+        assert text.index("Question 2?") < text.index("Question 3?")
+
+    def test_stays_within_budget(self):
+        """Test that prompt context stays bounded however long the interview."""
+        performance = [
+            _record(i, topic=f"Topic {i}", response="word " * 500) for i in range(200)
+        ]
+        summary = summarize({}, performance, recent_turns=3)
+
+        text = render_context(summary, performance[-3:], token_budget=300)
+
+        assert estimate_tokens(text) <= 300
+        assert "Candidate: word" in text
+        assert "earlier topics omitted" in text
+
+    def test_empty(self):
+        """Test the context before any answer."""
+        assert render_context({}, [], token_budget=100) == "No answers yet."
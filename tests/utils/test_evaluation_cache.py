@@ -0,0 +1,199 @@
+"""Tests for the semantic evaluation cache."""
+
+import asyncio
+
+import pytest
+
+from src.llm_interviewer.models.pydantic_models import ResponseEvaluation
+from src.llm_interviewer.utils.evaluation_cache import (
+    EvaluationCache,
+    minhash_signature,
+)
+
+TOPIC = "Machine Learning - Deep Learning - Transformers"
+QUESTION = "How does self-attention work in a transformer?"
+ANSWER = (
+    "Each token builds a query, a key and a value. Attention weights come from "
+    "the softmax of the scaled dot products of queries and keys, and the output "
+    "is the weighted sum of the values."
+)
+
+
+def _evaluation(score: float = 0.8, knows: bool = True) -> ResponseEvaluation:
+    return ResponseEvaluation(
+        quality_score=score,
+        demonstrates_knowledge=knows,
+        areas_of_strength=[],
+        areas_for_improvement=[],
+        should_continue_topic=not knows,
+        reasoning="",
+    )
+
+
+class Evaluator:
+    """Count calls and return a fixed evaluation"""
+
+    def __init__(self, evaluation: ResponseEvaluation):
+        self.evaluation = evaluation
+        self.calls = 0
+
+    def __call__(self) -> ResponseEvaluation:
+        self.calls += 1
+        return self.evaluation
+
+
+@pytest.fixture
+def cache():
+    return EvaluationCache(threshold=0.8, audit_rate=0.0)
+
+
+class TestMinhashSignature:
+    """Test the similarity signature."""
+
+    def test_ignores_case_and_punctuation(self):
+        """Test that formatting differences give the same signature."""
+        assert (
+            minhash_signature(ANSWER) == minhash_signature(ANSWER.upper() + "!")
+        ).all()
+
+    def test_different_texts_differ(self):
+        """Test that unrelated answers have a low estimated similarity."""
+        other = minhash_signature("I have never used transformers, sorry.")
+
+        assert (minhash_signature(ANSWER) == other).mean() < 0.2
+
+
+class TestEvaluationCache:
+    """Test reuse, eviction and the report."""
+
+    def test_reuses_near_identical_answer(self, cache):
+        """Test that a lightly edited answer reuses the stored evaluation."""
+        cache.evaluate(TOPIC, QUESTION, ANSWER, Evaluator(_evaluation()))
+        evaluator = Evaluator(_evaluation(0.1))
+
+        edited = ANSWER.replace("Each token", "Every token")
+        result = cache.evaluate(TOPIC, QUESTION, edited, evaluator)
+
+        assert evaluator.calls == 0
+        assert result.quality_score == 0.8
+
+    def test_different_answer_misses(self, cache):
+        """Test that a dissimilar answer is evaluated fresh and stored."""
+        cache.evaluate(TOPIC, QUESTION, ANSWER, Evaluator(_evaluation()))
+        evaluator = Evaluator(_evaluation(0.1, knows=False))
+
+        result = cache.evaluate(TOPIC, QUESTION, "No idea.", evaluator)
+
+        assert evaluator.calls == 1
+        assert result.quality_score == 0.1
+        assert cache.report()["entries"] == 2
+
+    def test_keyed_by_question(self, cache):
+        """Test that the same answer to another question misses."""
+        cache.evaluate(TOPIC, QUESTION, ANSWER, Evaluator(_evaluation()))
+
+        assert cache.lookup(TOPIC, "What is a key?", ANSWER) is None
+        assert cache.lookup("Other topic", QUESTION, ANSWER) is None
+
+    def test_threshold(self):
+        """Test that a threshold of 1 only reuses identical answers."""
+        cache = EvaluationCache(threshold=1.0, audit_rate=0.0)
+        cache.add(TOPIC, QUESTION, ANSWER, _evaluation())
+
+        assert cache.lookup(TOPIC, QUESTION, ANSWER) is not None
+        assert cache.lookup(TOPIC, QUESTION, ANSWER + " Also masks.") is None
+
+    def test_evicts_least_recently_used_question(self):
+        """Test that the index stays within max_entries."""
+        cache = EvaluationCache(max_entries=2, audit_rate=0.0)
+        cache.add(TOPIC, "first?", ANSWER, _evaluation())
+        cache.add(TOPIC, "second?", ANSWER, _evaluation())
+        cache.lookup(TOPIC, "first?", ANSWER)
+        cache.add(TOPIC, "third?", ANSWER, _evaluation())
+
+        assert cache.lookup(TOPIC, "second?", ANSWER) is None
+        assert cache.lookup(TOPIC, "first?", ANSWER) is not None
+        assert cache.report()["entries"] == 2
+
+    def test_evicts_oldest_responses_first(self):
+        """Test that eviction drops single responses, not whole questions."""
+        cache = EvaluationCache(max_entries=3, audit_rate=0.0)
+        cache.add(TOPIC, "first?", ANSWER, _evaluation(0.1))
+        cache.add(TOPIC, "first?", "A different answer entirely.", _evaluation(0.2))
+        cache.add(TOPIC, "second?", ANSWER, _evaluation(0.3))
+        cache.add(TOPIC, "second?", "Yet another answer here.", _evaluation(0.4))
+
+        assert cache.lookup(TOPIC, "first?", ANSWER) is None
+        assert cache.lookup(TOPIC, "first?", "A different answer entirely.") == (
+            _evaluation(0.2)
+        )
+        assert cache.report()["entries"] == 3
+
+    def test_eviction_keeps_added_response(self):
+        """Test that a full cache of one question keeps its newest response."""
+        cache = EvaluationCache(max_entries=2, audit_rate=0.0)
+        answers = [f"Answer number {word} about attention." for word in "abc"]
+        for score, answer in zip([0.1, 0.2, 0.3], answers):
+            cache.add(TOPIC, QUESTION, answer, _evaluation(score))
+
+        assert cache.lookup(TOPIC, QUESTION, answers[0]) is None
+        assert cache.lookup(TOPIC, QUESTION, answers[2]) == _evaluation(0.3)
+        assert cache.report()["entries"] == 2
+
+    def test_bucket_grows_by_doubling(self):
+        """Test that responses are stored in preallocated rows that double."""
+        cache = EvaluationCache(threshold=1.0, audit_rate=0.0)
+        answers = [f"{ANSWER} Example {i} of many." for i in range(100)]
+        for i, answer in enumerate(answers):
+            cache.add(TOPIC, QUESTION, answer, _evaluation(i / 100))
+
+        bucket = next(iter(cache._buckets.values()))
+        assert len(bucket.signatures) == 128
+        assert all(
+            cache.lookup(TOPIC, QUESTION, answer) == _evaluation(i / 100)
+            for i, answer in enumerate(answers)
+        )
+
+    def test_audit_reports_drift(self):
+        """Test that audited hits are evaluated fresh and their drift reported."""
+        cache = EvaluationCache(threshold=0.8, audit_rate=1.0)
+        cache.evaluate(TOPIC, QUESTION, ANSWER, Evaluator(_evaluation(0.8)))
+        evaluator = Evaluator(_evaluation(0.5))
+
+        result = cache.evaluate(TOPIC, QUESTION, ANSWER, evaluator)
+
+        report = cache.report()
+        assert evaluator.calls == 1
+        assert result.quality_score == 0.5
+        assert report["hits"] == report["misses"] == 1
+        assert report["hit_rate"] == 0.5
+        assert report["audits"] == 1
+        assert report["mean_score_drift"] == pytest.approx(0.3)
+        assert report["decision_agreement"] == 1.0
+
+    def test_drift_totals_over_audits(self):
+        """Test that drift is summarized from running totals across audits."""
+        cache = EvaluationCache(threshold=0.8, audit_rate=1.0)
+        cache.evaluate(TOPIC, QUESTION, ANSWER, Evaluator(_evaluation(0.8)))
+
+        cache.evaluate(TOPIC, QUESTION, ANSWER, Evaluator(_evaluation(0.5)))
+        cache.evaluate(TOPIC, QUESTION, ANSWER, Evaluator(_evaluation(0.7)))
+
+        report = cache.report()
+        assert report["audits"] == 2
+        assert report["mean_score_drift"] == pytest.approx(0.2)
+        assert report["max_score_drift"] == pytest.approx(0.3)
+
+    def test_async(self, cache):
+        """Test that the async path reuses evaluations too."""
+
+        async def evaluate():
+            return _evaluation()
+
+        async def run():
+            await cache.aevaluate(TOPIC, QUESTION, ANSWER, evaluate)
+            return await cache.aevaluate(TOPIC, QUESTION, ANSWER, evaluate)
+
+        asyncio.run(run())
+
+        assert cache.report()["hits"] == 1
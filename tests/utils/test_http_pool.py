@@ -0,0 +1,126 @@
+"""Tests for the shared LLM HTTP connection pools."""
+
+import asyncio
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from src.llm_interviewer.utils.http_pool import HttpPool, http_pool_gauges
+from src.llm_interviewer.utils.metrics import MetricsRegistry
+
+
+class KeepAliveHandler(BaseHTTPRequestHandler):
+    """Answer HEAD requests over HTTP/1.1, keeping the connection open"""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_HEAD(self):
+        # Slow enough that concurrent warm-up requests each need a connection
+        time.sleep(0.05)
+        self.send_response(200)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def base_url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), KeepAliveHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+
+
+class TestHttpPool:
+    """Test connection reuse, warm-up and stats."""
+
+    def test_warm_up_leaves_idle_connections(self, base_url):
+        """Test that warm-up opens connections that stay in the pool."""
+        pool = HttpPool("local", base_url, max_connections=4)
+
+        opened = pool.warm_up(3)
+
+        assert opened == 3
+        assert pool.stats()["sync"]["idle_connections"] == 3
+        pool.close()
+
+    def test_reuses_connections(self, base_url):
+        """Test that sequential requests share one keep-alive connection."""
+        pool = HttpPool("local", base_url)
+
+        for _ in range(5):
+            pool.client.head(base_url)
+
+        stats = pool.stats()["sync"]
+        assert stats["idle_connections"] + stats["active_connections"] == 1
+        pool.close()
+
+    def test_async_client_across_event_loops(self, base_url):
+        """Test that the async client works from one event loop after another."""
+        pool = HttpPool("local", base_url)
+
+        async def head():
+            response = await pool.async_client.head(base_url)
+            return response.status_code
+
+        assert asyncio.run(head()) == 200
+        assert asyncio.run(head()) == 200
+
+    def test_async_warm_up(self, base_url):
+        """Test that warm-up given a loop opens async connections in that loop."""
+        pool = HttpPool("local", base_url, max_connections=4)
+
+        async def warm_up():
+            loop = asyncio.get_running_loop()
+            opened = await asyncio.to_thread(pool.warm_up, 2, loop)
+            return opened, pool.stats()
+
+        opened, stats = asyncio.run(warm_up())
+
+        assert opened == 4
+        assert stats["sync"]["idle_connections"] == 2
+        assert stats["async"]["idle_connections"] == 2
+        assert pool.stats()["async"]["idle_connections"] == 0
+        pool.close()
+
+    def test_limits(self):
+        """Test that the configured limits are applied and reported."""
+        pool = HttpPool("local", max_connections=7, max_keepalive_connections=3)
+
+        stats = pool.stats()
+
+        assert stats["max_connections"] == 7
+        assert stats["max_keepalive_connections"] == 3
+        assert stats["async"]["idle_connections"] == 0
+
+    def test_warm_up_failure(self):
+        """Test that an unreachable provider opens no connections."""
+        pool = HttpPool("local", "http://127.0.0.1:9", timeout=1.0)
+
+        assert pool.warm_up(2) == 0
+
+
+class TestHttpPoolGauges:
+    """Test pool utilization metrics."""
+
+    def test_rendered_with_metrics(self, monkeypatch):
+        """Test that pool gauges are read when the metrics are rendered."""
+        monkeypatch.setattr(
+            "src.llm_interviewer.utils.http_pool._pools",
+            {"openai": HttpPool("openai", max_connections=5)},
+        )
+        registry = MetricsRegistry()
+        registry.add_collector(http_pool_gauges)
+
+        text = registry.render()
+
+        assert "# TYPE interview_http_pool_connections gauge" in text
+        assert 'interview_http_pool_max_connections{provider="openai"} 5' in text
+        assert (
+            'interview_http_pool_connections{client="sync",provider="openai",'
+            'state="idle"} 0' in text
+        )
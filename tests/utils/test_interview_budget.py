@@ -0,0 +1,146 @@
+"""Tests for per-interview budgets and model tiers."""
+
+import time
+
+import pytest
+from langchain_core.caches import InMemoryCache
+from langgraph.graph import END, START, StateGraph
+
+from src.llm_interviewer.utils.interview_budget import InterviewBudget, UsageRecorder
+from src.llm_interviewer.utils.metrics import MetricsCallbackHandler, MetricsRegistry
+from tests.helpers import ProviderChatModel, State
+
+
+def _recorded(model_name="gpt-4o", calls=1, model=None):
+    recorder = UsageRecorder(model_name)
+    model = model or ProviderChatModel()
+    for _ in range(calls):
+        model.invoke("Ask a question", recorder.config())
+    return recorder
+
+
+@pytest.fixture
+def budget():
+    return InterviewBudget(
+        "gpt-4o",
+        max_tokens=10_000,
+        max_cost=1.0,
+        model_tiers={"gpt-4o-mini": 0.5, "gpt-4.1-nano": 0.2},
+    )
+
+
+class TestUsageRecorder:
+    """Test recording the LLM calls of a node."""
+
+    def test_records_tokens(self):
+        """Test that provider-reported tokens and calls are collected."""
+        recorder = _recorded(calls=2)
+
+        assert recorder.calls == 2
+        assert recorder.prompt_tokens == 2000
+        assert recorder.completion_tokens == 200
+        assert recorder.seconds > 0
+
+    def test_cache_hits_are_free(self):
+        """Test that calls served from the LLM cache cost no tokens."""
+        recorder = _recorded(calls=2, model=ProviderChatModel(cache=InMemoryCache()))
+
+        assert recorder.calls == 2
+        assert recorder.prompt_tokens == 1000
+
+    def test_keeps_graph_callbacks(self):
+        """Test that recording inside a node does not hide calls from metrics."""
+        registry = MetricsRegistry()
+        recorder = UsageRecorder("gpt-4o")
+
+        def ask(state: State):
+            reply = ProviderChatModel().invoke("Ask", recorder.config())
+            return {"messages": [reply.content]}
+
+        graph = StateGraph(State)
+        graph.add_node("ask", ask)
+        graph.add_edge(START, "ask")
+        graph.add_edge("ask", END)
+        graph.compile().invoke(
+            {"messages": []}, {"callbacks": [MetricsCallbackHandler(registry)]}
+        )
+
+        assert recorder.calls == 1
+        assert 'interview_llm_calls_total{node="ask"} 1' in registry.render()
+
+
+class TestInterviewBudget:
+    """Test charging usage and stepping down model tiers."""
+
+    def test_charge_prices_tokens(self, budget):
+        """Test that usage adds up tokens and cost at the model's prices."""
+        usage = budget.charge(budget.start(), _recorded(calls=2))
+        usage = budget.charge(usage, _recorded("gpt-4o-mini"))
+
+        assert usage["llm_calls"] == 3
+        assert usage["prompt_tokens"] == 3000
+        assert usage["cost"] == pytest.approx(
+            (2000 * 2.5 + 200 * 10.0 + 1000 * 0.15 + 100 * 0.6) / 1e6
+        )
+        assert usage["calls_by_model"] == {"gpt-4o": 2, "gpt-4o-mini": 1}
+
+    def test_tiers_step_down(self, budget):
+        """Test that cheaper models take over as the tightest budget runs low."""
+        usage = budget.start()
+        models = []
+        for _ in range(9):
+            models.append(budget.model_for(usage))
+            usage = budget.charge(usage, _recorded())
+
+        assert models[:4] == ["gpt-4o"] * 4
+        assert models[5:7] == ["gpt-4o-mini"] * 2
+        assert models[8] == "gpt-4.1-nano"
+        assert budget.remaining_share(usage) == pytest.approx(0.01)
+
+    def test_can_afford_question(self, budget):
+        """Test that a question is refused when the average would overspend."""
+        usage = budget.start()
+        for _ in range(7):
+            usage = budget.charge(usage, _recorded())
+
+        assert budget.can_afford_question(usage, questions_asked=4)
+        assert not budget.can_afford_question(usage, questions_asked=3)
+
+    def test_wall_time(self):
+        """Test that the time cap counts from the interview's start."""
+        budget = InterviewBudget("gpt-4o", max_seconds=60)
+        usage = {**budget.start(), "started_at": time.time() - 45}
+
+        assert budget.remaining_share(usage) == pytest.approx(0.25, abs=0.01)
+        assert budget.summary(usage)["remaining"]["seconds"] == pytest.approx(15, abs=1)
+
+    def test_cost_cap_needs_prices(self):
+        """Test that a cost cap with an unpriced model is rejected up front."""
+        with pytest.raises(ValueError, match="local-model"):
+            InterviewBudget("gpt-4o", max_cost=1.0, model_tiers={"local-model": 0.5})
+
+        budget = InterviewBudget(
+            "local-model", max_cost=1.0, prices={"local-model": (1.0, 2.0)}
+        )
+        assert budget.charge({}, _recorded("local-model"))["cost"] > 0
+
+    def test_unpriced_model_without_cost_cap(self, caplog):
+        """Test that an unpriced model is charged nothing and logged once."""
+        budget = InterviewBudget("local-model", max_tokens=10_000)
+
+        usage = budget.charge({}, _recorded("local-model"))
+        usage = budget.charge(usage, _recorded("local-model"))
+
+        assert usage["cost"] == 0.0
+        assert usage["prompt_tokens"] == 2000
+        assert caplog.text.count("No price for local-model") == 1
+
+    def test_no_caps(self):
+        """Test that an unlimited budget never downgrades or stops."""
+        budget = InterviewBudget("gpt-4o", model_tiers={"gpt-4o-mini": 0.5})
+        usage = budget.charge({}, _recorded(calls=3))
+
+        assert budget.remaining_share(usage) == 1.0
+        assert budget.model_for(usage) == "gpt-4o"
+        assert budget.can_afford_question(usage, questions_asked=1)
+        assert budget.summary(usage)["remaining"] == {}
@@ -0,0 +1,164 @@
+"""Tests for the persistent LLM response cache."""
+
+import pytest
+from langchain_core.caches import InMemoryCache
+from langchain_core.messages import AIMessage
+from langchain_core.outputs import ChatGeneration
+
+from src.llm_interviewer.utils import llm_cache
+from src.llm_interviewer.utils.llm_cache import SqliteLLMCache, create_llm_cache
+
+LLM_STRING = "model=gpt-4o temperature=0.05"
+
+
+def _generations(text: str = "What is attention?"):
+    return [ChatGeneration(message=AIMessage(content=text))]
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return str(tmp_path / "llm_cache.sqlite")
+
+
+@pytest.fixture
+def cache(db_path):
+    cache = SqliteLLMCache(db_path)
+    yield cache
+    cache.close()
+
+
+class TestSqliteLLMCache:
+    """Test lookups, eviction and counters."""
+
+    def test_round_trip(self, cache):
+        """Test that a stored response is returned for the same prompt."""
+        cache.update("prompt", LLM_STRING, _generations())
+
+        assert cache.lookup("prompt", LLM_STRING) == _generations()
+
+    def test_key_includes_model_parameters(self, cache):
+        """Test that other model parameters miss."""
+        cache.update("prompt", LLM_STRING, _generations())
+
+        assert cache.lookup("prompt", "model=gpt-4o temperature=0.9") is None
+
+    def test_prompt_whitespace_is_normalized(self, cache):
+        """Test that prompts differing only in whitespace share an entry."""
+        cache.update("Select  the\n    next topic", LLM_STRING, _generations())
+
+        assert cache.lookup("Select the next topic", LLM_STRING) is not None
+
+    def test_shared_between_instances(self, cache, db_path):
+        """Test that another connection to the same file sees the entries."""
+        cache.update("prompt", LLM_STRING, _generations())
+        other = SqliteLLMCache(db_path)
+
+        assert other.lookup("prompt", LLM_STRING) == _generations()
+        other.close()
+
+    def test_expired_entries_miss(self, db_path, monkeypatch):
+        """Test that entries older than the TTL are not returned."""
+        cache = SqliteLLMCache(db_path, ttl_seconds=60)
+        monkeypatch.setattr(llm_cache.time, "time", lambda: 1000.0)
+        cache.update("prompt", LLM_STRING, _generations())
+
+        monkeypatch.setattr(llm_cache.time, "time", lambda: 1061.0)
+
+        assert cache.lookup("prompt", LLM_STRING) is None
+        assert cache.stats()["expired"] == 1
+        assert cache.stats()["entries"] == 0
+        cache.close()
+
+    def test_evicts_least_recently_used(self, db_path, monkeypatch):
+        """Test that going over max_bytes evicts the least recently used entry."""
+        size = len(llm_cache.dumps(_generations("a")).encode("utf-8"))
+        cache = SqliteLLMCache(db_path, max_bytes=2 * size)
+        clock = iter(range(1000, 2000))
+        monkeypatch.setattr(llm_cache.time, "time", lambda: float(next(clock)))
+
+        cache.update("first", LLM_STRING, _generations("a"))
+        cache.update("second", LLM_STRING, _generations("b"))
+        cache.lookup("first", LLM_STRING)
+        cache.update("third", LLM_STRING, _generations("c"))
+
+        assert cache.lookup("second", LLM_STRING) is None
+        assert cache.lookup("first", LLM_STRING) is not None
+        assert cache.stats()["evictions"] == 1
+        assert cache.stats()["size_bytes"] <= 2 * size
+        cache.close()
+
+    def test_hits_do_not_write(self, cache):
+        """Test that hit access times are only written with the next update."""
+        cache.update("prompt", LLM_STRING, _generations())
+        key = llm_cache.cache_key("prompt", LLM_STRING)
+        query = "SELECT accessed_at FROM llm_cache WHERE key = ?"
+        (stored,) = cache.conn.execute(query, (key,)).fetchone()
+
+        cache.lookup("prompt", LLM_STRING)
+        assert cache.conn.execute(query, (key,)).fetchone() == (stored,)
+
+        cache.update("other", LLM_STRING, _generations())
+        assert cache.conn.execute(query, (key,)).fetchone()[0] > stored
+
+    def test_expiry_sweeps_on_interval(self, db_path, monkeypatch):
+        """Test that expired entries are swept by writes at most once per interval."""
+        cache = SqliteLLMCache(db_path, ttl_seconds=60, expiry_interval=30)
+        now = [1000.0]
+        monkeypatch.setattr(llm_cache.time, "time", lambda: now[0])
+        cache.update("first", LLM_STRING, _generations())
+        now[0] = 1020.0
+        cache.update("second", LLM_STRING, _generations())
+
+        now[0] = 1065.0
+        cache.update("third", LLM_STRING, _generations())
+        assert cache.stats()["expired"] == 1
+
+        # The second entry has expired too, but the next sweep is not due yet
+        now[0] = 1085.0
+        cache.update("fourth", LLM_STRING, _generations())
+        assert cache.stats()["expired"] == 1
+        assert cache.stats()["entries"] == 3
+        assert cache.lookup("second", LLM_STRING) is None
+        cache.close()
+
+    def test_stats(self, cache):
+        """Test hit, miss and byte counters."""
+        cache.update("prompt", LLM_STRING, _generations())
+        cache.lookup("prompt", LLM_STRING)
+        cache.lookup("other", LLM_STRING)
+
+        stats = cache.stats()
+
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["hit_rate"] == 0.5
+        assert stats["entries"] == 1
+        assert stats["bytes_read"] == stats["bytes_written"] == stats["size_bytes"]
+
+    def test_clear(self, cache):
+        """Test that clearing removes every entry and resets the size."""
+        cache.update("prompt", LLM_STRING, _generations())
+
+        cache.clear()
+
+        assert cache.lookup("prompt", LLM_STRING) is None
+        assert cache.stats()["size_bytes"] == 0
+
+
+class TestCreateLLMCache:
+    """Test backend selection."""
+
+    def test_backends(self, db_path):
+        """Test that each configured backend builds the matching cache."""
+        assert isinstance(
+            create_llm_cache("memory", db_path, 1024, None), InMemoryCache
+        )
+        cache = create_llm_cache("sqlite", db_path, 1024, 60)
+        assert isinstance(cache, SqliteLLMCache)
+        assert cache.max_bytes == 1024 and cache.ttl_seconds == 60
+        cache.close()
+
+    def test_unknown_backend(self, db_path):
+        """Test that an unknown backend is rejected."""
+        with pytest.raises(ValueError):
+            create_llm_cache("redis", db_path, 1024, None)
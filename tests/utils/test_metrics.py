@@ -0,0 +1,138 @@
+"""Tests for the built-in metrics registry and callback instrumentation."""
+
+import urllib.request
+
+import pytest
+from langchain_core.caches import InMemoryCache
+from langgraph.graph import END, START, StateGraph
+
+from src.llm_interviewer.utils.metrics import (
+    MetricsCallbackHandler,
+    MetricsRegistry,
+    serve_metrics,
+)
+from tests.helpers import ProviderChatModel, State
+
+
+def _graph(model):
+    def ask(state: State):
+        return {"messages": [model.invoke("Ask a question").content]}
+
+    def record(state: State):
+        return {"messages": ["recorded"]}
+
+    graph = StateGraph(State)
+    graph.add_node("ask", ask)
+    graph.add_node("record", record)
+    graph.add_edge(START, "ask")
+    graph.add_edge("ask", "record")
+    graph.add_edge("record", END)
+    return graph.compile()
+
+
+@pytest.fixture
+def registry():
+    return MetricsRegistry(buckets=(0.1, 1.0))
+
+
+def _value(text: str, series: str) -> float:
+    for line in text.splitlines():
+        if line.startswith(series + " "):
+            return float(line.split()[-1])
+    raise AssertionError(f"{series} not in metrics")
+
+
+class TestMetricsRegistry:
+    """Test aggregation and the Prometheus text format."""
+
+    def test_counter(self, registry):
+        """Test that counters add up per label set."""
+        registry.inc("interview_llm_calls_total", node="ask")
+        registry.inc("interview_llm_calls_total", 2, node="ask")
+        registry.inc("interview_llm_calls_total", node="record")
+
+        text = registry.render()
+
+        assert "# TYPE interview_llm_calls_total counter" in text
+        assert _value(text, 'interview_llm_calls_total{node="ask"}') == 3
+        assert _value(text, 'interview_llm_calls_total{node="record"}') == 1
+
+    def test_histogram_buckets_are_cumulative(self, registry):
+        """Test bucket, sum and count lines of a histogram."""
+        for value in (0.05, 0.1, 0.5, 3.0):
+            registry.observe("interview_node_duration_seconds", value, node="ask")
+
+        text = registry.render()
+
+        series = "interview_node_duration_seconds"
+        assert _value(text, f'{series}_bucket{{node="ask",le="0.1"}}') == 2
+        assert _value(text, f'{series}_bucket{{node="ask",le="1"}}') == 3
+        assert _value(text, f'{series}_bucket{{node="ask",le="+Inf"}}') == 4
+        assert _value(text, f'{series}_sum{{node="ask"}}') == pytest.approx(3.65)
+        assert _value(text, f'{series}_count{{node="ask"}}') == 4
+
+    def test_escapes_labels(self, registry):
+        """Test that quotes in label values are escaped."""
+        registry.inc("interview_llm_calls_total", node='say "hi"')
+
+        assert 'node="say \\"hi\\""' in registry.render()
+
+    def test_write(self, registry, tmp_path):
+        """Test that the metrics file holds the rendered text."""
+        registry.inc("interview_llm_calls_total", node="ask")
+        path = tmp_path / "metrics" / "interview.prom"
+
+        registry.write(str(path))
+
+        assert path.read_text() == registry.render()
+
+    def test_serve(self, registry):
+        """Test that /metrics serves the rendered text."""
+        registry.inc("interview_llm_calls_total", node="ask")
+        server = serve_metrics(registry, 0, host="127.0.0.1")
+        port = server.server_address[1]
+
+        with urllib.request.urlopen(f"http://127.0.0.1:{port}/metrics") as response:
+            assert response.read().decode() == registry.render()
+        server.shutdown()
+
+
+class TestMetricsCallbackHandler:
+    """Test metrics recorded from graph runs."""
+
+    def test_nodes_and_llm_calls(self, registry):
+        """Test per-node timings and the tokens of LLM calls made by a node."""
+        handler = MetricsCallbackHandler(registry)
+
+        _graph(ProviderChatModel()).invoke({"messages": []}, {"callbacks": [handler]})
+
+        text = registry.render()
+        assert _value(text, "interview_turn_duration_seconds_count") == 1
+        assert _value(text, 'interview_node_duration_seconds_count{node="ask"}') == 1
+        assert _value(text, 'interview_node_duration_seconds_count{node="record"}') == 1
+        assert _value(text, 'interview_llm_calls_total{node="ask"}') == 1
+        assert _value(text, 'interview_llm_prompt_tokens_total{node="ask"}') == 1000
+        assert _value(text, 'interview_llm_completion_tokens_total{node="ask"}') == 100
+        assert "interview_llm_cache_hits_total" not in text
+
+    def test_cache_hits(self, registry):
+        """Test that calls served from the LLM cache count as hits, not tokens."""
+        handler = MetricsCallbackHandler(registry)
+        graph = _graph(ProviderChatModel(cache=InMemoryCache()))
+
+        for _ in range(2):
+            graph.invoke({"messages": []}, {"callbacks": [handler]})
+
+        text = registry.render()
+        assert _value(text, 'interview_llm_calls_total{node="ask"}') == 2
+        assert _value(text, 'interview_llm_cache_hits_total{node="ask"}') == 1
+        assert _value(text, 'interview_llm_prompt_tokens_total{node="ask"}') == 1000
+
+    def test_writes_file_after_each_run(self, registry, tmp_path):
+        """Test that the metrics file is rewritten when a graph run ends."""
+        path = tmp_path / "interview.prom"
+        handler = MetricsCallbackHandler(registry, str(path))
+
+        _graph(ProviderChatModel()).invoke({"messages": []}, {"callbacks": [handler]})
+
+        assert "interview_turn_duration_seconds_count 1" in path.read_text()
@@ -0,0 +1,121 @@
+"""Tests for the pre-generated question bank."""
+
+import pytest
+
+from src.llm_interviewer.models.pydantic_models import Question, QuestionPool
+from src.llm_interviewer.utils.question_bank import (
+    DIFFICULTIES,
+    QuestionBank,
+    build_question_bank,
+    iter_slots,
+    target_difficulty,
+)
+
+TOPIC = ("Test Domain", "Test Subdomain", "Test Skill")
+
+
+class PoolGenerator:
+    """Number generated questions and record the prompts"""
+
+    def __init__(self):
+        self.prompts = []
+
+    def __call__(self, prompts):
+        pools = []
+        for messages in prompts:
+            self.prompts.append(messages)
+            pools.append(
+                QuestionPool(
+                    questions=[
+                        Question(
+                            question=f"Q{len(self.prompts)}.{i}",
+                            topic_focus="focus",
+                            difficulty_level="ignored",
+                        )
+                        for i in range(5)
+                    ]
+                )
+            )
+        return pools
+
+
+@pytest.fixture
+def bank_path(tmp_path):
+    return str(tmp_path / "question_bank.sqlite")
+
+
+class TestBuildQuestionBank:
+    """Test offline generation."""
+
+    def test_fills_every_slot(self, sample_taxonomy, bank_path):
+        """Test that every knowledge area and difficulty gets per_slot questions."""
+        written = build_question_bank(
+            sample_taxonomy, bank_path, PoolGenerator(), per_slot=2, batch_size=4
+        )
+
+        slots = list(iter_slots(sample_taxonomy))
+        assert len(slots) == 2 * len(DIFFICULTIES)
+        assert written == 2 * len(slots)
+        assert QuestionBank(bank_path).stats()["questions"] == written
+
+    def test_resumes(self, sample_taxonomy, bank_path):
+        """Test that a rebuild only generates for slots still missing questions."""
+        build_question_bank(sample_taxonomy, bank_path, PoolGenerator(), per_slot=2)
+        generator = PoolGenerator()
+
+        written = build_question_bank(sample_taxonomy, bank_path, generator, per_slot=3)
+
+        assert len(generator.prompts) == len(list(iter_slots(sample_taxonomy)))
+        assert written == len(generator.prompts)
+
+
+class TestQuestionBank:
+    """Test serving."""
+
+    @pytest.fixture
+    def bank(self, sample_taxonomy, bank_path):
+        build_question_bank(sample_taxonomy, bank_path, PoolGenerator(), per_slot=1)
+        return QuestionBank(bank_path)
+
+    def test_prefers_difficulty(self, bank):
+        """Test that a question of the requested difficulty is served."""
+        question = bank.take(TOPIC, set(), "Advanced")
+
+        assert question.difficulty_level == "Advanced"
+
+    def test_skips_asked_questions(self, bank):
+        """Test that questions already asked are not served again."""
+        asked = set()
+        for _ in range(2 * len(DIFFICULTIES)):
+            asked.add(bank.take(TOPIC, asked, "Beginner").question)
+
+        assert bank.take(TOPIC, asked, "Beginner") is None
+        assert bank.stats()["exhausted"] == 1
+
+    def test_unknown_topic(self, bank):
+        """Test that a topic outside the bank is left to live generation."""
+        assert bank.take(("Other", "Other", "Other"), set(), "Beginner") is None
+
+    def test_missing_file(self, bank_path):
+        """Test that a missing bank serves nothing."""
+        bank = QuestionBank(bank_path)
+
+        assert bank.take(TOPIC, set(), "Beginner") is None
+        assert bank.stats()["questions"] == 0
+
+
+class TestTargetDifficulty:
+    """Test difficulty selection."""
+
+    @pytest.mark.parametrize(
+        "scores, expected",
+        [
+            ([], "Intermediate"),
+            ([0.9, 0.8], "Advanced"),
+            ([0.2, 0.3], "Beginner"),
+            ([0.5], "Intermediate"),
+        ],
+    )
+    def test_follows_scores(self, scores, expected):
+        """Test that the difficulty follows the candidate's mean score."""
+        assert target_difficulty(scores) == expected
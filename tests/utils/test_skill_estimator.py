@@ -0,0 +1,103 @@
+"""Tests for the per-skill ability estimates."""
+
+import json
+
+import pytest
+
+from src.llm_interviewer.utils.skill_estimator import (
+    confidence,
+    difficulty_value,
+    overall_estimate,
+    target_difficulty_for,
+    update_skill_estimate,
+)
+
+NOISE = 0.2
+
+
+def _estimate(*scores, difficulty=0.0):
+    estimate = {}
+    for score in scores:
+        estimate = update_skill_estimate(estimate, score, difficulty, NOISE)
+    return estimate
+
+
+class TestSkillEstimate:
+    """Test updating a skill's ability estimate."""
+
+    def test_strong_answers_raise_ability(self):
+        """Test that good scores move the estimate above the pass line."""
+        estimate = _estimate(0.9, 0.85)
+
+        assert estimate["ability"] > 0.5
+        assert estimate["pass_probability"] > 0.9
+        assert confidence(estimate) == estimate["pass_probability"]
+
+    def test_weak_answers_lower_ability(self):
+        """Test that poor scores give a confident fail."""
+        estimate = _estimate(0.2, 0.3)
+
+        assert estimate["ability"] < -0.5
+        assert confidence(estimate) == 1 - estimate["pass_probability"]
+        assert confidence(estimate) > 0.9
+
+    def test_uncertainty_shrinks_with_answers(self):
+        """Test that each consistent answer narrows the estimate."""
+        one, two, three = _estimate(0.8), _estimate(0.8, 0.8), _estimate(0.8, 0.8, 0.8)
+
+        assert one["sd"] > two["sd"] > three["sd"]
+
+    def test_difficulty_matters(self):
+        """Test that a good answer to a hard question says more than to an easy one."""
+        easy = _estimate(0.8, difficulty=difficulty_value("Beginner"))
+        hard = _estimate(0.8, difficulty=difficulty_value("Advanced"))
+
+        assert hard["ability"] > easy["ability"]
+
+    def test_does_not_mutate_and_serializes(self):
+        """Test that updates return new estimates that fit in JSON state."""
+        first = _estimate(0.7)
+        second = update_skill_estimate(first, 0.6, 0.0, NOISE)
+
+        assert len(first["responses"]) == 1
+        assert len(second["responses"]) == 2
+        assert json.loads(json.dumps(second)) == second
+
+
+class TestOverallEstimate:
+    """Test combining skills into one estimate."""
+
+    def test_spread_evidence_is_more_confident(self):
+        """Test that answers across skills say more than as many on one skill."""
+        one_skill = overall_estimate([_estimate(0.85, 0.85)], NOISE)
+        two_skills = overall_estimate([_estimate(0.85), _estimate(0.85)], NOISE)
+
+        assert two_skills["pass_probability"] > one_skill["pass_probability"]
+
+    def test_mixed_skills_are_uncertain(self):
+        """Test that a strong and a weak skill leave the verdict open."""
+        estimate = overall_estimate([_estimate(0.9, 0.9), _estimate(0.2, 0.2)], NOISE)
+
+        assert confidence(estimate) < 0.9
+
+    def test_no_answers_is_the_prior(self):
+        """Test that no evidence gives an even verdict."""
+        assert overall_estimate([], NOISE)["pass_probability"] == pytest.approx(
+            0.5, abs=0.01
+        )
+
+
+class TestDifficulty:
+    """Test mapping between difficulty levels and abilities."""
+
+    def test_levels(self):
+        """Test that levels are ordered and unknown levels are Intermediate."""
+        assert difficulty_value("beginner") < difficulty_value("Intermediate")
+        assert difficulty_value("Advanced") > difficulty_value("Intermediate")
+        assert difficulty_value("Expert") == difficulty_value("Intermediate")
+
+    def test_target_follows_ability(self):
+        """Test that the next question is aimed at the estimated ability."""
+        assert target_difficulty_for({}) == "Intermediate"
+        assert target_difficulty_for(_estimate(0.95, 0.95)) == "Advanced"
+        assert target_difficulty_for(_estimate(0.05, 0.05)) == "Beginner"
@@ -0,0 +1,36 @@
+"""Tests for the shared SQLite connection helpers."""
+
+import sqlite3
+import threading
+
+import pytest
+
+from src.llm_interviewer.utils import sqlite
+from src.llm_interviewer.utils.sqlite import Transaction, connect
+
+SCHEMA = "CREATE TABLE IF NOT EXISTS items (value TEXT);"
+
+
+class TestTransaction:
+    """Test the locked write transaction."""
+
+    def test_busy_database_releases_lock(self, tmp_path, monkeypatch):
+        """Test that a write that times out on a busy file does not block later ones."""
+        monkeypatch.setattr(sqlite, "BUSY_TIMEOUT_MS", 10)
+        path = str(tmp_path / "busy.sqlite")
+        conn = connect(path, SCHEMA)
+        lock = threading.Lock()
+        other = sqlite3.connect(path, isolation_level=None)
+        other.execute("BEGIN IMMEDIATE")
+
+        with pytest.raises(sqlite3.OperationalError):
+            with Transaction(conn, lock):
+                pass
+
+        assert not lock.locked()
+        other.execute("COMMIT")
+        with Transaction(conn, lock) as cur:
+            cur.execute("INSERT INTO items VALUES ('written')")
+        assert conn.execute("SELECT value FROM items").fetchall() == [("written",)]
+        other.close()
+        conn.close()
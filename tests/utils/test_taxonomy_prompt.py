@@ -0,0 +1,198 @@
+"""Tests for compact taxonomy prompt rendering."""
+
+import copy
+import json
+
+import pytest
+
+from src.llm_interviewer.utils import taxonomy_prompt
+from src.llm_interviewer.utils.taxonomy_prompt import (
+    clear_taxonomy_prompt_cache,
+    render_taxonomy_for_prompt,
+    taxonomy_version,
+)
+from src.llm_interviewer.utils.tokens import estimate_tokens
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """Start every test with empty render caches."""
+    clear_taxonomy_prompt_cache()
+    yield
+    clear_taxonomy_prompt_cache()
+
+
+@pytest.fixture
+def two_domain_taxonomy(sample_taxonomy):
+    """Taxonomy with two domains, one of them holding two skills."""
+    taxonomy = copy.deepcopy(sample_taxonomy)
+    taxonomy["domains"][0]["subdomains"][0]["core_skills"].append(
+        {
+            "name": "Other Skill",
+            "knowledge_areas": ["Area 3"],
+            "practical_applications": [],
+        }
+    )
+    taxonomy["domains"].append(
+        {
+            "name": "Second Domain",
+            "subdomains": [
+                {
+                    "name": "Second Subdomain",
+                    "core_skills": [{"name": "Second Skill"}],
+                }
+            ],
+        }
+    )
+    return taxonomy
+
+
+class TestTaxonomyVersion:
+    """Test taxonomy content hashing."""
+
+    def test_version_is_stable_and_key_order_independent(self, sample_taxonomy):
+        """Test the version only depends on content."""
+        reordered = {"domains": [dict(reversed(sample_taxonomy["domains"][0].items()))]}
+
+        assert taxonomy_version(sample_taxonomy) == taxonomy_version(reordered)
+
+    def test_version_changes_with_content(self, sample_taxonomy):
+        """Test that editing the taxonomy changes its version."""
+        changed = copy.deepcopy(sample_taxonomy)
+        changed["domains"][0]["name"] = "Renamed"
+
+        assert taxonomy_version(sample_taxonomy) != taxonomy_version(changed)
+
+
+class TestRenderTaxonomyForPrompt:
+    """Test the compact taxonomy renderer."""
+
+    def test_renders_all_levels(self, sample_taxonomy):
+        """Test that domains, subdomains, skills and details are rendered."""
+        rendered = render_taxonomy_for_prompt(sample_taxonomy)
+
+        assert "[Test Domain]" in rendered
+        assert " Test Subdomain" in rendered
+        assert "  - Test Skill: Area 1, Area 2; apps: App 1, App 2" in rendered
+
+    def test_smaller_than_indented_json(self, two_domain_taxonomy):
+        """Test that the compact format is smaller than indented JSON."""
+        rendered = render_taxonomy_for_prompt(two_domain_taxonomy)
+
+        assert len(rendered) < len(json.dumps(two_domain_taxonomy, indent=2))
+
+    def test_prunes_covered_skills_and_empty_branches(self, two_domain_taxonomy):
+        """Test that covered skills and exhausted branches are left out."""
+        covered = [
+            {
+                "domain": "Second Domain",
+                "subdomain": "Second Subdomain",
+                "skill": "Second Skill",
+            },
+            {
+                "domain": "Test Domain",
+                "subdomain": "Test Subdomain",
+                "skill": "Test Skill",
+            },
+        ]
+
+        rendered = render_taxonomy_for_prompt(two_domain_taxonomy, covered)
+
+        assert "Second Domain" not in rendered
+        assert "Test Skill" not in rendered
+        assert "Other Skill" in rendered
+
+    def test_fully_covered_taxonomy_renders_everything(self, sample_taxonomy):
+        """Test that an exhausted taxonomy falls back to the full rendering."""
+        covered = [
+            {
+                "domain": "Test Domain",
+                "subdomain": "Test Subdomain",
+                "skill": "Test Skill",
+            }
+        ]
+
+        rendered = render_taxonomy_for_prompt(sample_taxonomy, covered)
+
+        assert "Test Skill" in rendered
+
+    def test_token_budget_drops_details_first(self, sample_taxonomy):
+        """Test that details are dropped when over budget."""
+        full = render_taxonomy_for_prompt(sample_taxonomy)
+        budget = estimate_tokens(full) - 1
+
+        rendered = render_taxonomy_for_prompt(sample_taxonomy, token_budget=budget)
+
+        assert "  - Test Skill" in rendered
+        assert "Area 1" not in rendered
+
+    def test_token_budget_trims_skills_across_domains(self):
+        """Test that large taxonomies are trimmed to the budget evenly."""
+        taxonomy = {
+            "domains": [
+                {
+                    "name": f"Domain {d}",
+                    "subdomains": [
+                        {
+                            "name": f"Subdomain {d}",
+                            "core_skills": [
+                                {"name": f"Skill {d}-{s}"} for s in range(50)
+                            ],
+                        }
+                    ],
+                }
+                for d in range(3)
+            ]
+        }
+
+        rendered = render_taxonomy_for_prompt(taxonomy, token_budget=100)
+
+        assert estimate_tokens(rendered) <= 100
+        assert all(f"[Domain {d}]" in rendered for d in range(3))
+        assert "more skills omitted" in rendered
+
+    @pytest.mark.parametrize("budget", [200, 1500, 4000])
+    def test_trimmed_rendering_fits_budget(self, budget):
+        """Test that prefixes, newlines and the omitted line stay in the budget."""
+        taxonomy = {
+            "domains": [
+                {
+                    "name": f"Software Engineering Domain {d}",
+                    "subdomains": [
+                        {
+                            "name": f"Distributed Systems Subdomain {d}.{u}",
+                            "core_skills": [
+                                {
+                                    "name": f"Skill {d}.{u}.{s}",
+                                    "knowledge_areas": ["Consistency", "Latency"],
+                                }
+                                for s in range(40)
+                            ],
+                        }
+                        for u in range(8)
+                    ],
+                }
+                for d in range(6)
+            ]
+        }
+
+        rendered = render_taxonomy_for_prompt(taxonomy, token_budget=budget)
+
+        assert estimate_tokens(rendered) <= budget
+        assert "more skills omitted" in rendered
+
+    def test_rendering_is_cached_per_version(self, sample_taxonomy, monkeypatch):
+        """Test that repeat renders do not recompile the taxonomy."""
+        calls = []
+        original = taxonomy_prompt._compile
+        monkeypatch.setattr(
+            taxonomy_prompt,
+            "_compile",
+            lambda taxonomy: calls.append(1) or original(taxonomy),
+        )
+
+        first = render_taxonomy_for_prompt(sample_taxonomy)
+        second = render_taxonomy_for_prompt(copy.deepcopy(sample_taxonomy))
+
+        assert first == second
+        assert len(calls) == 1
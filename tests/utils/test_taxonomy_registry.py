@@ -0,0 +1,305 @@
+"""Tests for the process-wide taxonomy registry."""
+
+import copy
+import json
+
+import pytest
+
+from src.llm_interviewer.utils.taxonomy_prompt import (
+    _compact_cache,
+    render_taxonomy_for_prompt,
+    taxonomy_version,
+)
+from src.llm_interviewer.utils.taxonomy_registry import (
+    DEFAULT_TAXONOMY_ID,
+    TaxonomyRegistry,
+    migrate_taxonomy_reference,
+    resolve_taxonomy,
+    taxonomy_registry,
+)
+
+
+@pytest.fixture
+def edited_taxonomy(sample_taxonomy):
+    """Sample taxonomy with a renamed domain."""
+    taxonomy = copy.deepcopy(sample_taxonomy)
+    taxonomy["domains"][0]["name"] = "Edited Domain"
+    return taxonomy
+
+
+@pytest.fixture
+def registry():
+    """Process registry with its entries restored after the test."""
+    saved = (dict(taxonomy_registry._taxonomies), dict(taxonomy_registry._latest))
+    yield taxonomy_registry
+    taxonomy_registry.clear()
+    taxonomy_registry._taxonomies.update(saved[0])
+    taxonomy_registry._latest.update(saved[1])
+
+
+class TestTaxonomyRegistry:
+    """Test registering and looking up taxonomies."""
+
+    def test_register_returns_content_version(self, sample_taxonomy):
+        """Test that the version is the taxonomy content hash."""
+        registry = TaxonomyRegistry()
+
+        version = registry.register(sample_taxonomy, "llm")
+
+        assert version == taxonomy_version(sample_taxonomy)
+        assert registry.get("llm") is sample_taxonomy
+        assert registry.get("llm", version) is sample_taxonomy
+
+    def test_old_versions_stay_resolvable(self, sample_taxonomy, edited_taxonomy):
+        """Test that registering a new version keeps the previous one."""
+        registry = TaxonomyRegistry()
+        old = registry.register(sample_taxonomy, "llm")
+        new = registry.register(edited_taxonomy, "llm")
+
+        assert registry.latest_version("llm") == new
+        assert registry.get("llm", old) is sample_taxonomy
+
+    def test_non_latest_registration(self, sample_taxonomy, edited_taxonomy):
+        """Test that latest=False does not replace the current version."""
+        registry = TaxonomyRegistry()
+        current = registry.register(sample_taxonomy, "llm")
+        registry.register(edited_taxonomy, "llm", latest=False)
+
+        assert registry.latest_version("llm") == current
+
+    def test_non_latest_registration_on_empty_id(self, sample_taxonomy):
+        """Test that latest=False does not make the first version the latest."""
+        registry = TaxonomyRegistry()
+        version = registry.register(sample_taxonomy, "llm", latest=False)
+
+        assert not registry.has_latest("llm")
+        assert registry.get("llm", version) is sample_taxonomy
+
+    def test_unknown_taxonomy(self):
+        """Test that unknown IDs and versions raise KeyError."""
+        registry = TaxonomyRegistry()
+
+        with pytest.raises(KeyError):
+            registry.get("missing")
+
+
+@pytest.fixture
+def role_dir(tmp_path, sample_taxonomy):
+    """Directory of role taxonomies of about the same size."""
+    for role in ["backend", "frontend", "data"]:
+        taxonomy = copy.deepcopy(sample_taxonomy)
+        taxonomy["domains"][0]["name"] = f"{role} domain"
+        (tmp_path / f"{role}.json").write_text(json.dumps(taxonomy))
+    return tmp_path
+
+
+class TestLazyLoading:
+    """Test loading role taxonomies on first use and evicting unused ones."""
+
+    def test_loads_on_first_use(self, role_dir):
+        """Test that a role's taxonomy is loaded once, then served from memory."""
+        registry = TaxonomyRegistry()
+        registry.add_source_dir(role_dir)
+
+        assert registry.stats()["entries"] == 0
+        assert registry.get("backend")["domains"][0]["name"] == "backend domain"
+        registry.get("backend")
+
+        stats = registry.stats()
+        assert stats["loads"] == 1
+        assert stats["hits"] == 1
+        assert stats["entries"] == 1
+        assert stats["bytes"] > 0
+
+    def test_unknown_role(self, role_dir):
+        """Test that IDs without a file, or naming other paths, are not loaded."""
+        registry = TaxonomyRegistry()
+        registry.add_source_dir(role_dir / "roles")
+
+        with pytest.raises(KeyError):
+            registry.latest_version("missing")
+        with pytest.raises(KeyError):
+            registry.latest_version("../backend")
+
+    def test_evicts_least_recently_used(self, role_dir):
+        """Test that the cap evicts the least recently used role first."""
+        registry = TaxonomyRegistry()
+        registry.add_source_dir(role_dir)
+        registry.get("backend")
+        registry.max_bytes = registry.stats()["bytes"] * 2.5
+
+        registry.get("frontend")
+        registry.get("backend")
+        registry.get("data")
+
+        assert registry.has("backend", registry.latest_version("backend"))
+        assert not registry.has("frontend", registry.latest_version("frontend"))
+        assert registry.stats()["evictions"] == 1
+
+    def test_evicted_role_is_reloaded(self, role_dir):
+        """Test that an evicted version is loaded again, with its caches dropped."""
+        registry = TaxonomyRegistry(max_bytes=1)
+        registry.add_source_dir(role_dir)
+        version = registry.latest_version("backend")
+        render_taxonomy_for_prompt(registry.get("backend"), version=version)
+        registry.compiled("backend")
+
+        registry.get("frontend")
+
+        assert not registry.has("backend", version)
+        assert version not in _compact_cache
+        assert registry.get("backend", version)["domains"][0]["name"] == (
+            "backend domain"
+        )
+        assert registry.stats()["loads"] == 3
+
+    def test_pinned_versions_are_kept(self, role_dir, sample_taxonomy):
+        """Test that only the version the source can reload is ever evicted."""
+        registry = TaxonomyRegistry(max_bytes=1)
+        registry.add_source_dir(role_dir)
+        source_version = registry.latest_version("backend")
+        # Previous version, e.g. migrated from an older interview's inline copy
+        pinned = registry.register(sample_taxonomy, "backend", latest=False)
+
+        registry.get("frontend")
+        registry.get("data")
+
+        assert registry.has("backend", pinned)
+        assert not registry.has("backend", source_version)
+        assert registry.get("backend", pinned) is sample_taxonomy
+        assert registry.latest_version("backend") == source_version
+
+    def test_reload_keeps_promoted_version(self, role_dir, edited_taxonomy):
+        """Test that reloading an evicted source version leaves the latest alone."""
+        registry = TaxonomyRegistry(max_bytes=1)
+        registry.add_source_dir(role_dir)
+        source_version = registry.latest_version("backend")
+        promoted = registry.register(edited_taxonomy, "backend", latest=False)
+        registry.promote("backend", promoted)
+        registry.get("frontend")
+
+        assert registry.get("backend", source_version)["domains"][0]["name"] == (
+            "backend domain"
+        )
+        assert registry.latest_version("backend") == promoted
+
+    def test_unsourced_taxonomies_are_kept(self, role_dir, sample_taxonomy):
+        """Test that a taxonomy that cannot be reloaded is never evicted."""
+        registry = TaxonomyRegistry(max_bytes=1)
+        registry.add_source_dir(role_dir)
+        version = registry.register(sample_taxonomy, "inline")
+
+        registry.get("backend")
+        registry.get("frontend")
+
+        assert registry.has("inline", version)
+
+
+class TestVersionStore:
+    """Test keeping registered versions across restarts."""
+
+    def test_pinned_version_survives_restart(self, role_dir, tmp_path, edited_taxonomy):
+        """Test that a version the source no longer has resolves after a restart."""
+        store = tmp_path / "versions"
+        registry = TaxonomyRegistry()
+        registry.add_source_dir(role_dir)
+        registry.add_version_store(store)
+        pinned = registry.latest_version("backend")
+
+        (role_dir / "backend.json").write_text(json.dumps(edited_taxonomy))
+        restarted = TaxonomyRegistry()
+        restarted.add_source_dir(role_dir)
+        restarted.add_version_store(store)
+
+        assert restarted.latest_version("backend") == taxonomy_version(edited_taxonomy)
+        assert restarted.get("backend", pinned)["domains"][0]["name"] == (
+            "backend domain"
+        )
+        assert len(restarted.compiled("backend", pinned)) == 1
+
+    def test_stored_versions_are_evicted(self, role_dir, tmp_path, sample_taxonomy):
+        """Test that a stored version no interview used recently leaves memory."""
+        registry = TaxonomyRegistry(max_bytes=1)
+        registry.add_source_dir(role_dir)
+        registry.add_version_store(tmp_path / "versions")
+        pinned = registry.register(sample_taxonomy, "backend", latest=False)
+
+        registry.get("frontend")
+        registry.get("data")
+
+        assert not registry.has("backend", pinned)
+        assert registry.get("backend", pinned) == sample_taxonomy
+        assert registry.stats()["evictions"] >= 2
+
+    def test_corrupt_stored_version_raises(self, tmp_path, sample_taxonomy):
+        """Test that a stored file not matching its version is not used."""
+        registry = TaxonomyRegistry()
+        registry.add_version_store(tmp_path)
+        version = registry.register(sample_taxonomy, "llm")
+        (tmp_path / "llm" / f"{version}.json").write_text('{"domains": []}')
+
+        restarted = TaxonomyRegistry()
+        restarted.add_version_store(tmp_path)
+
+        with pytest.raises(KeyError):
+            restarted.get("llm", version)
+
+
+class TestResolveTaxonomy:
+    """Test resolving the taxonomy of an interview state."""
+
+    def test_resolves_reference(self, registry, sample_taxonomy):
+        """Test that states carrying an ID and version resolve from the registry."""
+        version = registry.register(sample_taxonomy, "llm")
+
+        taxonomy, resolved = resolve_taxonomy(
+            {"taxonomy_id": "llm", "taxonomy_version": version}
+        )
+
+        assert taxonomy is sample_taxonomy
+        assert resolved == version
+
+    def test_unknown_version_raises(self, registry, sample_taxonomy):
+        """Test that a pinned version that is gone is not swapped for the latest."""
+        registry.register(sample_taxonomy, "llm")
+
+        with pytest.raises(KeyError):
+            resolve_taxonomy({"taxonomy_id": "llm", "taxonomy_version": "0" * 16})
+
+    def test_legacy_state_uses_inline_copy(self, sample_taxonomy):
+        """Test that states without a reference use their inline taxonomy."""
+        taxonomy, version = resolve_taxonomy({"taxonomy": sample_taxonomy})
+
+        assert taxonomy is sample_taxonomy
+        assert version is None
+
+
+class TestMigrateTaxonomyReference:
+    """Test moving legacy states to registry references."""
+
+    def test_migrates_inline_taxonomy(self, registry, sample_taxonomy):
+        """Test that the inline copy is registered and cleared."""
+        update = migrate_taxonomy_reference({"taxonomy": sample_taxonomy})
+
+        assert update == {
+            "taxonomy_id": DEFAULT_TAXONOMY_ID,
+            "taxonomy_version": taxonomy_version(sample_taxonomy),
+            "taxonomy": {},
+        }
+        assert resolve_taxonomy(update)[0] == sample_taxonomy
+
+    def test_migration_keeps_latest_version(
+        self, registry, sample_taxonomy, edited_taxonomy
+    ):
+        """Test that migrating an old state does not change new interviews."""
+        current = registry.register(sample_taxonomy)
+
+        migrate_taxonomy_reference({"taxonomy": edited_taxonomy})
+
+        assert registry.latest_version(DEFAULT_TAXONOMY_ID) == current
+
+    def test_referenced_state_is_unchanged(self):
+        """Test that states already holding a reference need no update."""
+        state = {"taxonomy_id": "llm", "taxonomy_version": "abc"}
+
+        assert migrate_taxonomy_reference(state) == {}
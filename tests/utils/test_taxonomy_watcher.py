@@ -0,0 +1,123 @@
+"""Tests for hot reloading of taxonomy files."""
+
+import copy
+import json
+import os
+
+import pytest
+
+from src.llm_interviewer.utils.taxonomy_registry import TaxonomyRegistry
+from src.llm_interviewer.utils.taxonomy_watcher import TaxonomyWatcher
+
+
+@pytest.fixture
+def taxonomy_file(tmp_path, sample_taxonomy):
+    path = tmp_path / "taxonomy.json"
+    path.write_text(json.dumps(sample_taxonomy))
+    return path
+
+
+@pytest.fixture
+def registry():
+    return TaxonomyRegistry()
+
+
+@pytest.fixture
+def watcher(registry, taxonomy_file):
+    watcher = TaxonomyWatcher(registry, interval=0.01)
+    watcher.watch(taxonomy_file, "roles")
+    watcher.poll()
+    return watcher
+
+
+def _edit(path, taxonomy, name):
+    taxonomy = copy.deepcopy(taxonomy)
+    taxonomy["domains"][0]["name"] = name
+    path.write_text(json.dumps(taxonomy))
+
+
+class TestTaxonomyWatcher:
+    """Test reloading changed taxonomies."""
+
+    def test_first_poll_loads(self, watcher, registry, sample_taxonomy):
+        """Test that a watched file is registered as the latest version."""
+        assert registry.get("roles") == sample_taxonomy
+        assert watcher.reloads == 1
+
+    def test_unchanged_file_is_not_reloaded(self, watcher, taxonomy_file):
+        """Test that a touched file with the same content is not reloaded."""
+        stat = taxonomy_file.stat()
+        os.utime(taxonomy_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        assert watcher.poll() == []
+        assert watcher.poll() == []
+        assert watcher.reloads == 1
+
+    def test_change_swaps_latest_and_pins_old(
+        self, watcher, registry, taxonomy_file, sample_taxonomy
+    ):
+        """Test that new interviews get the edit while started ones keep theirs."""
+        pinned = registry.latest_version("roles")
+        _edit(taxonomy_file, sample_taxonomy, "Edited Domain")
+
+        assert watcher.poll() == ["roles"]
+        assert registry.latest_version("roles") != pinned
+        assert registry.get("roles")["domains"][0]["name"] == "Edited Domain"
+        assert registry.get("roles", pinned) == sample_taxonomy
+
+    def test_reload_is_compiled_up_front(
+        self, watcher, registry, taxonomy_file, sample_taxonomy
+    ):
+        """Test that the new version is indexed before interviews use it."""
+        _edit(taxonomy_file, sample_taxonomy, "Edited Domain")
+        watcher.poll()
+
+        assert ("roles", registry.latest_version("roles")) in registry._compiled
+
+    def test_invalid_edit_keeps_current(
+        self, watcher, registry, taxonomy_file, sample_taxonomy
+    ):
+        """Test that a broken file leaves the current version serving."""
+        current = registry.latest_version("roles")
+        taxonomy_file.write_text("{not json")
+
+        assert watcher.poll() == []
+        assert watcher.errors == 1
+        assert registry.latest_version("roles") == current
+
+    def test_background_thread(self, watcher, registry, taxonomy_file, sample_taxonomy):
+        """Test that the watcher thread picks up a change."""
+        watcher.start()
+        try:
+            _edit(taxonomy_file, sample_taxonomy, "Edited Domain")
+            for _ in range(500):
+                if registry.get("roles")["domains"][0]["name"] == "Edited Domain":
+                    break
+                watcher._stop.wait(0.01)
+        finally:
+            watcher.stop()
+
+        assert registry.get("roles")["domains"][0]["name"] == "Edited Domain"
+        assert not watcher._thread.is_alive()
+
+    def test_old_versions_are_released(self, tmp_path, taxonomy_file, sample_taxonomy):
+        """Test that replaced versions leave memory but stay resolvable."""
+        registry = TaxonomyRegistry(max_bytes=1)
+        registry.add_version_store(tmp_path / "versions")
+        watcher = TaxonomyWatcher(registry)
+        watcher.watch(taxonomy_file, "roles")
+        watcher.poll()
+        pinned = [registry.latest_version("roles")]
+        for name in ["Edit 1", "Edit 2", "Edit 3"]:
+            _edit(taxonomy_file, sample_taxonomy, name)
+            watcher.poll()
+            pinned.append(registry.latest_version("roles"))
+
+        assert [registry.has("roles", version) for version in pinned] == [
+            False,
+            False,
+            False,
+            True,
+        ]
+        assert registry.get("roles", pinned[0]) == sample_taxonomy
+        assert registry.latest_version("roles") == pinned[-1]
@@ -0,0 +1,202 @@
+"""Tests for the local topic scheduler."""
+
+import pytest
+
+from src.llm_interviewer.utils.compiled_taxonomy import CompiledTaxonomy
+from src.llm_interviewer.utils.topic_scheduler import select_next_topic, topic_key
+
+
+@pytest.fixture
+def taxonomy():
+    """Taxonomy with two domains and three skills."""
+    return CompiledTaxonomy(
+        {
+            "domains": [
+                {
+                    "name": "A",
+                    "subdomains": [
+                        {
+                            "name": "A1",
+                            "core_skills": [{"name": "a-one"}, {"name": "a-two"}],
+                        }
+                    ],
+                },
+                {
+                    "name": "B",
+                    "subdomains": [{"name": "B1", "core_skills": [{"name": "b-one"}]}],
+                },
+            ]
+        }
+    )
+
+
+def _covered(domain, subdomain, skill):
+    return {"domain": domain, "subdomain": subdomain, "skill": skill}
+
+
+class TestSelectNextTopic:
+    """Test deterministic topic scheduling."""
+
+    def test_first_topic_is_first_skill(self, taxonomy):
+        """Test that ties go to the earliest skill in the taxonomy."""
+        selection = select_next_topic(taxonomy, [], [])
+
+        assert selection.selected_topic == "A"
+        assert selection.selected_subdomain == "A1"
+        assert selection.selected_skill == "a-one"
+
+    def test_keeps_current_topic(self, taxonomy):
+        """Test that an in-progress topic is continued."""
+        selection = select_next_topic(taxonomy, [], [], "B", "B1", "b-one")
+
+        assert selection.selected_skill == "b-one"
+        assert selection.reasoning == "Continuing the current topic"
+
+    def test_balances_across_domains(self, taxonomy):
+        """Test that an uncovered domain is preferred after covering another."""
+        selection = select_next_topic(taxonomy, [_covered("A", "A1", "a-one")], [])
+
+        assert selection.selected_topic == "B"
+        assert selection.selected_skill == "b-one"
+
+    def test_prefers_uncovered_skills(self, taxonomy):
+        """Test that uncovered skills beat covered ones."""
+        covered = [_covered("A", "A1", "a-one"), _covered("B", "B1", "b-one")]
+
+        selection = select_next_topic(taxonomy, covered, [])
+
+        assert selection.selected_skill == "a-two"
+
+    def test_borderline_scores_raise_priority(self, taxonomy):
+        """Test that a borderline skill is revisited before a clear one."""
+        covered = [
+            _covered("A", "A1", "a-one"),
+            _covered("A", "A1", "a-two"),
+            _covered("B", "B1", "b-one"),
+        ]
+        performance = [
+            {"topic": topic_key("A", "A1", "a-one"), "quality_score": 0.95},
+            {"topic": topic_key("A", "A1", "a-two"), "quality_score": 0.5},
+            {"topic": topic_key("B", "B1", "b-one"), "quality_score": 0.1},
+        ]
+
+        selection = select_next_topic(taxonomy, covered, performance)
+
+        assert selection.selected_skill == "a-two"
+
+    def test_empty_taxonomy_returns_none(self):
+        """Test that nothing can be scheduled from an empty taxonomy."""
+        assert select_next_topic(CompiledTaxonomy({"domains": []}), [], []) is None
+
+    def test_borderline_beats_uncovered_skill_of_busier_domain(self, taxonomy):
+        """Test that a borderline skill is revisited before a busier domain's gap."""
+        covered = [
+            _covered("A", "A1", "a-one"),
+            _covered("B", "B1", "b-one"),
+            _covered("B", "B1", "b-one"),
+            _covered("B", "B1", "b-one"),
+        ]
+        performance = [{"topic": topic_key("A", "A1", "a-one"), "quality_score": 0.5}]
+        taxonomy = CompiledTaxonomy(
+            {
+                "domains": [
+                    {
+                        "name": "A",
+                        "subdomains": [
+                            {"name": "A1", "core_skills": [{"name": "a-one"}]}
+                        ],
+                    },
+                    {
+                        "name": "B",
+                        "subdomains": [
+                            {
+                                "name": "B1",
+                                "core_skills": [{"name": "b-one"}, {"name": "b-two"}],
+                            }
+                        ],
+                    },
+                ]
+            }
+        )
+
+        selection = select_next_topic(taxonomy, covered, performance)
+
+        assert selection.selected_skill == "a-one"
+
+    def test_borderline_weight_is_configurable(self, taxonomy):
+        """Test that a higher borderline weight revisits before an uncovered skill."""
+        covered = [_covered("A", "A1", "a-one"), _covered("B", "B1", "b-one")]
+        performance = [{"topic": topic_key("A", "A1", "a-one"), "quality_score": 0.5}]
+
+        default = select_next_topic(taxonomy, covered, performance)
+        weighted = select_next_topic(
+            taxonomy, covered, performance, borderline_weight=0.8
+        )
+
+        assert default.selected_skill == "a-two"
+        assert weighted.selected_skill == "a-one"
+
+    def test_matches_full_scan_on_large_taxonomy(self):
+        """Test that scoring only seen and first unseen skills picks the best one."""
+        taxonomy = CompiledTaxonomy(
+            {
+                "domains": [
+                    {
+                        "name": f"D{d}",
+                        "subdomains": [
+                            {
+                                "name": f"S{d}.{s}",
+                                "core_skills": [
+                                    {"name": f"k{d}.{s}.{k}"} for k in range(5)
+                                ],
+                            }
+                            for s in range(4)
+                        ],
+                    }
+                    for d in range(6)
+                ]
+            }
+        )
+        skills = [skill.path for skill in taxonomy.iter_skills()]
+        covered, performance = [], []
+        for turn in range(30):
+            selection = select_next_topic(taxonomy, covered, performance)
+            path = (
+                selection.selected_topic,
+                selection.selected_subdomain,
+                selection.selected_skill,
+            )
+            assert path == _full_scan(skills, covered, performance)
+            covered.append(_covered(*path))
+            score = [0.5, 0.9, 0.2][turn % 3]
+            performance.append({"topic": topic_key(*path), "quality_score": score})
+
+
+def _full_scan(skills, covered, performance):
+    """Score every skill, as the scheduler did before using the compiled indices"""
+    from collections import Counter
+
+    from src.llm_interviewer.utils.topic_scheduler import (
+        RECENT_SCORES,
+        _borderline_score,
+    )
+
+    skill_coverage = Counter(
+        (topic["domain"], topic["subdomain"], topic["skill"]) for topic in covered
+    )
+    domain_coverage = Counter(topic["domain"] for topic in covered)
+    best = None
+    for path in skills:
+        scores = [
+            record["quality_score"]
+            for record in performance
+            if record["topic"] == topic_key(*path)
+        ]
+        score = (
+            1.0 / (1 + skill_coverage[path])
+            + 0.5 / (1 + domain_coverage[path[0]])
+            + 0.4 * _borderline_score(scores[-RECENT_SCORES:])
+        )
+        if best is None or score > best[0]:
+            best = (score, path)
+    return best[1]
@@ -0,0 +1,127 @@
+"""Tests for the SQLite checkpointer."""
+
+import asyncio
+import operator
+from typing import Annotated, List, TypedDict
+
+import pytest
+from langgraph.checkpoint.memory import MemorySaver
+from langgraph.graph import END, START, StateGraph
+
+from src.llm_interviewer.utils.metrics import MetricsRegistry
+from src.llm_interviewer.workflows.checkpointer import (
+    SqliteCheckpointSaver,
+    TimedCheckpointSaver,
+    create_checkpointer,
+)
+
+
+class CounterState(TypedDict):
+    steps: Annotated[List[str], operator.add]
+
+
+def _build_graph(checkpointer):
+    graph = StateGraph(CounterState)
+    graph.add_node("ask", lambda state: {"steps": ["ask"]})
+    graph.add_node("evaluate", lambda state: {"steps": ["evaluate"]})
+    graph.add_edge(START, "ask")
+    graph.add_edge("ask", "evaluate")
+    graph.add_edge("evaluate", END)
+    return graph.compile(checkpointer=checkpointer, interrupt_before=["evaluate"])
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return str(tmp_path / "checkpoints.sqlite")
+
+
+class TestSqliteCheckpointSaver:
+    """Test durable checkpoint storage."""
+
+    def test_uses_wal_mode(self, db_path):
+        """Test that the database is opened in WAL mode."""
+        saver = SqliteCheckpointSaver(db_path)
+
+        (mode,) = saver.conn.execute("PRAGMA journal_mode").fetchone()
+
+        assert mode == "wal"
+        saver.close()
+
+    def test_resume_after_restart(self, db_path):
+        """Test that an interrupted run resumes from a new saver on the same file."""
+        config = {"configurable": {"thread_id": "interview-1"}}
+        saver = SqliteCheckpointSaver(db_path)
+        _build_graph(saver).invoke({"steps": []}, config)
+        saver.close()
+
+        restarted = SqliteCheckpointSaver(db_path)
+        app = _build_graph(restarted)
+        assert app.get_state(config).next == ("evaluate",)
+
+        result = app.invoke(None, config)
+
+        assert result["steps"] == ["ask", "evaluate"]
+        restarted.close()
+
+    def test_threads_are_isolated(self, db_path):
+        """Test that lookups only return checkpoints of the requested thread."""
+        saver = SqliteCheckpointSaver(db_path)
+        app = _build_graph(saver)
+        app.invoke({"steps": []}, {"configurable": {"thread_id": "a"}})
+
+        assert saver.get_tuple({"configurable": {"thread_id": "b"}}) is None
+        assert len(list(saver.list({"configurable": {"thread_id": "a"}}))) > 0
+
+        saver.delete_thread("a")
+
+        assert saver.get_tuple({"configurable": {"thread_id": "a"}}) is None
+        saver.close()
+
+    def test_async_interface(self, db_path):
+        """Test that the graph runs under ainvoke with the async methods."""
+        saver = SqliteCheckpointSaver(db_path)
+        app = _build_graph(saver)
+        config = {"configurable": {"thread_id": "async"}}
+
+        async def run():
+            await app.ainvoke({"steps": []}, config)
+            return await app.ainvoke(None, config)
+
+        assert asyncio.run(run())["steps"] == ["ask", "evaluate"]
+        saver.close()
+
+
+class TestTimedCheckpointSaver:
+    """Test checkpointer timing."""
+
+    def test_times_operations(self):
+        """Test that the wrapped saver stores checkpoints and records timings."""
+        registry = MetricsRegistry()
+        saver = TimedCheckpointSaver(MemorySaver(), registry)
+        app = _build_graph(saver)
+        config = {"configurable": {"thread_id": "timed"}}
+
+        app.invoke({"steps": []}, config)
+        assert app.get_state(config).next == ("evaluate",)
+        assert asyncio.run(app.ainvoke(None, config))["steps"] == ["ask", "evaluate"]
+
+        text = registry.render()
+        for operation in ("get", "put", "put_writes"):
+            series = "interview_checkpoint_duration_seconds_count"
+            assert f'{series}{{operation="{operation}"}}' in text
+
+
+class TestCreateCheckpointer:
+    """Test backend selection."""
+
+    def test_backends(self, db_path):
+        """Test that each configured backend builds the matching saver."""
+        assert isinstance(create_checkpointer("memory", db_path), MemorySaver)
+        saver = create_checkpointer("sqlite", db_path)
+        assert isinstance(saver, SqliteCheckpointSaver)
+        saver.close()
+
+    def test_unknown_backend(self, db_path):
+        """Test that an unknown backend is rejected."""
+        with pytest.raises(ValueError):
+            create_checkpointer("redis", db_path)
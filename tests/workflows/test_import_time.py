@@ -0,0 +1,64 @@
+"""Tests for the cost of importing the interview workflow."""
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+# Seconds the package may add on top of importing its dependencies
+IMPORT_TIME_BUDGET = 0.25
+
+ROOT = Path(__file__).parent.parent.parent
+
+SCRIPT = """
+import json, sys, time
+
+start = time.perf_counter()
+import langchain_core.messages, langchain_core.runnables, langgraph.graph
+import pydantic_settings
+dependencies = time.perf_counter()
+import src.llm_interviewer.workflows.interview_workflow
+from src.llm_interviewer.config.taxonomy import get_default_taxonomy
+from src.llm_interviewer.workflows import nodes
+end = time.perf_counter()
+
+print(json.dumps({
+    "seconds": end - dependencies,
+    "modules": [m for m in ("langchain_openai", "langchain_anthropic")
+                if m in sys.modules],
+    "llms": len(nodes._llms),
+    "taxonomy_loads": get_default_taxonomy.cache_info().currsize,
+}))
+"""
+
+
+def _import_in_fresh_process():
+    env = {k: v for k, v in os.environ.items() if k != "OPENAI_API_KEY"}
+    result = subprocess.run(
+        [sys.executable, "-W", "ignore", "-c", SCRIPT],
+        cwd=ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+class TestImportTime:
+    """Test that importing the workflow defers clients and the taxonomy."""
+
+    def test_builds_nothing(self):
+        """Test that no chat client or taxonomy is loaded, nor an API key needed."""
+        result = _import_in_fresh_process()
+
+        assert result["modules"] == []
+        assert result["llms"] == 0
+        assert result["taxonomy_loads"] == 0
+
+    def test_within_budget(self):
+        """Test that the import stays within its budget, best of three runs."""
+        seconds = min(_import_in_fresh_process()["seconds"] for _ in range(3))
+
+        assert seconds < IMPORT_TIME_BUDGET
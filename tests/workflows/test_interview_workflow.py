@@ -0,0 +1,109 @@
+"""Tests for the interview workflow."""
+
+import copy
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.llm_interviewer.utils.taxonomy_registry import (
+    DEFAULT_TAXONOMY_ID,
+    migrate_taxonomy_reference,
+    resolve_taxonomy,
+    taxonomy_registry,
+)
+from src.llm_interviewer.workflows.interview_workflow import InterviewWorkflow
+
+
+@pytest.fixture
+def registry():
+    """Process registry with its entries restored after the test."""
+    saved = (dict(taxonomy_registry._taxonomies), dict(taxonomy_registry._latest))
+    sources = dict(taxonomy_registry._sources)
+    yield taxonomy_registry
+    taxonomy_registry._sources = sources
+    taxonomy_registry.clear()
+    taxonomy_registry._taxonomies.update(saved[0])
+    taxonomy_registry._latest.update(saved[1])
+
+
+class TestSharedWorkflow:
+    """Test the process-wide workflow."""
+
+    def test_returns_one_instance(self):
+        """Test that every caller, on any thread, gets the same compiled graph."""
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            workflows = list(pool.map(lambda _: InterviewWorkflow.shared(), range(8)))
+
+        assert all(workflow is workflows[0] for workflow in workflows)
+
+    def test_one_instance_per_graph_mode(self):
+        """Test that each graph mode has its own shared workflow."""
+        fused = InterviewWorkflow.shared("fused")
+
+        assert fused.graph_mode == "fused"
+        assert fused is InterviewWorkflow.shared("fused")
+        assert fused is not InterviewWorkflow.shared("standard")
+
+    def test_threads_are_isolated(self):
+        """Test that interviews in the shared checkpointer are kept apart."""
+        app = InterviewWorkflow.shared().app
+        config = {"configurable": {"thread_id": "shared-a"}}
+        app.update_state(config, {"current_skill": "Prompting"}, as_node="__start__")
+
+        other = app.get_state({"configurable": {"thread_id": "shared-b"}})
+
+        assert app.get_state(config).values["current_skill"] == "Prompting"
+        assert other.values == {}
+
+
+class TestTaxonomyReload:
+    """Test which taxonomy version interviews use across a reload."""
+
+    def test_new_interviews_use_reloaded_version(self, registry):
+        """Test that a reload changes new interviews but not started ones."""
+        workflow = InterviewWorkflow.shared()
+        started = workflow._initial_state()
+        edited = copy.deepcopy(workflow.get_taxonomy())
+        edited["domains"][0]["name"] = "Edited Domain"
+
+        registry.promote(DEFAULT_TAXONOMY_ID, registry.register(edited, latest=False))
+        new = workflow._initial_state()
+
+        assert resolve_taxonomy(new)[0] == edited
+        assert resolve_taxonomy(started)[0] != edited
+        assert workflow.get_taxonomy() == edited
+
+    def test_resumed_legacy_thread_keeps_bundled_latest(self, registry):
+        """Test that migrating a legacy thread first does not change new interviews."""
+        workflow = InterviewWorkflow.shared()
+        bundled = workflow._initial_state()["taxonomy_version"]
+        legacy = copy.deepcopy(workflow.get_taxonomy())
+        legacy["domains"][0]["name"] = "Legacy Domain"
+        registry.clear()
+
+        migrated = migrate_taxonomy_reference({"taxonomy": legacy})
+
+        assert workflow._initial_state()["taxonomy_version"] == bundled
+        assert resolve_taxonomy(migrated)[0] == legacy
+
+
+class TestRoleTaxonomies:
+    """Test interviews on per-role taxonomies."""
+
+    def test_starts_on_role_taxonomy(self, registry, tmp_path, sample_taxonomy):
+        """Test that a role's taxonomy is loaded and referenced by its interview."""
+        path = tmp_path / "backend.json"
+        path.write_text(json.dumps(sample_taxonomy))
+        registry.add_source("backend", path)
+        workflow = InterviewWorkflow.shared()
+
+        state = workflow._initial_state("backend")
+
+        assert state["taxonomy_id"] == "backend"
+        assert resolve_taxonomy(state) == (sample_taxonomy, state["taxonomy_version"])
+
+    def test_unknown_role(self):
+        """Test that a role without a taxonomy is rejected."""
+        with pytest.raises(KeyError):
+            InterviewWorkflow.shared()._initial_state("no-such-role")
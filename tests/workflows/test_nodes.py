@@ -0,0 +1,458 @@
+"""Tests for the LLM clients used by the interview nodes."""
+
+import asyncio
+import threading
+
+import pytest
+from langchain_core.messages import AIMessage
+from langchain_core.runnables import RunnableLambda
+
+from src.llm_interviewer.config.settings import settings
+from src.llm_interviewer.models.interview_state import apply_update
+from src.llm_interviewer.models.pydantic_models import (
+    Question,
+    ResponseEvaluation,
+    TopicSelection,
+)
+from src.llm_interviewer.utils.interview_budget import InterviewBudget
+from src.llm_interviewer.workflows import nodes
+from src.llm_interviewer.workflows.speculation import QuestionSpeculator
+from tests.helpers import ProviderChatModel
+
+
+@pytest.fixture
+def chat_model(monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    monkeypatch.setattr(settings, "model_provider", "openai")
+    monkeypatch.setattr(settings, "enable_llm_caching", False)
+    nodes.get_chat_model.cache_clear()
+    yield nodes.get_chat_model()
+    nodes.get_chat_model.cache_clear()
+
+
+class TestChatModel:
+    """Test the shared chat model."""
+
+    def test_uses_shared_pool(self, chat_model):
+        """Test that the model sends requests through the provider's pool."""
+        pool = nodes._http_pool()
+
+        assert chat_model.http_client is pool.client
+        assert chat_model.http_async_client is pool.async_client
+
+    def test_anthropic_uses_shared_pool(self, monkeypatch):
+        """Test that the Anthropic SDK clients are built on the provider's pool."""
+        pytest.importorskip("langchain_anthropic")
+        monkeypatch.setenv("ANTHROPIC_API_KEY", "test-key")
+        monkeypatch.setattr(settings, "model_provider", "anthropic")
+        monkeypatch.setattr(settings, "enable_llm_caching", False)
+        nodes.get_chat_model.cache_clear()
+        try:
+            chat_model = nodes.get_chat_model()
+        finally:
+            nodes.get_chat_model.cache_clear()
+        pool = nodes._http_pool()
+
+        assert chat_model._client._client is pool.client
+        assert chat_model._async_client._client is pool.async_client
+        assert chat_model._client.max_retries == settings.llm_max_retries
+        assert "http_pool" not in chat_model._get_llm_string()
+
+    def test_built_once(self, chat_model):
+        """Test that every task's LLM is configured on the same model."""
+        llm = nodes.create_llm_with_tracing("question_generation", ["test"], Question)
+
+        assert nodes.get_chat_model() is chat_model
+        assert llm.config["run_name"] == "question_generation"
+        assert llm.config["tags"] == ["test"]
+
+    def test_unknown_provider(self, monkeypatch):
+        """Test that an unsupported provider is rejected."""
+        monkeypatch.setattr(settings, "model_provider", "google")
+        nodes.get_chat_model.cache_clear()
+
+        with pytest.raises(ValueError):
+            nodes.get_chat_model()
+
+
+class TestSnapTopicSelection:
+    """Test that LLM-selected topics resolve to real skills."""
+
+    @pytest.fixture
+    def state(self):
+        taxonomy = {
+            "domains": [
+                {
+                    "name": "Systems",
+                    "subdomains": [
+                        {"name": "Caching", "core_skills": [{"name": "Eviction"}]}
+                    ],
+                }
+            ]
+        }
+        return {"taxonomy": taxonomy, "topics_covered": [], "overall_performance": []}
+
+    def _selection(self, domain, subdomain, skill):
+        return TopicSelection(
+            selected_topic=domain,
+            selected_subdomain=subdomain,
+            selected_skill=skill,
+            reasoning="Picked by the LLM",
+        )
+
+    def test_snaps_near_miss(self, state):
+        """Test that a near-miss name is replaced by the real one."""
+        selection = nodes._snap_topic_selection(
+            state, self._selection("systems", "caching", "eviction ")
+        )
+
+        assert selection.selected_topic == "Systems"
+        assert selection.selected_skill == "Eviction"
+        assert selection.reasoning == "Picked by the LLM"
+
+    def test_unknown_topic_uses_scheduler(self, state):
+        """Test that a made-up topic falls back to the local scheduler."""
+        selection = nodes._snap_topic_selection(
+            state, self._selection("Biology", "Genetics", "Sequencing")
+        )
+
+        assert selection.selected_skill == "Eviction"
+
+
+class TestFusedTurnPlan:
+    """Test that the fused mode follows the topic and prompt settings."""
+
+    @pytest.fixture
+    def state(self):
+        skills = [{"name": name} for name in ["Eviction", "Sharding", "Replication"]]
+        taxonomy = {
+            "domains": [
+                {
+                    "name": "Systems",
+                    "subdomains": [{"name": "Caching", "core_skills": skills}],
+                }
+            ]
+        }
+        return {
+            "taxonomy": taxonomy,
+            "messages": [AIMessage(content="What is LRU?")],
+            "current_domain": "Systems",
+            "current_subdomain": "Caching",
+            "current_skill": "Eviction",
+            "topics_covered": [],
+            "questions_asked_current_topic": 1,
+            "total_questions_asked": 1,
+            "topics_completed": 0,
+            "overall_performance": [],
+            "context_summary": {},
+        }
+
+    def _prompt(self, state):
+        messages = nodes._build_turn_plan_messages(state, "What is LRU?", "Recency")
+        return messages[-1].content
+
+    def _planned(self, state, skill):
+        selection = TopicSelection(
+            selected_topic="Systems",
+            selected_subdomain="Caching",
+            selected_skill=skill,
+            reasoning="Planned",
+        )
+        question = Question(
+            question=f"What is {skill}?", topic_focus=skill, difficulty_level="Beginner"
+        )
+        moved = apply_update(state, nodes.move_to_next_topic(state))
+        return {
+            **moved,
+            "planned_turn": {
+                "topic_selection": selection.model_dump(),
+                "question": question.model_dump(),
+            },
+        }
+
+    def test_local_mode_plans_the_scheduled_topic(self, state, monkeypatch):
+        """Test that the local scheduler's next topic replaces the taxonomy."""
+        monkeypatch.setattr(settings, "topic_selection_mode", "local")
+
+        prompt = self._prompt(state)
+
+        assert "skill Sharding" in prompt
+        assert "Skills Taxonomy" not in prompt
+
+    def test_local_mode_rejects_other_topics(self, state, monkeypatch):
+        """Test that a planned new topic is only asked if the scheduler agrees."""
+        monkeypatch.setattr(settings, "topic_selection_mode", "local")
+
+        _, asked_other = nodes._ask_planned_turn(self._planned(state, "Replication"))
+        _, asked_scheduled = nodes._ask_planned_turn(self._planned(state, "Sharding"))
+
+        assert not asked_other
+        assert asked_scheduled
+
+    def test_llm_mode_accepts_any_new_topic(self, state, monkeypatch):
+        """Test that without the scheduler the plan may pick any other topic."""
+        monkeypatch.setattr(settings, "topic_selection_mode", "llm")
+
+        _, asked = nodes._ask_planned_turn(self._planned(state, "Replication"))
+
+        assert asked
+        assert "Skills Taxonomy" in self._prompt(state)
+
+    def test_unoptimized_prompt_uses_json(self, state, monkeypatch):
+        """Test that disabling prompt optimization sends the taxonomy as JSON."""
+        monkeypatch.setattr(settings, "topic_selection_mode", "llm")
+        monkeypatch.setattr(settings, "enable_prompt_optimization", False)
+
+        assert '"name": "Sharding"' in self._prompt(state)
+
+
+class TestAdaptiveNextStep:
+    """Test ending topics and interviews on confident ability estimates."""
+
+    @pytest.fixture(autouse=True)
+    def adaptive(self, monkeypatch):
+        monkeypatch.setattr(settings, "next_step_mode", "adaptive")
+        monkeypatch.setattr(settings, "max_topics", 5)
+        monkeypatch.setattr(settings, "max_questions_per_topic", 4)
+        monkeypatch.setattr(settings, "adaptive_min_topics", 2)
+
+    def _state(self, scores_by_skill, topics_completed=0):
+        state = {
+            "taxonomy": {},
+            "current_domain": "Systems",
+            "current_subdomain": "Caching",
+            "current_skill": "",
+            "questions_asked_current_topic": 0,
+            "total_questions_asked": 0,
+            "topics_completed": topics_completed,
+            "current_evaluation": {},
+            "overall_performance": [],
+            "context_summary": {},
+            "skill_estimates": {},
+            "current_question_difficulty": "Intermediate",
+        }
+        for skill, scores in scores_by_skill.items():
+            state["current_skill"] = skill
+            state["questions_asked_current_topic"] = 0
+            for score in scores:
+                state["questions_asked_current_topic"] += 1
+                evaluation = ResponseEvaluation(
+                    quality_score=score,
+                    demonstrates_knowledge=score > 0.5,
+                    areas_of_strength=[],
+                    areas_for_improvement=[],
+                    should_continue_topic=True,
+                    reasoning="",
+                )
+                update = nodes._apply_evaluation(state, evaluation, "Q", "A")
+                state["skill_estimates"] = update["skill_estimates"]
+        return state
+
+    def test_evaluation_updates_estimate(self):
+        """Test that each evaluation is added to the topic's estimate."""
+        state = self._state({"Eviction": [0.8, 0.7]})
+
+        (estimate,) = state["skill_estimates"].values()
+        assert len(estimate["responses"]) == 2
+        assert estimate["ability"] > 0
+
+    def test_uncertain_topic_continues(self):
+        """Test that a borderline answer asks another question."""
+        assert nodes.decide_next_step(self._state({"Eviction": [0.5]})) == (
+            "continue_topic"
+        )
+
+    def test_confident_topic_moves_on(self):
+        """Test that a clear verdict ends the topic before the question cap."""
+        state = self._state({"Eviction": [0.9, 0.9]})
+
+        assert nodes.decide_next_step(state) == "next_topic"
+
+    def test_question_cap_still_applies(self):
+        """Test that an uncertain topic still ends at the question cap."""
+        state = self._state({"Eviction": [0.5, 0.5, 0.5, 0.5]})
+
+        assert nodes.decide_next_step(state) == "next_topic"
+
+    def test_confident_interview_ends(self):
+        """Test that a clear overall verdict ends the interview early."""
+        state = self._state(
+            {"Eviction": [0.9, 0.9], "Sharding": [0.9, 0.9]}, topics_completed=1
+        )
+
+        assert nodes.decide_next_step(state) == "end_interview"
+
+    def test_rules_mode_ignores_estimates(self, monkeypatch):
+        """Test that the rule-based flow is unchanged by default."""
+        monkeypatch.setattr(settings, "next_step_mode", "rules")
+        state = self._state({"Eviction": [0.5]})
+
+        assert nodes.decide_next_step(state) == "continue_topic"
+        state["questions_asked_current_topic"] = 2
+        assert nodes.decide_next_step(state) == "next_topic"
+
+
+class TestAsyncNodes:
+    """Test that async nodes keep blocking work off the event loop."""
+
+    def test_taxonomy_and_bank_lookups_run_in_threads(self, monkeypatch):
+        """Test that topic selection and question bank lookups use worker threads."""
+        threads = []
+        selection = TopicSelection(
+            selected_topic="Systems",
+            selected_subdomain="Caching",
+            selected_skill="Eviction",
+            reasoning="test",
+        )
+        question = Question(
+            question="Why?", topic_focus="Eviction", difficulty_level="Beginner"
+        )
+
+        def local_selection(state):
+            threads.append(threading.current_thread())
+            return selection
+
+        def bank_question(state):
+            threads.append(threading.current_thread())
+            return question
+
+        monkeypatch.setattr(nodes, "_local_topic_selection", local_selection)
+        monkeypatch.setattr(nodes, "_bank_question", bank_question)
+
+        async def run():
+            await nodes._achoose_topic({})
+            await nodes._agenerate_question_for_state({})
+            return threading.current_thread()
+
+        loop_thread = asyncio.run(run())
+
+        assert len(threads) == 2
+        assert loop_thread not in threads
+
+
+class TestInterviewBudget:
+    """Test charging LLM calls to the interview's budget."""
+
+    @pytest.fixture
+    def budget(self, monkeypatch):
+        budget = InterviewBudget(
+            "gpt-4o", max_tokens=1000, model_tiers={"gpt-4o-mini": 0.5}
+        )
+        monkeypatch.setattr(nodes, "interview_budget", budget)
+        return budget
+
+    @pytest.fixture
+    def question_llm(self, monkeypatch):
+        def generate(messages, config):
+            ProviderChatModel(content="Why?", input_tokens=200).invoke(messages, config)
+            return Question(
+                question="Why?", topic_focus="Eviction", difficulty_level="Beginner"
+            )
+
+        monkeypatch.setattr(nodes, "_llms", {})
+        nodes.set_llm("question_generator", RunnableLambda(generate))
+
+    def _state(self, budget_usage):
+        return {
+            "taxonomy": {},
+            "messages": [],
+            "current_domain": "Systems",
+            "current_subdomain": "Caching",
+            "current_skill": "Eviction",
+            "topics_covered": [],
+            "questions_asked_current_topic": 1,
+            "total_questions_asked": 1,
+            "topics_completed": 0,
+            "current_evaluation": {},
+            "overall_performance": [],
+            "budget_usage": budget_usage,
+        }
+
+    def test_node_charges_usage(self, budget, question_llm):
+        """Test that a node's LLM calls are added to the state's usage."""
+        update = nodes.generate_question(self._state(budget.start()))
+
+        usage = update["budget_usage"]
+        assert usage["llm_calls"] == 1
+        assert usage["prompt_tokens"] + usage["completion_tokens"] == 300
+        assert usage["calls_by_model"] == {"gpt-4o": 1}
+
+    def test_downgrades_when_low(self, budget, question_llm):
+        """Test that calls move to the cheaper tier as the budget runs low."""
+        state = self._state(budget.start())
+        for _ in range(3):
+            state = apply_update(state, nodes.generate_question(state))
+
+        assert state["budget_usage"]["calls_by_model"] == {
+            "gpt-4o": 2,
+            "gpt-4o-mini": 1,
+        }
+
+    def test_ends_when_budget_runs_out(self, budget):
+        """Test that the interview ends when another question would overspend."""
+        usage = {**budget.start(), "prompt_tokens": 200, "completion_tokens": 100}
+
+        assert nodes.decide_next_step(self._state(usage)) == "continue_topic"
+        usage["prompt_tokens"] = 500
+        assert nodes.decide_next_step(self._state(usage)) == "end_interview"
+
+    def test_summary_reports_usage(self, budget):
+        """Test that the final summary shows what the interview used."""
+        usage = {**budget.start(), "llm_calls": 4, "prompt_tokens": 600}
+        state = {**self._state(usage), "topics_covered": [{}]}
+
+        summary = nodes.end_interview(state)["messages"][0].content
+
+        assert "LLM Calls: 4" in summary
+        assert "Tokens: 600" in summary
+        assert "Remaining tokens: 400" in summary
+
+    @pytest.fixture
+    def speculator(self, monkeypatch):
+        def select_topic(state, recorder):
+            selection = TopicSelection(
+                selected_topic="Systems",
+                selected_subdomain="Queues",
+                selected_skill="Backpressure",
+                reasoning="test",
+            )
+            return selection, 0
+
+        speculator = QuestionSpeculator(
+            select_topic=select_topic,
+            generate_question=nodes._generate_question_for_state,
+            advance_topic=nodes.move_to_next_topic,
+            recorder_for=nodes._recorder,
+        )
+        monkeypatch.setattr(settings, "enable_question_speculation", True)
+        monkeypatch.setattr(nodes, "question_speculator", speculator)
+        return speculator
+
+    def _prefetch(self, speculator, state):
+        speculator.prefetch("budget", state)
+        for future in speculator._pending["budget"].values():
+            future.result()
+
+    def test_speculation_is_charged(self, budget, question_llm, speculator):
+        """Test that taken and discarded speculated questions are both charged."""
+        state = self._state(budget.start())
+        self._prefetch(speculator, state)
+
+        update = nodes.generate_question(
+            state, {"configurable": {"thread_id": "budget"}}
+        )
+
+        assert speculator.stats()["hits"] == 1
+        assert update["budget_usage"]["llm_calls"] == 2
+        assert update["budget_usage"]["calls_by_model"] == {"gpt-4o": 2}
+
+    def test_end_charges_discarded_speculation(self, budget, question_llm, speculator):
+        """Test that speculation thrown away at the end is still charged."""
+        state = self._state(budget.start())
+        self._prefetch(speculator, state)
+
+        update = nodes.end_interview(state, {"configurable": {"thread_id": "budget"}})
+
+        assert update["budget_usage"]["llm_calls"] == 2
+        assert "LLM Calls: 2" in update["messages"][0].content
+        assert speculator.pop_usage("budget") == []
@@ -0,0 +1,206 @@
+"""Tests for bulk re-scoring of past answers."""
+
+import asyncio
+import json
+
+import pytest
+from langchain_core.runnables import RunnableLambda
+
+from src.llm_interviewer.models.pydantic_models import ResponseEvaluation
+from src.llm_interviewer.workflows import rescoring
+from src.llm_interviewer.workflows.rescoring import (
+    arescore_transcripts,
+    record_state,
+    rescore_transcripts,
+)
+
+
+class Crash(BaseException):
+    """Stand-in for the process dying mid-run"""
+
+
+def _evaluation(record):
+    return ResponseEvaluation(
+        quality_score=len(record["response"]) / 100,
+        demonstrates_knowledge=True,
+        areas_of_strength=[],
+        areas_for_improvement=[],
+        should_continue_topic=False,
+        reasoning=record["topic"],
+    )
+
+
+class Evaluator:
+    """Score records by response length, failing on request"""
+
+    def __init__(self, fail_first=0, always_fail=(), crash_on=None):
+        self.calls = []
+        self.fail_first = fail_first
+        self.always_fail = set(always_fail)
+        self.crash_on = crash_on
+
+    def __call__(self, record):
+        self.calls.append(record["id"])
+        if record["id"] == self.crash_on:
+            raise Crash()
+        if record["id"] in self.always_fail:
+            raise ValueError("unparseable output")
+        if self.calls.count(record["id"]) <= self.fail_first:
+            raise TimeoutError("rate limited")
+        return _evaluation(record)
+
+
+@pytest.fixture
+def input_path(tmp_path):
+    path = tmp_path / "answers.jsonl"
+    with open(path, "w") as f:
+        for i in range(10):
+            record = {
+                "id": i,
+                "question": f"Question {i}?",
+                "response": "x" * i,
+                "topic": "Domain - Subdomain - Skill",
+            }
+            f.write(json.dumps(record) + "\n")
+    return str(path)
+
+
+def _read(path):
+    with open(path) as f:
+        return [json.loads(line) for line in f]
+
+
+class TestRescoreTranscripts:
+    """Test batching, retries and resuming."""
+
+    def test_writes_results_in_order(self, input_path, tmp_path):
+        """Test that every record is written once, in order, with its evaluation."""
+        output = str(tmp_path / "scores.jsonl")
+
+        stats = rescore_transcripts(
+            input_path, output, RunnableLambda(Evaluator()), batch_size=3
+        )
+
+        rows = _read(output)
+        assert [row["id"] for row in rows] == list(range(10))
+        assert rows[4]["evaluation"]["quality_score"] == 0.04
+        assert rows[4]["error"] is None
+        assert stats == {"skipped": 0, "scored": 10, "failed": 0}
+
+    def test_retries_failures(self, input_path, tmp_path):
+        """Test that transient errors are retried up to max_attempts."""
+        output = str(tmp_path / "scores.jsonl")
+        evaluator = Evaluator(fail_first=1)
+
+        stats = rescore_transcripts(
+            input_path, output, RunnableLambda(evaluator), max_attempts=2
+        )
+
+        assert stats["scored"] == 10
+        assert len(evaluator.calls) == 20
+
+    def test_records_persistent_failures(self, input_path, tmp_path):
+        """Test that a record failing every attempt is written with its error."""
+        output = str(tmp_path / "scores.jsonl")
+
+        stats = rescore_transcripts(
+            input_path,
+            output,
+            RunnableLambda(Evaluator(always_fail=[3])),
+            max_attempts=2,
+        )
+
+        rows = _read(output)
+        assert stats["failed"] == 1
+        assert rows[3]["evaluation"] is None
+        assert "unparseable output" in rows[3]["error"]
+
+    def test_resumes_after_crash(self, input_path, tmp_path, monkeypatch):
+        """Test that a rerun skips committed batches and writes no duplicates."""
+        output = str(tmp_path / "scores.jsonl")
+        save_progress = rescoring._save_progress
+        saves = []
+
+        def crash_on_third_save(*args):
+            saves.append(args)
+            if len(saves) == 3:
+                raise Crash()
+            save_progress(*args)
+
+        monkeypatch.setattr(rescoring, "_save_progress", crash_on_third_save)
+        with pytest.raises(Crash):
+            rescore_transcripts(
+                input_path, output, RunnableLambda(Evaluator()), batch_size=3
+            )
+        monkeypatch.setattr(rescoring, "_save_progress", save_progress)
+        evaluator = Evaluator()
+
+        stats = rescore_transcripts(
+            input_path, output, RunnableLambda(evaluator), batch_size=3
+        )
+
+        assert sorted(evaluator.calls) == [6, 7, 8, 9]
+        assert stats["skipped"] == 6
+        assert [row["id"] for row in _read(output)] == list(range(10))
+
+    def test_interrupt_stops_run(self, input_path, tmp_path):
+        """Test that an interrupt inside a batch is raised, not recorded."""
+        output = str(tmp_path / "scores.jsonl")
+
+        with pytest.raises(Crash):
+            rescore_transcripts(
+                input_path,
+                output,
+                RunnableLambda(Evaluator(crash_on=4)),
+                batch_size=3,
+            )
+
+        assert [row["id"] for row in _read(output)] == [0, 1, 2]
+
+    def test_rejects_other_input(self, input_path, tmp_path):
+        """Test that an output is not resumed with a different input file."""
+        output = str(tmp_path / "scores.jsonl")
+        rescore_transcripts(input_path, output, RunnableLambda(Evaluator()))
+        other = tmp_path / "other.jsonl"
+        other.write_text("")
+
+        with pytest.raises(ValueError):
+            rescore_transcripts(str(other), output, RunnableLambda(Evaluator()))
+
+    def test_async(self, input_path, tmp_path):
+        """Test that the abatch path gives the same results."""
+        output = str(tmp_path / "scores.jsonl")
+
+        stats = asyncio.run(
+            arescore_transcripts(
+                input_path, output, RunnableLambda(Evaluator()), batch_size=4
+            )
+        )
+
+        assert stats["scored"] == 10
+        assert [row["id"] for row in _read(output)] == list(range(10))
+
+    def test_parquet(self, input_path, tmp_path):
+        """Test that a .parquet output is written as one part per batch."""
+        pq = pytest.importorskip("pyarrow.parquet")
+        output = str(tmp_path / "scores.parquet")
+
+        rescore_transcripts(
+            input_path, output, RunnableLambda(Evaluator()), batch_size=4
+        )
+
+        table = pq.read_table(output)
+        assert table.num_rows == 10
+
+
+class TestRecordState:
+    """Test prompt context built from records."""
+
+    def test_splits_topic(self):
+        """Test that the topic label is split into the prompt's fields."""
+        state = record_state({"topic": "LLM Development - Prompting - Few-shot"})
+
+        assert state["current_domain"] == "LLM Development"
+        assert state["current_subdomain"] == "Prompting"
+        assert state["current_skill"] == "Few-shot"
+        assert state["questions_asked_current_topic"] == 1
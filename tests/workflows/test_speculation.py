@@ -0,0 +1,209 @@
+"""Tests for speculative question generation."""
+
+import threading
+
+import pytest
+
+from src.llm_interviewer.models.pydantic_models import Question, TopicSelection
+from src.llm_interviewer.utils.interview_budget import UsageRecorder
+from src.llm_interviewer.workflows.speculation import (
+    CONTINUE_TOPIC,
+    NEXT_TOPIC,
+    QuestionSpeculator,
+)
+
+
+def _advance(state):
+    return {"current_domain": "", "current_subdomain": "", "current_skill": ""}
+
+
+def _select(state):
+    return (
+        TopicSelection(
+            selected_topic="Next",
+            selected_subdomain="Next Sub",
+            selected_skill="Next Skill",
+            reasoning="test",
+        ),
+        10,
+    )
+
+
+def _generate(state):
+    question = Question(
+        question=f"Question about {state['current_skill']}?",
+        topic_focus="focus",
+        difficulty_level="Intermediate",
+    )
+    return question, 5
+
+
+@pytest.fixture
+def speculator():
+    """Speculator backed by deterministic stand-ins for the LLM steps."""
+    return QuestionSpeculator(
+        select_topic=_select, generate_question=_generate, advance_topic=_advance
+    )
+
+
+@pytest.fixture
+def state():
+    """State paused waiting for the candidate's answer."""
+    return {
+        "current_domain": "Domain",
+        "current_subdomain": "Sub",
+        "current_skill": "Skill",
+    }
+
+
+class TestQuestionSpeculator:
+    """Test committing and discarding speculated questions."""
+
+    def test_continue_topic_hit(self, speculator, state):
+        """Test that the continue branch is committed when the topic matches."""
+        speculator.prefetch("t1", state)
+
+        question = speculator.take("t1", CONTINUE_TOPIC, ("Domain", "Sub", "Skill"))
+
+        assert question.question == "Question about Skill?"
+        stats = speculator.stats()
+        assert stats["hits"] == 1
+        assert stats["hit_rate"] == 1.0
+        assert stats["used_tokens"] == 5
+
+    def test_next_topic_hit_with_topic_selection(self, speculator, state):
+        """Test that the next branch exposes its topic and question."""
+        speculator.prefetch("t1", state)
+
+        selection = speculator.peek_topic("t1")
+        question = speculator.take("t1", NEXT_TOPIC, ("Next", "Next Sub", "Next Skill"))
+
+        assert selection.selected_skill == "Next Skill"
+        assert question.question == "Question about Next Skill?"
+        assert speculator.stats()["used_tokens"] == 15
+
+    def test_topic_mismatch_is_a_miss(self, speculator, state):
+        """Test that a question for the wrong topic is thrown away."""
+        speculator.prefetch("t1", state)
+
+        question = speculator.take("t1", CONTINUE_TOPIC, ("Other", "Sub", "Skill"))
+
+        assert question is None
+        stats = speculator.stats()
+        assert stats["misses"] == 1
+        assert stats["hit_rate"] == 0.0
+        assert stats["wasted_tokens"] >= 5
+
+    def test_take_consumes_all_branches(self, speculator, state):
+        """Test that only one branch can ever be committed per turn."""
+        speculator.prefetch("t1", state)
+        speculator.take("t1", CONTINUE_TOPIC, ("Domain", "Sub", "Skill"))
+
+        assert (
+            speculator.take("t1", NEXT_TOPIC, ("Next", "Next Sub", "Next Skill"))
+            is None
+        )
+        assert speculator.peek_topic("t1") is None
+
+    def test_no_speculation_is_not_counted(self, speculator):
+        """Test that threads without speculation do not affect the hit rate."""
+        assert speculator.take("unknown", CONTINUE_TOPIC, ("a", "b", "c")) is None
+        assert speculator.stats()["misses"] == 0
+
+    def test_failed_speculation_falls_back(self, state):
+        """Test that generation errors surface as a miss rather than raising."""
+
+        def failing(state):
+            raise RuntimeError("LLM unavailable")
+
+        speculator = QuestionSpeculator(
+            select_topic=_select, generate_question=failing, advance_topic=_advance
+        )
+        speculator.prefetch("t1", state)
+
+        assert speculator.take("t1", CONTINUE_TOPIC, ("Domain", "Sub", "Skill")) is None
+        assert speculator.stats()["misses"] == 1
+
+    def test_peek_topic_does_not_wait_for_question(self, state):
+        """Test that the topic is available while its question is generated."""
+        release = threading.Event()
+
+        def slow_generate(state):
+            release.wait(5)
+            return _generate(state)
+
+        speculator = QuestionSpeculator(
+            select_topic=_select,
+            generate_question=slow_generate,
+            advance_topic=_advance,
+        )
+        speculator.prefetch("t1", state)
+
+        selection = speculator.peek_topic("t1")
+        generating = not speculator._pending["t1"][NEXT_TOPIC].done()
+        release.set()
+
+        assert selection.selected_skill == "Next Skill"
+        assert generating
+        assert speculator.take("t1", NEXT_TOPIC, ("Next", "Next Sub", "Next Skill"))
+
+    def test_changed_inputs_are_a_miss(self, state):
+        """Test that a question is dropped if the answer changed what it depends on."""
+        speculator = QuestionSpeculator(
+            select_topic=_select,
+            generate_question=_generate,
+            advance_topic=_advance,
+            question_inputs=lambda state: state["difficulty"],
+        )
+        topic = ("Domain", "Sub", "Skill")
+
+        speculator.prefetch("t1", {**state, "difficulty": "Intermediate"})
+        kept = speculator.take(
+            "t1", CONTINUE_TOPIC, topic, {**state, "difficulty": "Intermediate"}
+        )
+        speculator.prefetch("t1", {**state, "difficulty": "Intermediate"})
+        dropped = speculator.take(
+            "t1", CONTINUE_TOPIC, topic, {**state, "difficulty": "Advanced"}
+        )
+
+        assert kept is not None
+        assert dropped is None
+        assert speculator.stats()["misses"] == 1
+
+    def test_finished_thread_is_dropped(self, speculator, state):
+        """Test that discarding a finished thread leaves nothing behind."""
+        speculator.prefetch("t1", state)
+
+        speculator.discard("t1", charge=False)
+        speculator.pop_usage("t1")
+
+        assert "t1" not in speculator._pending
+        assert "t1" not in speculator._topics
+        assert "t1" not in speculator._touched
+
+    def test_abandoned_threads_expire(self, state):
+        """Test that threads not resumed within the ttl are dropped with their usage."""
+
+        def generate(state, recorder):
+            recorder.calls += 1
+            return _generate(state)
+
+        speculator = QuestionSpeculator(
+            select_topic=lambda state, recorder: _select(state),
+            generate_question=generate,
+            advance_topic=_advance,
+            recorder_for=lambda state: UsageRecorder("gpt-4o"),
+            ttl=0,
+        )
+        speculator.expiry_interval = 0
+        speculator.prefetch("abandoned", state)
+        for future in speculator._pending["abandoned"].values():
+            future.result()
+        # The candidate answered, but the graph never resumed to collect the usage
+        speculator.discard("abandoned")
+
+        speculator.prefetch("active", state)
+
+        assert "abandoned" not in speculator._touched
+        assert speculator.pop_usage("abandoned") == []
+        assert "active" in speculator._pending
@@ -0,0 +1,108 @@
+"""Tests for translating graph stream parts into UI events."""
+
+from langchain_core.messages import AIMessage, AIMessageChunk
+
+from src.llm_interviewer.workflows.streaming import (
+    QUESTION_GENERATION_TAG,
+    InterviewStreamTranslator,
+)
+
+QUESTION_METADATA = {"tags": [QUESTION_GENERATION_TAG, "interview_flow"]}
+
+
+def _tokens(events):
+    return "".join(event["text"] for event in events if event["type"] == "token")
+
+
+class TestInterviewStreamTranslator:
+    """Test progress and token events."""
+
+    def test_streams_question_text_from_partial_json(self):
+        """Test that question tokens are decoded from partial structured output."""
+        translator = InterviewStreamTranslator()
+        events = []
+        for piece in [
+            '{"quest',
+            'ion": "What is ',
+            "attention",
+            '?", "topic_focus": "x"}',
+        ]:
+            events += translator.feed(
+                "messages", (AIMessageChunk(content=piece), QUESTION_METADATA)
+            )
+
+        assert _tokens(events) == "What is attention?"
+
+    def test_streams_tool_call_arguments(self):
+        """Test that function-calling chunks are decoded too."""
+        translator = InterviewStreamTranslator()
+        chunk = AIMessageChunk(
+            content="",
+            tool_call_chunks=[
+                {"name": "Question", "args": '{"question": "Why?"', "index": 0}
+            ],
+        )
+
+        events = translator.feed("messages", (chunk, QUESTION_METADATA))
+
+        assert _tokens(events) == "Why?"
+
+    def test_ignores_other_llms(self):
+        """Test that evaluator and topic selector tokens are not shown."""
+        translator = InterviewStreamTranslator()
+        chunk = AIMessageChunk(content='{"question": "hidden"}')
+
+        events = translator.feed("messages", (chunk, {"tags": ["evaluation"]}))
+
+        assert events == []
+
+    def test_progress_events(self):
+        """Test that finished nodes produce progress events with their data."""
+        translator = InterviewStreamTranslator()
+
+        events = translator.feed(
+            "updates",
+            {
+                "analyze_response": {
+                    "current_evaluation": {
+                        "quality_score": 0.8,
+                        "should_continue_topic": False,
+                    }
+                }
+            },
+        )
+
+        assert events == [
+            {
+                "type": "progress",
+                "node": "analyze_response",
+                "message": "Evaluation complete",
+                "data": {"quality_score": 0.8, "should_continue_topic": False},
+            }
+        ]
+
+    def test_unstreamed_question_is_sent_when_node_finishes(self):
+        """Test that a question produced without streaming still reaches the UI."""
+        translator = InterviewStreamTranslator()
+        translator.feed(
+            "messages",
+            (AIMessageChunk(content='{"question": "What is'), QUESTION_METADATA),
+        )
+
+        events = translator.feed(
+            "updates",
+            {
+                "generate_question": {
+                    "messages": [AIMessage(content="What is a transformer?")]
+                }
+            },
+        )
+
+        assert events[0]["type"] == "progress"
+        assert _tokens(events) == " a transformer?"
+
+    def test_internal_nodes_are_skipped(self):
+        """Test that interrupts and unknown nodes produce no events."""
+        translator = InterviewStreamTranslator()
+
+        assert translator.feed("updates", {"__interrupt__": ()}) == []